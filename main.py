@@ -7,16 +7,53 @@ import argparse
 import uvicorn
 from fastapi import FastAPI
 
+from src.application.admission import AdmissionConfig, admissions
+from src.application.measurementjob import measurement_jobs
+from src.application.singleflight import single_flight
 from src.config import container
 from src.converter import requestconverter, responseconverter
+from src.entity.cache import environment_caches
+from src.entity.moveid import move_id_environments
+from src.infra.batchclient import ChunkingConfig, CoalescingConfig, chunker, coalescer
+from src.infra.hostlimit import PriorityConfig, host_limiter
+from src.infra.postclient import ClientLimits, client_pool
+from src.infra.replica import EjectionConfig, replicas
+from src.infra.resilience import ResilienceConfig, resilience
+from src.infra.wireformat import wire_negotiation
+from src.presentation.api.cacheapi import router as cache_router
+from src.presentation.api.jobapi import router as job_router
 from src.presentation.api.playerapi import router
+from src.presentation.api.streamapi import router as stream_router
 
 app: FastAPI = FastAPI()
 
 app.include_router(router)
+app.include_router(cache_router)
+app.include_router(job_router)
+app.include_router(stream_router)
 
 
-def wire(url_env: str) -> None:
+def wire(
+    url_env: str,
+    limits: ClientLimits = ClientLimits(),
+    coalescing: CoalescingConfig = CoalescingConfig(),
+    cache_size: int = 0,
+    measurement_window: int = 0,
+    max_jobs: int = 1,
+    wire_format: str = "json",
+    env_move_ids: bool = False,
+    chunking: ChunkingConfig = ChunkingConfig(),
+    resilience_config: ResilienceConfig = ResilienceConfig(),
+    env_replicas: list[str] = [],
+    ai_replicas: list[list[str]] = [],
+    ejection: EjectionConfig = EjectionConfig(),
+    max_inflight_per_host: int = 0,
+    admission: AdmissionConfig = AdmissionConfig(),
+    priority: PriorityConfig = PriorityConfig(),
+    single_flight_enabled: bool = False,
+    max_queued_jobs: int = 16,
+    job_retention: float = 600.0,
+) -> None:
     app.state.container = container
     app.state.container.config.from_dict(
         {
@@ -24,8 +61,29 @@ def wire(url_env: str) -> None:
             "routes": {route.name: route.path for route in router.routes},
             "name": "",
             "method": "",
+            "limits": limits._asdict(),
+            "coalescing": coalescing._asdict(),
+            "cache_size": cache_size,
+            "measurement_window": measurement_window,
+            "max_jobs": max_jobs,
+            "max_queued_jobs": max_queued_jobs,
+            "job_retention": job_retention,
+            "wire_format": wire_format,
+            "env_move_ids": env_move_ids,
+            "chunking": chunking._asdict(),
+            "resilience": resilience_config._asdict(),
+            "env_replicas": env_replicas,
+            "ai_replicas": ai_replicas,
+            "ejection": ejection._asdict(),
+            "max_inflight_per_host": max_inflight_per_host,
+            "admission": admission._asdict(),
+            "priority": priority._asdict(),
+            "single_flight": single_flight_enabled,
         }
     )
+    app.state.container.internal_model.reset()
+    app.state.container.hal_links.reset()
+    app.state.container.hal_links()
     app.state.container.wire(modules=[requestconverter, responseconverter])
 
 
@@ -33,6 +91,40 @@ def unwire() -> None:
     app.state.container.unwire()
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    client_pool.open(ClientLimits(**(container.config.limits() or {})))
+    coalescer.configure(CoalescingConfig(**(container.config.coalescing() or {})))
+    chunker.configure(ChunkingConfig(**(container.config.chunking() or {})))
+    resilience.configure(ResilienceConfig(**(container.config.resilience() or {})))
+    replicas.configure(EjectionConfig(**(container.config.ejection() or {})))
+    host_limiter.configure(
+        container.config.max_inflight_per_host() or 0, PriorityConfig(**(container.config.priority() or {}))
+    )
+    single_flight.configure(bool(container.config.single_flight()))
+    admissions.configure(AdmissionConfig(**(container.config.admission() or {})))
+    if len(container.config.env_replicas() or []) > 0:
+        replicas.registered(container.config.url_env(), [container.config.url_env()] + container.config.env_replicas())
+    for urls in container.config.ai_replicas() or []:
+        replicas.registered(urls[0], urls)
+    if (container.config.cache_size() or 0) > 0:
+        environment_caches.enabled(container.config.url_env(), container.config.cache_size())
+    measurement_jobs.configure(
+        container.config.max_jobs() or 1,
+        container.config.max_queued_jobs() or 16,
+        container.config.job_retention() or 600.0,
+    )
+    wire_negotiation.configure(container.config.wire_format() or "json")
+    if container.config.env_move_ids():
+        move_id_environments.add(container.config.url_env())
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    measurement_jobs.cancelled_all()
+    await client_pool.close()
+
+
 def run(port: int) -> None:
     uvicorn.run("main:app", host="0.0.0.0", port=port)
 
@@ -40,8 +132,207 @@ def run(port: int) -> None:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="MicroChess Player")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind socket of Player")
-    parser.add_argument("--url_env", type=str, help="URL of MicroChess Environment API server")
+    parser.add_argument(
+        "--url_env",
+        type=str,
+        nargs="+",
+        help="URLs of MicroChess Environment API server replicas, or 'local' to use the built-in rules",
+    )
+    parser.add_argument(
+        "--max_connections", type=int, default=100, help="Maximum connections per upstream host (default: 100)"
+    )
+    parser.add_argument(
+        "--max_keepalive_connections",
+        type=int,
+        default=20,
+        help="Maximum idle keep-alive connections per upstream host (default: 20)",
+    )
+    parser.add_argument(
+        "--keepalive_expiry", type=float, default=5.0, help="Seconds to keep idle connections alive (default: 5.0)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=1.0, help="Seconds to wait for each env/AI call (default: 1.0)"
+    )
+
+    parser.add_argument(
+        "--coalesce_window",
+        type=float,
+        default=0.0,
+        help="Seconds to gather concurrent env/AI calls to the same URL into one batch (default: 0.0, disabled)",
+    )
+    parser.add_argument(
+        "--coalesce_max_batch",
+        type=int,
+        default=0,
+        help="Number of FENs that sends a gathered batch before the window ends (default: 0, unbounded)",
+    )
+    parser.add_argument(
+        "--cache_size",
+        type=int,
+        default=0,
+        help="Entries of fen-status and next-fen results to cache for a deterministic env (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "--measurement_window",
+        type=int,
+        default=0,
+        help="Maximum games played at once by a measurement without its own window (default: 0, all games)",
+    )
+    parser.add_argument(
+        "--max_jobs",
+        type=int,
+        default=1,
+        help="Maximum background measurement jobs running at once; others wait in queue (default: 1)",
+    )
+    parser.add_argument(
+        "--max_queued_jobs",
+        type=int,
+        default=16,
+        help="Maximum background measurement jobs waiting in queue; more are refused with 503 (default: 16)",
+    )
+    parser.add_argument(
+        "--job_retention",
+        type=float,
+        default=600.0,
+        help="Seconds a finished, failed or cancelled job stays available for polling (default: 600.0)",
+    )
+    parser.add_argument(
+        "--wire_format",
+        type=str,
+        choices=["json", "msgpack"],
+        default="json",
+        help="Preferred encoding of env/AI calls; msgpack is used only with upstreams that answer in it (default: json)",
+    )
+
+    parser.add_argument(
+        "--env_move_ids",
+        action="store_true",
+        help="Exchange legal moves with the env as ids of the global move table instead of strings",
+    )
+
+    parser.add_argument(
+        "--max_chunk",
+        type=int,
+        default=0,
+        help="Maximum FENs in one env/AI call; larger batches are split into chunks (default: 0, unbounded)",
+    )
+    parser.add_argument(
+        "--chunk_concurrency",
+        type=int,
+        default=4,
+        help="Maximum chunks of one split batch sent at once (default: 4)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=0,
+        help="Retries of an env/AI call failed by a transport error, 429 or 5xx (default: 0)",
+    )
+    parser.add_argument(
+        "--retry_backoff",
+        type=float,
+        default=0.05,
+        help="Base seconds of the jittered exponential backoff between retries (default: 0.05)",
+    )
+    parser.add_argument(
+        "--hedge_quantile",
+        type=float,
+        default=0.0,
+        help="Latency quantile of a URL after which a duplicate call is sent, e.g. 0.95 (default: 0.0, disabled)",
+    )
+    parser.add_argument(
+        "--request_deadline",
+        type=float,
+        default=0.0,
+        help="Seconds a player request may take, split evenly across its remaining steps (default: 0.0, unbounded)",
+    )
+    parser.add_argument(
+        "--ai_replicas",
+        type=str,
+        nargs="+",
+        action="append",
+        default=[],
+        help="URLs of servers running the same AI; requests name the first, and calls are balanced across all",
+    )
+    parser.add_argument(
+        "--eject_failures",
+        type=int,
+        default=3,
+        help="Consecutive failures after which a replica is taken out of balancing (default: 3)",
+    )
+    parser.add_argument(
+        "--eject_seconds",
+        type=float,
+        default=5.0,
+        help="Seconds an ejected replica is left out of balancing (default: 5.0)",
+    )
+    parser.add_argument(
+        "--max_inflight_per_host",
+        type=int,
+        default=0,
+        help="Maximum env/AI calls in flight to one upstream host; others wait their turn (default: 0, unbounded)",
+    )
+    parser.add_argument(
+        "--admission_concurrency",
+        type=int,
+        default=0,
+        help="Maximum requests running at once on each /player endpoint (default: 0, unbounded)",
+    )
+    parser.add_argument(
+        "--admission_queue",
+        type=int,
+        default=0,
+        help="Requests waiting on each /player endpoint before it answers 503 with Retry-After (default: 0)",
+    )
+    parser.add_argument(
+        "--interactive_weight",
+        type=int,
+        default=3,
+        help="Share of waiting upstream calls given to interactive requests against bulk ones (default: 3)",
+    )
+    parser.add_argument(
+        "--bulk_weight",
+        type=int,
+        default=1,
+        help="Share of waiting upstream calls given to bulk requests against interactive ones (default: 1)",
+    )
+    parser.add_argument(
+        "--bulk_share",
+        type=float,
+        default=0.5,
+        help="Fraction of a host's in-flight calls bulk requests may hold while interactive ones wait (default: 0.5)",
+    )
+    parser.add_argument(
+        "--single_flight",
+        action="store_true",
+        help="Share one computation among identical concurrent /player requests whose AIs are both deterministic",
+    )
 
     args = parser.parse_args()
-    wire(args.url_env)
+    wire(
+        url_env=args.url_env[0],
+        limits=ClientLimits(args.max_connections, args.max_keepalive_connections, args.keepalive_expiry, args.timeout),
+        coalescing=CoalescingConfig(args.coalesce_window, args.coalesce_max_batch),
+        cache_size=args.cache_size,
+        measurement_window=args.measurement_window,
+        max_jobs=args.max_jobs,
+        wire_format=args.wire_format,
+        env_move_ids=args.env_move_ids,
+        chunking=ChunkingConfig(args.max_chunk, args.chunk_concurrency),
+        resilience_config=ResilienceConfig(
+            retries=args.retries,
+            backoff=args.retry_backoff,
+            hedge_quantile=args.hedge_quantile,
+            request_deadline=args.request_deadline,
+        ),
+        env_replicas=args.url_env[1:],
+        ai_replicas=args.ai_replicas,
+        ejection=EjectionConfig(args.eject_failures, args.eject_seconds),
+        max_inflight_per_host=args.max_inflight_per_host,
+        admission=AdmissionConfig(args.admission_concurrency, args.admission_queue),
+        priority=PriorityConfig(args.interactive_weight, args.bulk_weight, args.bulk_share),
+        single_flight_enabled=args.single_flight,
+        max_queued_jobs=args.max_queued_jobs,
+        job_retention=args.job_retention,
+    )
     run(args.port)
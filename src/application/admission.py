@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import Semaphore, get_running_loop
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from math import ceil
+from typing import AsyncIterator, Awaitable, Callable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AdmissionConfig(NamedTuple):
+    concurrency: int = 0
+    queue: int = 0
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Admission queue is full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class Admission:
+    config: AdmissionConfig = AdmissionConfig()
+    semaphore: Semaphore = field(default_factory=Semaphore)
+    admitted_count: int = 0
+    mean_duration: float = 1.0
+
+    def is_bounded(self) -> bool:
+        return self.config.concurrency > 0
+
+    def is_full(self) -> bool:
+        return self.admitted_count >= self.config.concurrency + self.config.queue
+
+    def retry_after(self) -> int:
+        return max(1, ceil(self.mean_duration * self.admitted_count / self.config.concurrency))
+
+    def finished(self, duration: float) -> None:
+        self.mean_duration = self.mean_duration * 0.9 + duration * 0.1
+
+    def entered(self) -> None:
+        if not self.is_bounded():
+            return
+        if self.is_full():
+            raise AdmissionRejected(self.retry_after())
+
+        self.admitted_count += 1
+
+    def left(self) -> None:
+        if self.is_bounded():
+            self.admitted_count -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        self.entered()
+        try:
+            if not self.is_bounded():
+                yield
+                return
+
+            async with self.semaphore:
+                started: float = get_running_loop().time()
+                try:
+                    yield
+                finally:
+                    self.finished(get_running_loop().time() - started)
+        finally:
+            self.left()
+
+    async def admitted(self, call: Callable[[], Awaitable[T]]) -> T:
+        async with self.slot():
+            return await call()
+
+
+@dataclass
+class Admissions:
+    config: AdmissionConfig = AdmissionConfig()
+    endpoints: dict[str, Admission] = field(default_factory=dict)
+
+    def configure(self, config: AdmissionConfig) -> None:
+        self.config, self.endpoints = config, {}
+
+    def admission(self, name: str) -> Admission:
+        if name not in self.endpoints:
+            self.endpoints[name] = Admission(self.config, Semaphore(max(self.config.concurrency, 1)))
+
+        return self.endpoints[name]
+
+
+admissions: Admissions = Admissions()
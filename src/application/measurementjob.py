@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Semaphore, Task, get_running_loop
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Optional
+from uuid import uuid4
+
+from src.converter.requestconverter import MeasurementRequestToModel
+from src.converter.responseconverter import MeasurementInfoToDTO
+from src.entity.trace import ScoreCollector
+from src.framework.dto.playerdto import PlayerMeasurementJobResponse, PlayerMeasurementRequest
+from src.infra.hostlimit import Priority, request_priority
+from src.model.responsemodel import ErrorResponseModel, MeasurementResponsableModel
+from src.usecase.measurement import Measurement, Statistics
+
+
+@dataclass
+class MeasurementJob:
+    id: str
+    playtime: int
+    scores: ScoreCollector = field(default_factory=ScoreCollector)
+    state: str = "queued"
+    message: Optional[str] = None
+    started: Optional[float] = None
+    stopped: Optional[float] = None
+    ended: Optional[float] = None
+    task: Optional[Task] = None
+
+    def finished(self) -> int:
+        return sum(self.scores.values())
+
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+
+        return (monotonic() if self.stopped is None else self.stopped) - self.started
+
+    def throughput(self) -> float:
+        return self.finished() / self.elapsed() if self.elapsed() > 0 else 0.0
+
+    def stopped_with(self, state: str, message: Optional[str] = None) -> None:
+        self.state, self.message = state, message
+        self.ended = monotonic()
+        self.stopped = self.ended if self.started is not None else None
+
+    def is_expired(self, retention: float) -> bool:
+        return self.ended is not None and monotonic() - self.ended > retention
+
+    def to_response(self) -> PlayerMeasurementJobResponse:
+        statistics: Statistics = Statistics.from_scores(self.scores)
+
+        return PlayerMeasurementJobResponse(
+            id=self.id,
+            state=self.state,
+            playtime=self.playtime,
+            finished=self.finished(),
+            white=MeasurementInfoToDTO.from_model(statistics.white()).convert(),
+            black=MeasurementInfoToDTO.from_model(statistics.black()).convert(),
+            throughput=self.throughput(),
+            message=self.message,
+        )
+
+
+class MeasurementJobQueueFull(Exception):
+    pass
+
+
+@dataclass
+class MeasurementJobs:
+    limit: int = 1
+    max_queued: int = 16
+    retention: float = 600.0
+    jobs: dict[str, MeasurementJob] = field(default_factory=dict)
+    semaphore: Optional[Semaphore] = None
+
+    def configure(self, limit: int, max_queued: int = 16, retention: float = 600.0) -> None:
+        self.limit, self.max_queued, self.retention, self.semaphore = limit, max_queued, retention, None
+
+    def expired(self) -> None:
+        for id in [id for id, job in self.jobs.items() if job.is_expired(self.retention)]:
+            del self.jobs[id]
+
+    def queued(self) -> int:
+        return sum(1 for job in self.jobs.values() if job.state == "queued")
+
+    def slots(self) -> Semaphore:
+        if self.semaphore is None:
+            self.semaphore = Semaphore(self.limit)
+
+        return self.semaphore
+
+    def submitted(self, request: PlayerMeasurementRequest) -> MeasurementJob:
+        self.expired()
+        if self.queued() >= self.max_queued:
+            raise MeasurementJobQueueFull(f"{self.queued()} measurement jobs are already queued")
+
+        job: MeasurementJob = MeasurementJob(uuid4().hex, request.playtime)
+        job.task = get_running_loop().create_task(self.run(job, request))
+        self.jobs[job.id] = job
+
+        return job
+
+    async def run(self, job: MeasurementJob, request: PlayerMeasurementRequest) -> None:
+        request_priority.set(Priority.BULK)
+
+        try:
+            async with self.slots():
+                job.state, job.started = "running", monotonic()
+                response: MeasurementResponsableModel = await Measurement({}).measured(
+                    MeasurementRequestToModel.from_dto(request).convert(), job.scores
+                )
+        except CancelledError:
+            job.stopped_with("cancelled")
+            raise
+        except Exception as ex:
+            job.stopped_with("failed", repr(ex))
+            return
+
+        if isinstance(response, ErrorResponseModel):
+            job.stopped_with("failed", response.message)
+        else:
+            job.stopped_with("done")
+
+    def looked_up(self, id: str) -> Optional[MeasurementJob]:
+        self.expired()
+
+        return self.jobs.get(id)
+
+    def cancelled(self, id: str) -> Optional[MeasurementJob]:
+        job: Optional[MeasurementJob] = self.jobs.pop(id, None)
+
+        if job is not None and job.task is not None and not job.task.done():
+            job.task.cancel()
+            job.stopped_with("cancelled")
+
+        return job
+
+    def cancelled_all(self) -> None:
+        for id in list(self.jobs):
+            self.cancelled(id)
+
+
+measurement_jobs: MeasurementJobs = MeasurementJobs()
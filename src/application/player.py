@@ -4,30 +4,41 @@
 
 from __future__ import annotations
 
-from typing import NamedTuple
+from contextvars import Token
+from typing import AsyncIterator, Callable, NamedTuple
 
-from dependency_injector import providers
-from src.config import container
+from fastapi import Response
+
+from src.application.singleflight import single_flight
+from src.config import requested_api_info
 from src.framework.dto.playerdto import (
     PlayerAPIInfo,
     PlayerGameRequest,
     PlayerGameResponse,
+    PlayerGameStreamRequest,
     PlayerHTTPStatusErrorResponse,
     PlayerMeasurementRequest,
     PlayerMeasurementResponse,
     PlayerRequestErrorResponse,
+    PlayerStreamResponse,
     PlayerTrajectoryRequest,
     PlayerTrajectoryResponse,
 )
 from src.framework.intent.gameintent import GameIntent
+from src.framework.intent.gamestreamintent import GameStreamIntent
 from src.framework.intent.measurementintent import MeasurementIntent
 from src.framework.intent.trajectoryintent import TrajectoryIntent
-from src.usecase.game import Game, GameUsecase
+from src.framework.intent.trajectorystreamintent import TrajectoryStreamIntent
+from src.usecase.game import Game, GameStream, GameStreamUsecase, GameUsecase
 from src.usecase.measurement import Measurement, MeasurementUsecase
-from src.usecase.trajectory import Trajectory, TrajectoryUsecase
+from src.usecase.trajectory import Trajectory, TrajectoryStream, TrajectoryStreamUsecase, TrajectoryUsecase
 from submodules.fastapi_haljson.src.halconverter import ResponseToJSONBody
 from submodules.fastapi_haljson.src.halresponse import HALJSONResponse
 
+TRAJECTORY_API_INFO: PlayerAPIInfo = PlayerAPIInfo(name="trajectory", method="post")
+GAME_API_INFO: PlayerAPIInfo = PlayerAPIInfo(name="game", method="post")
+MEASUREMENT_API_INFO: PlayerAPIInfo = PlayerAPIInfo(name="measurement", method="post")
+
 
 class TrajectoryPlayer(NamedTuple):
     intent: TrajectoryIntent
@@ -65,8 +76,37 @@ class MeasurementPlayer(NamedTuple):
         return MeasurementPlayer(intent, usecase)
 
 
+class TrajectoryStreamPlayer(NamedTuple):
+    intent: TrajectoryStreamIntent
+    usecase: TrajectoryStreamUsecase
+
+    @classmethod
+    def from_usecase(cls, usecase: TrajectoryStreamUsecase) -> TrajectoryStreamPlayer:
+        intent = TrajectoryStreamIntent(usecase)
+        usecase.boundaries["framework"] = intent
+
+        return TrajectoryStreamPlayer(intent, usecase)
+
+
+class GameStreamPlayer(NamedTuple):
+    intent: GameStreamIntent
+    usecase: GameStreamUsecase
+
+    @classmethod
+    def from_usecase(cls, usecase: GameStreamUsecase) -> GameStreamPlayer:
+        intent = GameStreamIntent(usecase)
+        usecase.boundaries["framework"] = intent
+
+        return GameStreamPlayer(intent, usecase)
+
+
 class Player(NamedTuple):
     response_converter: ResponseToJSONBody
+    trajectory_player: TrajectoryPlayer
+    game_player: GamePlayer
+    measurement_player: MeasurementPlayer
+    trajectory_stream_player: TrajectoryStreamPlayer
+    game_stream_player: GameStreamPlayer
 
     @classmethod
     def from_type_map(
@@ -84,24 +124,67 @@ class Player(NamedTuple):
                 to_ok=ok_responsable,
                 to_not_found=not_found_responsable,
                 to_unprocessable_entity=unprocessable_entity_responsable,
-            )
+            ),
+            TrajectoryPlayer.from_usecase(Trajectory({})),
+            GamePlayer.from_usecase(Game({})),
+            MeasurementPlayer.from_usecase(Measurement({})),
+            TrajectoryStreamPlayer.from_usecase(TrajectoryStream({})),
+            GameStreamPlayer.from_usecase(GameStream({})),
         )
 
     async def trajectory(self, request: PlayerTrajectoryRequest) -> HALJSONResponse:
-        container.api_info.override(providers.Factory(PlayerAPIInfo, name="trajectory", method="post"))
-
-        return self.response_converter.convert(
-            await TrajectoryPlayer.from_usecase(Trajectory({})).intent.dispatch(request)
-        )
+        token: Token = requested_api_info.set(TRAJECTORY_API_INFO)
+        try:
+            return self.response_converter.convert(
+                await single_flight.dispatched(
+                    "trajectory", request, lambda: self.trajectory_player.intent.dispatch(request)
+                )
+            )
+        finally:
+            requested_api_info.reset(token)
 
     async def game(self, request: PlayerGameRequest) -> HALJSONResponse:
-        container.api_info.override(providers.Factory(PlayerAPIInfo, name="game", method="post"))
-
-        return self.response_converter.convert(await GamePlayer.from_usecase(Game({})).intent.dispatch(request))
+        token: Token = requested_api_info.set(GAME_API_INFO)
+        try:
+            return self.response_converter.convert(
+                await single_flight.dispatched("game", request, lambda: self.game_player.intent.dispatch(request))
+            )
+        finally:
+            requested_api_info.reset(token)
 
     async def measurement(self, request: PlayerMeasurementRequest) -> HALJSONResponse:
-        container.api_info.override(providers.Factory(PlayerAPIInfo, name="measurement", method="post"))
-
-        return self.response_converter.convert(
-            await MeasurementPlayer.from_usecase(Measurement({})).intent.dispatch(request)
-        )
+        token: Token = requested_api_info.set(MEASUREMENT_API_INFO)
+        try:
+            return self.response_converter.convert(
+                await single_flight.dispatched(
+                    "measurement", request, lambda: self.measurement_player.intent.dispatch(request)
+                )
+            )
+        finally:
+            requested_api_info.reset(token)
+
+    async def trajectory_stream(
+        self, request: PlayerTrajectoryRequest, to_response: Callable[[AsyncIterator], Response]
+    ) -> Response:
+        token: Token = requested_api_info.set(TRAJECTORY_API_INFO)
+        try:
+            dto = await self.trajectory_stream_player.intent.dispatch(request)
+            if isinstance(dto, PlayerStreamResponse):
+                return to_response(dto.items)
+
+            return self.response_converter.convert(dto)
+        finally:
+            requested_api_info.reset(token)
+
+    async def game_stream(
+        self, request: PlayerGameStreamRequest, to_response: Callable[[AsyncIterator], Response]
+    ) -> Response:
+        token: Token = requested_api_info.set(GAME_API_INFO)
+        try:
+            dto = await self.game_stream_player.intent.dispatch(request)
+            if isinstance(dto, PlayerStreamResponse):
+                return to_response(dto.items)
+
+            return self.response_converter.convert(dto)
+        finally:
+            requested_api_info.reset(token)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+from asyncio import Future, get_running_loop, shield
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.infra.serializer import to_jsonable
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlight:
+    enabled: bool = False
+    flights: dict[str, Future] = field(default_factory=dict)
+
+    def configure(self, enabled: bool) -> None:
+        self.enabled, self.flights = enabled, {}
+
+    def is_shareable(self, request: Any) -> bool:
+        return self.enabled and request.white.deterministic and request.black.deterministic
+
+    @classmethod
+    def key_of(cls, name: str, request: Any) -> str:
+        return sha256(json.dumps([name, to_jsonable(request)], sort_keys=True).encode()).hexdigest()
+
+    async def shared(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        if key not in self.flights:
+            self.flights[key] = get_running_loop().create_task(call())
+            self.flights[key].add_done_callback(lambda _: self.flights.pop(key, None))
+
+        return await shield(self.flights[key])
+
+    async def dispatched(self, name: str, request: Any, call: Callable[[], Awaitable[T]]) -> T:
+        if not self.is_shareable(request):
+            return await call()
+
+        return await self.shared(SingleFlight.key_of(name, request), call)
+
+
+single_flight: SingleFlight = SingleFlight()
@@ -2,15 +2,25 @@
 
 # SPDX-License-Identifier: MIT
 
+from contextvars import ContextVar
+
 from dependency_injector import containers, providers
 
+from src.converter.hallinks import HALLinkCache
 from src.framework.dto.playerdto import PlayerAPIInfo, PlayerInternal
 
+requested_api_info: ContextVar[PlayerAPIInfo] = ContextVar(
+    "requested_api_info", default=PlayerAPIInfo(name="", method="")
+)
+
 
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
-    internal_model = providers.Factory(PlayerInternal, url_env=config.url_env, routes=config.routes)
-    api_info = providers.Factory(PlayerAPIInfo, name=config.name, method=config.method)
+    internal_model = providers.Singleton(
+        PlayerInternal, url_env=config.url_env, routes=config.routes, measurement_window=config.measurement_window
+    )
+    api_info = providers.Callable(requested_api_info.get)
+    hal_links = providers.Singleton(HALLinkCache.from_routes, routes=config.routes)
 
 
 container = Container()
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from submodules.fastapi_haljson.src.halmodel import HALBase
+
+
+class HALLinkSet(NamedTuple):
+    links: Any
+
+    @classmethod
+    def from_routes_with_requested(cls, routes: dict[str, str], name: str, method: str) -> HALLinkSet:
+        return HALLinkSet(HALBase.from_routes_with_requested(routes, name, method).links)
+
+
+class HALLinkCache(NamedTuple):
+    routes: dict[str, str]
+    link_sets: dict[tuple[str, str], HALLinkSet]
+
+    @classmethod
+    def from_routes(cls, routes: dict[str, str], methods: list[str] = ["post"]) -> HALLinkCache:
+        return HALLinkCache(
+            routes,
+            {
+                (name, method): HALLinkSet.from_routes_with_requested(routes, name, method)
+                for name in routes
+                for method in methods
+            },
+        )
+
+    def link_set(self, name: str, method: str) -> HALLinkSet:
+        if (name, method) not in self.link_sets:
+            self.link_sets[(name, method)] = HALLinkSet.from_routes_with_requested(self.routes, name, method)
+
+        return self.link_sets[(name, method)]
@@ -8,12 +8,14 @@ from dependency_injector.wiring import Provide, inject
 from src.config import Container
 from src.framework.dto.playerdto import (
     PlayerGameRequest,
+    PlayerGameStreamRequest,
     PlayerInternal,
     PlayerMeasurementRequest,
     PlayerTrajectoryRequest,
 )
 from src.model.requestmodel import (
     GameRequestModel,
+    GameStreamRequestModel,
     MeasurementRequestModel,
     TrajectoryRequestModel,
     URLString,
@@ -28,7 +30,15 @@ class TrajectoryRequestToModel(PlayerTrajectoryRequest):
     @inject
     def convert(self, internal: PlayerInternal = Provide[Container.internal_model]) -> TrajectoryRequestModel:
         return TrajectoryRequestModel(
-            URLString(internal.url_env), self.fens, URLString(self.white.url), URLString(self.black.url), self.step
+            URLString(internal.url_env),
+            self.fens,
+            URLString(self.white.url),
+            URLString(self.black.url),
+            self.step,
+            self.white.deterministic,
+            self.black.deterministic,
+            self.white.move_ids,
+            self.black.move_ids,
         )
 
 
@@ -39,16 +49,52 @@ class GameRequestToModel(PlayerGameRequest):
 
     @inject
     def convert(self, internal: PlayerInternal = Provide[Container.internal_model]) -> GameRequestModel:
-        return GameRequestModel(URLString(internal.url_env), URLString(self.white.url), URLString(self.black.url))
+        return GameRequestModel(
+            URLString(internal.url_env),
+            URLString(self.white.url),
+            URLString(self.black.url),
+            self.white.deterministic,
+            self.black.deterministic,
+            self.white.move_ids,
+            self.black.move_ids,
+        )
+
+
+class GameStreamRequestToModel(PlayerGameStreamRequest):
+    @classmethod
+    def from_dto(cls, dto: PlayerGameStreamRequest) -> GameStreamRequestToModel:
+        return GameStreamRequestToModel(white=dto.white, black=dto.black, playtime=dto.playtime, window=dto.window)
+
+    @inject
+    def convert(self, internal: PlayerInternal = Provide[Container.internal_model]) -> GameStreamRequestModel:
+        return GameStreamRequestModel(
+            URLString(internal.url_env),
+            URLString(self.white.url),
+            URLString(self.black.url),
+            self.playtime,
+            self.white.deterministic,
+            self.black.deterministic,
+            self.white.move_ids,
+            self.black.move_ids,
+            self.window,
+        )
 
 
 class MeasurementRequestToModel(PlayerMeasurementRequest):
     @classmethod
     def from_dto(cls, dto: PlayerMeasurementRequest) -> MeasurementRequestToModel:
-        return MeasurementRequestToModel(white=dto.white, black=dto.black, playtime=dto.playtime)
+        return MeasurementRequestToModel(white=dto.white, black=dto.black, playtime=dto.playtime, window=dto.window)
 
     @inject
     def convert(self, internal: PlayerInternal = Provide[Container.internal_model]) -> MeasurementRequestModel:
         return MeasurementRequestModel(
-            URLString(internal.url_env), URLString(self.white.url), URLString(self.black.url), self.playtime
+            URLString(internal.url_env),
+            URLString(self.white.url),
+            URLString(self.black.url),
+            self.playtime,
+            self.white.deterministic,
+            self.black.deterministic,
+            self.white.move_ids,
+            self.black.move_ids,
+            self.window or internal.measurement_window,
         )
@@ -4,22 +4,26 @@
 
 from __future__ import annotations
 
-from typing import Any, NamedTuple, Union
+from typing import Any, AsyncIterator, Callable, NamedTuple, Union
 
 from dependency_injector.wiring import Provide, inject
 from src.config import Container
+from src.converter.hallinks import HALLinkCache
 from src.framework.dto.playerdto import (
     PlayerAIMeasurement,
     PlayerAPIInfo,
     PlayerGameRequest,
     PlayerGameResponse,
     PlayerHTTPStatusErrorResponse,
-    PlayerInternal,
     PlayerMeasurementRequest,
     PlayerMeasurementResponse,
     PlayerRequestErrorResponse,
+    PlayerStreamedGame,
+    PlayerStreamError,
+    PlayerStreamResponse,
     PlayerTrajectoryRequest,
     PlayerTrajectoryResponse,
+    PlayerTrajectoryStep,
 )
 from src.model.responsemodel import (
     GameResponseModel,
@@ -27,9 +31,10 @@ from src.model.responsemodel import (
     MeasurementInfo,
     MeasurementResponseModel,
     RequestErrorResponseModel,
+    StreamedGameResponseModel,
+    StreamResponseModel,
     TrajectoryResponseModel,
 )
-from submodules.fastapi_haljson.src.halmodel import HALBase
 
 
 class TrajectoryResponseToDTO(TrajectoryResponseModel):
@@ -40,11 +45,11 @@ class TrajectoryResponseToDTO(TrajectoryResponseModel):
     @inject
     def convert(
         self,
-        internal_model: PlayerInternal = Provide[Container.internal_model],
+        hal_links: HALLinkCache = Provide[Container.hal_links],
         api_info: PlayerAPIInfo = Provide[Container.api_info],
     ) -> PlayerTrajectoryResponse:
-        return PlayerTrajectoryResponse(
-            links=HALBase.from_routes_with_requested(internal_model.routes, api_info.name, api_info.method).links,
+        return PlayerTrajectoryResponse.construct(
+            links=hal_links.link_set(api_info.name, api_info.method).links,
             fens=self.fens,
             sans=self.sans,
             results=self.results,
@@ -59,17 +64,40 @@ class GameResponseToDTO(GameResponseModel):
     @inject
     def convert(
         self,
-        internal_model: PlayerInternal = Provide[Container.internal_model],
+        hal_links: HALLinkCache = Provide[Container.hal_links],
         api_info: PlayerAPIInfo = Provide[Container.api_info],
     ) -> PlayerGameResponse:
-        return PlayerGameResponse(
-            links=HALBase.from_routes_with_requested(internal_model.routes, api_info.name, api_info.method).links,
+        return PlayerGameResponse.construct(
+            links=hal_links.link_set(api_info.name, api_info.method).links,
             fens=self.fens,
             sans=self.sans,
             result=self.result,
         )
 
 
+StreamItemDTO = Union[PlayerTrajectoryStep, PlayerStreamedGame, PlayerStreamError]
+
+stream_item_converters: dict[str, Callable[[Any], StreamItemDTO]] = {
+    TrajectoryResponseModel.__name__: lambda model: PlayerTrajectoryStep.construct(**model._asdict()),
+    StreamedGameResponseModel.__name__: lambda model: PlayerStreamedGame.construct(**model._asdict()),
+    RequestErrorResponseModel.__name__: lambda model: PlayerStreamError.construct(**model._asdict()),
+    HTTPStatusErrorResponseModel.__name__: lambda model: PlayerStreamError.construct(**model._asdict()),
+}
+
+
+class StreamResponseToDTO(StreamResponseModel):
+    @classmethod
+    def from_model(cls, model: StreamResponseModel) -> StreamResponseToDTO:
+        return StreamResponseToDTO._make(model)
+
+    async def items(self) -> AsyncIterator[StreamItemDTO]:
+        async for responsable in self.responsables:
+            yield stream_item_converters[type(responsable).__name__](responsable)
+
+    def convert(self) -> PlayerStreamResponse:
+        return PlayerStreamResponse(self.items())
+
+
 class MeasurementInfoToDTO(MeasurementInfo):
     @classmethod
     def from_model(cls, model: MeasurementInfo) -> MeasurementInfoToDTO:
@@ -87,11 +115,11 @@ class MeasurementResponseToDTO(MeasurementResponseModel):
     @inject
     def convert(
         self,
-        internal_model: PlayerInternal = Provide[Container.internal_model],
+        hal_links: HALLinkCache = Provide[Container.hal_links],
         api_info: PlayerAPIInfo = Provide[Container.api_info],
     ) -> PlayerMeasurementResponse:
         return PlayerMeasurementResponse(
-            links=HALBase.from_routes_with_requested(internal_model.routes, api_info.name, api_info.method).links,
+            links=hal_links.link_set(api_info.name, api_info.method).links,
             white=MeasurementInfoToDTO.from_model(self.white_info).convert(),
             black=MeasurementInfoToDTO.from_model(self.black_info).convert(),
         )
@@ -112,11 +140,11 @@ class RequestErrorResponseToDTO(NamedTuple):
     @inject
     def convert(
         self,
-        internal_model: PlayerInternal = Provide[Container.internal_model],
+        hal_links: HALLinkCache = Provide[Container.hal_links],
         api_info: PlayerAPIInfo = Provide[Container.api_info],
     ) -> PlayerRequestErrorResponse:
         return PlayerRequestErrorResponse(
-            links=HALBase.from_routes_with_requested(internal_model.routes, api_info.name, api_info.method).links,
+            links=hal_links.link_set(api_info.name, api_info.method).links,
             message=self.model.message,
             location="body",
             param=", ".join(self.dto_dict.keys()),
@@ -140,11 +168,11 @@ class HTTPStatusErrorResponseToDTO(NamedTuple):
     @inject
     def convert(
         self,
-        internal_model: PlayerInternal = Provide[Container.internal_model],
+        hal_links: HALLinkCache = Provide[Container.hal_links],
         api_info: PlayerAPIInfo = Provide[Container.api_info],
     ) -> PlayerHTTPStatusErrorResponse:
         return PlayerHTTPStatusErrorResponse(
-            links=HALBase.from_routes_with_requested(internal_model.routes, api_info.name, api_info.method).links,
+            links=hal_links.link_set(api_info.name, api_info.method).links,
             message=self.model.message,
             location="body",
             param=", ".join(self.dto_dict.keys()),
@@ -5,10 +5,10 @@
 from abc import abstractmethod
 from typing import Any, NamedTuple, TypeVar
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from src.core.adapter import APIProxyAdapter
 from src.infra.postclient import PostClient
+from src.infra.serializer import to_jsonable
 
 ProxyReq = TypeVar("ProxyReq", bound=BaseModel)
 ProxyRes = TypeVar("ProxyRes", bound=BaseModel)
@@ -20,7 +20,7 @@ class APIProxyData(NamedTuple):
 
 class PostAPIProxy(APIProxyData, APIProxyAdapter[ProxyReq, ProxyRes]):
     async def fetch(self, request: ProxyReq) -> ProxyRes:
-        return await self.jsondict_to_response(await PostClient(self.url).post(jsonable_encoder(request)))
+        return await self.jsondict_to_response(await PostClient(self.url).post(to_jsonable(request)))
 
     @abstractmethod
     async def jsondict_to_response(self, jsondict: dict[str, Any]) -> ProxyRes:
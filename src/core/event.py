@@ -2,17 +2,14 @@
 
 # SPDX-License-Identifier: MIT
 
-from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Awaitable, Callable, NamedTuple
+from abc import ABC
+from typing import Any, AsyncGenerator, NamedTuple
 
 EventAGen = AsyncGenerator["Event", Any]
-EventOperator = Callable[[EventAGen], Awaitable]
 
 
 class Event(ABC):
-    @abstractmethod
-    async def execute(self, callstack: list[EventAGen]) -> EventOperator:
-        pass
+    pass
 
 
 class PushEventData(NamedTuple):
@@ -20,10 +17,7 @@ class PushEventData(NamedTuple):
 
 
 class PushEvent(PushEventData, Event):
-    async def execute(self, callstack: list[EventAGen]) -> EventOperator:
-        callstack.append(self.agen)
-
-        return lambda agen: agen.__anext__()
+    pass
 
 
 class PopEventData(NamedTuple):
@@ -31,7 +25,4 @@ class PopEventData(NamedTuple):
 
 
 class PopEvent(PopEventData, Event):
-    async def execute(self, callstack: list[EventAGen]) -> EventOperator:
-        await callstack.pop(-1).aclose()
-
-        return lambda agen: agen.asend(self.value)
+    pass
@@ -7,7 +7,8 @@ from typing import Any, NamedTuple, TypeVar, cast
 
 from src.core.adapter import ToUsecaseAdapter
 from src.core.boundary import FrameworkRequestBoundary, FrameworkResponseBoundary
-from src.core.event import Event, EventAGen, EventOperator, PopEvent
+from src.core.event import Event, EventAGen, PopEvent, PushEvent
+from src.core.usecase import Usecase
 
 IntentReq = TypeVar("IntentReq")
 IntentRes = TypeVar("IntentRes")
@@ -17,15 +18,21 @@ UsecaseRes = TypeVar("UsecaseRes")
 
 class Intent(ToUsecaseAdapter[IntentReq, IntentRes], FrameworkResponseBoundary[UsecaseReq, UsecaseRes]):
     async def dispatch(self, request: IntentReq) -> IntentRes:
-        callstack: list[EventAGen] = list[EventAGen]([self.executed(request)])
-        op: EventOperator = lambda agen: agen.__anext__()
-        event: Event = PopEvent(None)
+        callstack: list[EventAGen] = [self.executed(request)]
+        event: Event = await callstack[-1].__anext__()
 
-        while len(callstack) > 0:
-            event = await op(callstack[-1])
-            op = await event.execute(callstack)
+        while True:
+            if isinstance(event, PushEvent):
+                callstack.append(event.agen)
+                event = await event.agen.__anext__()
+                continue
 
-        return cast(PopEvent, event).value
+            await callstack.pop().aclose()
+
+            if len(callstack) == 0:
+                return cast(PopEvent, event).value
+
+            event = await callstack[-1].asend(cast(PopEvent, event).value)
 
     async def response(self, response: UsecaseRes) -> PopEvent:
         return PopEvent(response)
@@ -35,5 +42,25 @@ class Intent(ToUsecaseAdapter[IntentReq, IntentRes], FrameworkResponseBoundary[U
         yield PopEvent(None)
 
 
+class DirectIntent(Intent[IntentReq, IntentRes, UsecaseReq, UsecaseRes]):
+    usecase: FrameworkRequestBoundary
+
+    async def dispatch(self, request: IntentReq) -> IntentRes:
+        return self.responded(
+            request, await cast(Usecase, self.usecase).request_to_responsable(self.requested(request))
+        )
+
+    async def executed(self, request: IntentReq) -> EventAGen:
+        yield PopEvent(self.responded(request, (yield await self.usecase.request(self.requested(request)))))
+
+    @abstractmethod
+    def requested(self, request: IntentReq) -> UsecaseReq:
+        pass
+
+    @abstractmethod
+    def responded(self, request: IntentReq, response: UsecaseRes) -> IntentRes:
+        pass
+
+
 class IntentData(NamedTuple):
     usecase: FrameworkRequestBoundary
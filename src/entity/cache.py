@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple
+
+from src.entity.movement import IFENAdvance
+from src.entity.status import IStatus
+
+
+@dataclass
+class LRUCache:
+    capacity: int
+    entries: OrderedDict = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def looked_up(self, key: Hashable) -> Any:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return self.entries[key]
+
+    def stored(self, key: Hashable, value: Any) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def counters(self) -> dict[str, int]:
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class CachedBatch(NamedTuple):
+    cache: LRUCache
+
+    async def fetched(self, keys: list[Hashable], fetch: Callable[[list], Awaitable[list]]) -> list:
+        cached: list = [self.cache.looked_up(key) for key in keys]
+        misses: list[Hashable] = list(dict.fromkeys(key for key, value in zip(keys, cached) if value is None))
+        fetched: dict = dict(zip(misses, await fetch(misses))) if len(misses) > 0 else {}
+
+        for key, value in fetched.items():
+            self.cache.stored(key, value)
+
+        return [fetched[key] if value is None else value for key, value in zip(keys, cached)]
+
+
+class CachedStatusData(NamedTuple):
+    origin: IStatus
+    cache: LRUCache
+
+
+class CachedStatus(CachedStatusData, IStatus):
+    async def status(self, fens: list[str]) -> tuple[list[float], list[list[str]]]:
+        async def fetch(misses: list[str]) -> list[tuple[float, list[str]]]:
+            return list(zip(*await self.origin.status(misses)))
+
+        fetched: list[tuple[float, list[str]]] = await CachedBatch(self.cache).fetched(fens, fetch)
+
+        return [x[0] for x in fetched], [x[1] for x in fetched]
+
+
+class CachedFENAdvanceData(NamedTuple):
+    origin: IFENAdvance
+    cache: LRUCache
+
+
+class CachedFENAdvance(CachedFENAdvanceData, IFENAdvance):
+    async def advanced(self, fens: list[str], sans: list[str]) -> list[str]:
+        async def fetch(misses: list[tuple[str, str]]) -> list[str]:
+            return await self.origin.advanced([x[0] for x in misses], [x[1] for x in misses])
+
+        return await CachedBatch(self.cache).fetched(list(zip(fens, sans)), fetch)
+
+
+class EnvironmentCache(NamedTuple):
+    status: LRUCache
+    advance: LRUCache
+
+    @classmethod
+    def from_capacity(cls, capacity: int) -> EnvironmentCache:
+        return EnvironmentCache(LRUCache(capacity), LRUCache(capacity))
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        return {"fen_status": self.status.counters(), "next_fen": self.advance.counters()}
+
+
+class EnvironmentCaches(dict[str, EnvironmentCache]):
+    def enabled(self, url_env: str, capacity: int) -> None:
+        self[url_env] = EnvironmentCache.from_capacity(capacity)
+
+    def counters(self) -> dict[str, dict[str, dict[str, int]]]:
+        return {url_env: cache.counters() for url_env, cache in self.items()}
+
+
+environment_caches: EnvironmentCaches = EnvironmentCaches()
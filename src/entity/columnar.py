@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate, chain, compress, repeat
+from operator import add, mul
+from typing import Callable, Iterable, NamedTuple
+
+
+class InternTable(NamedTuple):
+    values: list[str]
+    ids: dict[str, int]
+
+    @classmethod
+    def empty(cls) -> InternTable:
+        return InternTable([], {})
+
+    def interned(self, value: str) -> int:
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+
+        return self.ids[value]
+
+    def interned_all(self, values: Iterable[str]) -> array:
+        targets: list[str] = list(values)
+
+        for value in dict.fromkeys(targets):
+            self.interned(value)
+
+        return array("l", map(self.ids.__getitem__, targets))
+
+    def looked_up(self, ids: Iterable[int]) -> list[str]:
+        return list(map(self.values.__getitem__, ids))
+
+
+class RaggedArray(NamedTuple):
+    values: array
+    starts: array
+    stops: array
+    step: int = 1
+
+    @classmethod
+    def from_flat(cls, values: array, lengths: Iterable[int]) -> RaggedArray:
+        offsets: array = array("l", accumulate(chain([0], lengths)))
+
+        return RaggedArray(values, offsets[:-1], offsets[1:])
+
+    @classmethod
+    def from_nested(cls, typecode: str, nested: list[list], mapper: Callable = lambda x: x) -> RaggedArray:
+        return RaggedArray.from_flat(array(typecode, mapper(chain.from_iterable(nested))), map(len, nested))
+
+    def length(self) -> int:
+        return len(self.starts)
+
+    def lengths(self) -> list[int]:
+        return list(map(len, map(range, self.starts, self.stops, repeat(self.step))))
+
+    def rows(self) -> Iterable[array]:
+        return map(self.values.__getitem__, map(slice, self.starts, self.stops, repeat(self.step)))
+
+    def to_nested(self, mapper: Callable = list) -> list[list]:
+        return list(map(mapper, self.rows()))
+
+    def to_not_empty_indice(self) -> list[int]:
+        return list(compress(range(self.length()), self.lengths()))
+
+    def firsts(self) -> Iterable:
+        return map(self.values.__getitem__, self.starts)
+
+    def strided(self, start: int) -> RaggedArray:
+        return RaggedArray(
+            self.values, array("l", map((start * self.step).__add__, self.starts)), self.stops, self.step * 2
+        )
+
+    def gathered(self, indice: Iterable[int]) -> RaggedArray:
+        targets: list[int] = list(indice)
+
+        return RaggedArray(
+            self.values,
+            array("l", map(self.starts.__getitem__, targets)),
+            array("l", map(self.stops.__getitem__, targets)),
+            self.step,
+        )
+
+    def truncated(self, lengths: Iterable[int]) -> RaggedArray:
+        return RaggedArray(
+            self.values,
+            self.starts,
+            array("l", map(min, self.stops, map(add, self.starts, map(mul, lengths, repeat(self.step))))),
+            self.step,
+        )
+
+    def concatenated(self, other: RaggedArray) -> RaggedArray:
+        if self.values is not other.values or self.step != other.step:
+            return RaggedArray.from_flat(
+                array(self.values.typecode, chain.from_iterable(chain(self.rows(), other.rows()))),
+                self.lengths() + other.lengths(),
+            )
+
+        return RaggedArray(self.values, self.starts + other.starts, self.stops + other.stops, self.step)
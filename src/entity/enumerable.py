@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import Callable, Iterable
+from typing import Callable, Hashable, Iterable, NamedTuple
 
 
 class Enumerable(list):
@@ -82,3 +82,35 @@ class Indexable(list):
 
     def conditional_indexed(self, condition: Callable) -> Indexable:
         return self.indexed(Enumerable(self).to_conditional_indice(condition))
+
+
+class Deduplicated(NamedTuple):
+    firsts: list[int]
+    inverse: list[int]
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[Hashable]) -> Deduplicated:
+        ids: dict = {}
+        firsts: list[int] = []
+        inverse: list[int] = []
+
+        for i, key in enumerate(keys):
+            if key not in ids:
+                ids[key] = len(firsts)
+                firsts.append(i)
+            inverse.append(ids[key])
+
+        return Deduplicated(firsts, inverse)
+
+    @classmethod
+    def from_keys_if(cls, keys: list[Hashable], enabled: bool) -> Deduplicated:
+        if not enabled:
+            return Deduplicated(list(range(len(keys))), list(range(len(keys))))
+
+        return Deduplicated.from_keys(keys)
+
+    def picked(self, values: list) -> list:
+        return list(map(values.__getitem__, self.firsts))
+
+    def fanned_out(self, values: list) -> list:
+        return list(map(values.__getitem__, self.inverse))
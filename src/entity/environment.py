@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from src.entity.cache import CachedFENAdvance, CachedStatus, environment_caches
+from src.entity.moveid import move_id_environments
+from src.entity.movement import AdvancingMovement, FENAdvance, IFENAdvance, IMovement, LocalFENAdvance
+from src.entity.status import IStatus, LocalStatus, Status
+
+
+class Environment(str):
+    @classmethod
+    def local(cls) -> Environment:
+        return Environment("local")
+
+    def is_local(self) -> bool:
+        return self == Environment.local()
+
+    def is_cached(self) -> bool:
+        return self in environment_caches
+
+    def to_status(self) -> IStatus:
+        status: IStatus = LocalStatus() if self.is_local() else Status(self, self in move_id_environments)
+
+        return CachedStatus(status, environment_caches[self].status) if self.is_cached() else status
+
+    def to_advance(self) -> IFENAdvance:
+        advance: IFENAdvance = LocalFENAdvance() if self.is_local() else FENAdvance(self)
+
+        return CachedFENAdvance(advance, environment_caches[self].advance) if self.is_cached() else advance
+
+    def to_movement(self, url_ai: str, deterministic: bool = False, move_ids: bool = False) -> IMovement:
+        return AdvancingMovement(url_ai, self.to_advance(), deterministic, move_ids)
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from typing import NamedTuple
 
-from src.infra.postclient import PostClient
+from src.entity.enumerable import Deduplicated
+from src.entity.moveid import MOVE_IDS, MoveIdEncoding
+from src.infra.batchclient import BatchPostClient
 
 
 class RequestedFENStatus(NamedTuple):
@@ -14,7 +16,13 @@ class RequestedFENStatus(NamedTuple):
     legal_moves: list[list[str]]
 
     @classmethod
-    async def from_url_with_FENs(cls, url: str, fens: list[str]) -> RequestedFENStatus:
-        response = await PostClient(url + "/model/fen-status").post({"fens": fens})
-
-        return RequestedFENStatus(response["statuses"], response["legal_moves"])
+    async def from_url_with_FENs(cls, url: str, fens: list[str], move_ids: bool = False) -> RequestedFENStatus:
+        unique: Deduplicated = Deduplicated.from_keys(fens)
+        response = await BatchPostClient(url + "/model/fen-status" + MoveIdEncoding.query(move_ids)).post(
+            {"fens": unique.picked(fens)}
+        )
+        legal_moves: list[list[str]] = (
+            MOVE_IDS.decoded_all(response["legal_moves"]) if move_ids else response["legal_moves"]
+        )
+
+        return RequestedFENStatus(unique.fanned_out(response["statuses"]), unique.fanned_out(legal_moves))
@@ -0,0 +1,351 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import NamedTuple, Optional
+
+
+class MicroBoardStatus(Enum):
+    NONE = auto()
+    CHECKMATE = auto()
+    STALEMATE = auto()
+    INSUFFICIENT_MATERIAL = auto()
+    FIFTY_MOVES = auto()
+
+    def to_result(self) -> float:
+        if self == MicroBoardStatus.NONE:
+            return 0
+        if self == MicroBoardStatus.CHECKMATE:
+            return 1
+
+        return 0.5
+
+
+class Square(int):
+    @classmethod
+    def from_name(cls, name: str) -> Square:
+        return Square("efgh".index(name[0]) + "45678".index(name[1]) * 4)
+
+    @classmethod
+    def from_coord(cls, file: int, rank: int) -> Optional[Square]:
+        if 0 <= file < 4 and 0 <= rank < 5:
+            return Square(file + rank * 4)
+
+        return None
+
+    def file(self) -> int:
+        return self % 4
+
+    def rank(self) -> int:
+        return self // 4
+
+    def name(self) -> str:
+        return "efgh"[self.file()] + "45678"[self.rank()]
+
+    def is_dark(self) -> bool:
+        return (self.file() + self.rank()) % 2 == 1
+
+    def shifted(self, file: int, rank: int) -> Optional[Square]:
+        return Square.from_coord(self.file() + file, self.rank() + rank)
+
+    def ray(self, file: int, rank: int) -> tuple[int, ...]:
+        squares: list[int] = []
+        target: Optional[Square] = self.shifted(file, rank)
+
+        while target is not None:
+            squares.append(target)
+            target = target.shifted(file, rank)
+
+        return tuple(squares)
+
+    def jumps(self, offsets: tuple[tuple[int, int], ...]) -> tuple[int, ...]:
+        return tuple(target for target in map(lambda x: self.shifted(*x), offsets) if target is not None)
+
+
+class MoveTable(NamedTuple):
+    names: tuple[str, ...]
+    knight: tuple[tuple[int, ...], ...]
+    king: tuple[tuple[int, ...], ...]
+    rook: tuple[tuple[tuple[int, ...], ...], ...]
+    bishop: tuple[tuple[tuple[int, ...], ...], ...]
+    pawn_push: dict[str, tuple[tuple[int, ...], ...]]
+    pawn_capture: dict[str, tuple[tuple[int, ...], ...]]
+
+    @classmethod
+    def built(cls) -> MoveTable:
+        squares: list[Square] = [Square(i) for i in range(20)]
+        knight = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+        king = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+        return MoveTable(
+            tuple(square.name() for square in squares),
+            tuple(square.jumps(knight) for square in squares),
+            tuple(square.jumps(king) for square in squares),
+            tuple(tuple(square.ray(*x) for x in ((0, 1), (1, 0), (0, -1), (-1, 0))) for square in squares),
+            tuple(tuple(square.ray(*x) for x in ((1, 1), (1, -1), (-1, -1), (-1, 1))) for square in squares),
+            {
+                "w": tuple(square.jumps(((0, 1),)) for square in squares),
+                "b": tuple(square.jumps(((0, -1),)) for square in squares),
+            },
+            {
+                "w": tuple(square.jumps(((-1, 1), (1, 1))) for square in squares),
+                "b": tuple(square.jumps(((-1, -1), (1, -1))) for square in squares),
+            },
+        )
+
+
+MOVE_TABLE: MoveTable = MoveTable.built()
+
+
+class Castling(NamedTuple):
+    right: str
+    king: int
+    rook: int
+    king_to: int
+    rook_to: int
+    passing: tuple[int, ...]
+
+
+CASTLINGS: dict[str, Castling] = {
+    "w": Castling(
+        "K", Square.from_name("h4"), Square.from_name("e4"), Square.from_name("f4"), Square.from_name("g4"), (1, 2)
+    ),
+    "b": Castling(
+        "k", Square.from_name("e8"), Square.from_name("h8"), Square.from_name("g8"), Square.from_name("f8"), (17, 18)
+    ),
+}
+
+
+class Move(NamedTuple):
+    source: int
+    target: int
+    promotion: str = ""
+
+    @classmethod
+    def from_UCI(cls, uci: str) -> Move:
+        return Move(Square.from_name(uci[0:2]), Square.from_name(uci[2:4]), uci[4:])
+
+    def to_UCI(self) -> str:
+        return MOVE_TABLE.names[self.source] + MOVE_TABLE.names[self.target] + self.promotion
+
+
+class MicroBoard(NamedTuple):
+    squares: str
+    turn: str
+    castling: str
+    halfmove: int
+    fullmove: int
+
+    @classmethod
+    def from_FEN(cls, fen: str) -> MicroBoard:
+        placement, turn, castling, _, halfmove, fullmove = fen.split(" ")
+        rows: list[str] = [
+            "".join("." * int(x) if x.isdigit() else x for x in row) for row in placement.split("/")[4::-1]
+        ]
+
+        return MicroBoard(
+            "".join(row[4:] for row in rows), turn, castling.replace("-", ""), int(halfmove), int(fullmove)
+        )
+
+    def to_FEN(self) -> str:
+        rows: list[str] = ["...." + self.squares[i : i + 4] for i in range(16, -1, -4)] + ["........"] * 3
+        placement: str = "/".join(
+            "".join(str(len(x)) if x[0] == "." else x for x in MicroBoard.runs(row)) for row in rows
+        )
+
+        return f"{placement} {self.turn} {self.castling or '-'} - {self.halfmove} {self.fullmove}"
+
+    @classmethod
+    def runs(cls, row: str) -> list[str]:
+        runs: list[str] = []
+
+        for x in row:
+            if x == "." and len(runs) > 0 and runs[-1][0] == ".":
+                runs[-1] += x
+            else:
+                runs.append(x)
+
+        return runs
+
+    @classmethod
+    def color_of(cls, piece: str) -> str:
+        return "w" if piece.isupper() else "b"
+
+    @classmethod
+    def opposite(cls, color: str) -> str:
+        return "b" if color == "w" else "w"
+
+    def own(self, piece: str) -> str:
+        return piece.upper() if self.turn == "w" else piece.lower()
+
+    def is_attacked(self, square: int, color: str) -> bool:
+        def piece(x: str) -> str:
+            return x.upper() if color == "w" else x.lower()
+
+        if any(self.squares[i] == piece("n") for i in MOVE_TABLE.knight[square]):
+            return True
+        if any(self.squares[i] == piece("k") for i in MOVE_TABLE.king[square]):
+            return True
+        if any(self.squares[i] == piece("p") for i in MOVE_TABLE.pawn_capture[MicroBoard.opposite(color)][square]):
+            return True
+
+        for rays, sliders in [
+            (MOVE_TABLE.rook, (piece("r"), piece("q"))),
+            (MOVE_TABLE.bishop, (piece("b"), piece("q"))),
+        ]:
+            for ray in rays[square]:
+                for i in ray:
+                    if self.squares[i] != ".":
+                        if self.squares[i] in sliders:
+                            return True
+                        break
+
+        return False
+
+    def is_check(self) -> bool:
+        king: int = self.squares.find(self.own("k"))
+
+        return king >= 0 and self.is_attacked(king, MicroBoard.opposite(self.turn))
+
+    def is_target(self, square: int) -> bool:
+        return self.squares[square] == "." or MicroBoard.color_of(self.squares[square]) != self.turn
+
+    def pawn_moves(self, source: int) -> list[Move]:
+        targets: list[int] = [i for i in MOVE_TABLE.pawn_push[self.turn][source] if self.squares[i] == "."] + [
+            i
+            for i in MOVE_TABLE.pawn_capture[self.turn][source]
+            if self.squares[i] != "." and MicroBoard.color_of(self.squares[i]) != self.turn
+        ]
+
+        return [
+            Move(source, target, promotion)
+            for target in targets
+            for promotion in (["q", "r", "b", "n"] if Square(target).rank() == (4 if self.turn == "w" else 0) else [""])
+        ]
+
+    def slider_moves(self, source: int, rays: tuple[tuple[int, ...], ...]) -> list[Move]:
+        moves: list[Move] = []
+
+        for ray in rays:
+            for i in ray:
+                if self.is_target(i):
+                    moves.append(Move(source, i))
+                if self.squares[i] != ".":
+                    break
+
+        return moves
+
+    def piece_moves(self, source: int) -> list[Move]:
+        kind: str = self.squares[source].lower()
+
+        if kind == "p":
+            return self.pawn_moves(source)
+        if kind == "n":
+            return [Move(source, i) for i in MOVE_TABLE.knight[source] if self.is_target(i)]
+        if kind == "k":
+            return [Move(source, i) for i in MOVE_TABLE.king[source] if self.is_target(i)]
+
+        return self.slider_moves(
+            source,
+            {
+                "r": MOVE_TABLE.rook[source],
+                "b": MOVE_TABLE.bishop[source],
+                "q": MOVE_TABLE.rook[source] + MOVE_TABLE.bishop[source],
+            }[kind],
+        )
+
+    def castling_moves(self) -> list[Move]:
+        castling: Castling = CASTLINGS[self.turn]
+        opponent: str = MicroBoard.opposite(self.turn)
+
+        if (
+            castling.right in self.castling
+            and self.squares[castling.king] == self.own("k")
+            and self.squares[castling.rook] == self.own("r")
+            and all(self.squares[i] == "." for i in castling.passing)
+            and not any(self.is_attacked(i, opponent) for i in (castling.king, castling.king_to) + castling.passing)
+        ):
+            return [Move(castling.king, castling.king_to)]
+
+        return []
+
+    def pseudo_legal_moves(self) -> list[Move]:
+        return [
+            move
+            for source, piece in enumerate(self.squares)
+            if piece != "." and MicroBoard.color_of(piece) == self.turn
+            for move in self.piece_moves(source)
+        ]
+
+    def legal_moves(self) -> list[str]:
+        return sorted(
+            move.to_UCI()
+            for move in self.pseudo_legal_moves() + self.castling_moves()
+            if not self.moved(move).is_exposed()
+        )
+
+    def is_exposed(self) -> bool:
+        king: int = self.squares.find("K" if self.turn == "b" else "k")
+
+        return king >= 0 and self.is_attacked(king, self.turn)
+
+    def moved(self, move: Move) -> MicroBoard:
+        squares: list[str] = list(self.squares)
+        piece: str = squares[move.source]
+        reset: bool = piece.lower() == "p" or squares[move.target] != "."
+        castling: Castling = CASTLINGS[self.turn]
+
+        squares[move.target] = self.own(move.promotion) if move.promotion != "" else piece
+        squares[move.source] = "."
+        if piece == self.own("k") and move.source == castling.king and move.target == castling.king_to:
+            squares[castling.rook_to] = squares[castling.rook]
+            squares[castling.rook] = "."
+
+        return MicroBoard(
+            "".join(squares),
+            MicroBoard.opposite(self.turn),
+            "".join(
+                x
+                for x in self.castling
+                if not {move.source, move.target}
+                & {CASTLINGS[MicroBoard.color_of(x)].king, CASTLINGS[MicroBoard.color_of(x)].rook}
+            ),
+            0 if reset else self.halfmove + 1,
+            self.fullmove + (1 if self.turn == "b" else 0),
+        )
+
+    def pushed(self, uci: str) -> MicroBoard:
+        if uci not in self.legal_moves():
+            raise ValueError(f"Illegal move {uci!r} in {self.to_FEN()!r}")
+
+        return self.moved(Move.from_UCI(uci))
+
+    def is_insufficient_material(self, color: str) -> bool:
+        own: list[str] = [x for x in self.squares if x != "." and MicroBoard.color_of(x) == color]
+        other: list[str] = [x for x in self.squares if x != "." and MicroBoard.color_of(x) != color]
+
+        if any(x.lower() in "prq" for x in own):
+            return False
+        if any(x.lower() == "n" for x in own):
+            return len(own) <= 2 and all(x.lower() in "kq" for x in other)
+        if any(x.lower() == "b" for x in own):
+            bishops: list[bool] = [Square(i).is_dark() for i, x in enumerate(self.squares) if x.lower() == "b"]
+
+            return (all(bishops) or not any(bishops)) and not any(x.lower() in "pn" for x in self.squares)
+
+        return True
+
+    def examined(self) -> tuple[MicroBoardStatus, list[str]]:
+        legal_moves: list[str] = self.legal_moves()
+
+        if len(legal_moves) == 0:
+            return (MicroBoardStatus.CHECKMATE if self.is_check() else MicroBoardStatus.STALEMATE), legal_moves
+        if self.is_insufficient_material("w") and self.is_insufficient_material("b"):
+            return MicroBoardStatus.INSUFFICIENT_MATERIAL, legal_moves
+        if self.halfmove >= 100:
+            return MicroBoardStatus.FIFTY_MOVES, legal_moves
+
+        return MicroBoardStatus.NONE, legal_moves
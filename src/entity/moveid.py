@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import NamedTuple, Union
+
+from src.entity.microboard import MOVE_TABLE, Move, Square
+
+
+class MoveIdTable(NamedTuple):
+    moves: tuple[str, ...]
+    ids: dict[str, int]
+
+    @classmethod
+    def built(cls) -> MoveIdTable:
+        moves: set[str] = set()
+
+        for source in range(20):
+            targets: set[int] = set(
+                chain(
+                    MOVE_TABLE.knight[source],
+                    MOVE_TABLE.king[source],
+                    *MOVE_TABLE.rook[source],
+                    *MOVE_TABLE.bishop[source],
+                )
+            )
+            moves.update(Move(source, target).to_UCI() for target in targets)
+
+            for color, last_rank in (("w", 4), ("b", 0)):
+                for target in chain(MOVE_TABLE.pawn_push[color][source], MOVE_TABLE.pawn_capture[color][source]):
+                    if Square(target).rank() == last_rank:
+                        moves.update(Move(source, target, promotion).to_UCI() for promotion in "qrbn")
+
+        ordered: tuple[str, ...] = tuple(sorted(moves))
+
+        return MoveIdTable(ordered, {move: i for i, move in enumerate(ordered)})
+
+    def encoded(self, moves: list[str]) -> list[int]:
+        return list(map(self.ids.__getitem__, moves))
+
+    def decoded(self, ids: list[Union[int, str]]) -> list[str]:
+        return [self.moves[x] if isinstance(x, int) else x for x in ids]
+
+    def encoded_all(self, legal_moves: list[list[str]]) -> list[list[int]]:
+        return list(map(self.encoded, legal_moves))
+
+    def decoded_all(self, legal_moves: list[list[Union[int, str]]]) -> list[list[str]]:
+        return list(map(self.decoded, legal_moves))
+
+
+MOVE_IDS: MoveIdTable = MoveIdTable.built()
+
+
+class MoveIdEncoding(str):
+    @classmethod
+    def query(cls, move_ids: bool) -> MoveIdEncoding:
+        return MoveIdEncoding("?move_encoding=id" if move_ids else "")
+
+
+move_id_environments: set[str] = set()
@@ -5,8 +5,11 @@
 from abc import ABC, abstractmethod
 from typing import NamedTuple
 
+from src.entity.enumerable import Deduplicated, Mappable
+from src.entity.microboard import MicroBoard
 from src.entity.nextfen import RequestedNextFEN
 from src.entity.nextsan import RequestedNextSAN
+from src.entity.position import positions
 
 
 class IMovement(ABC):
@@ -15,22 +18,68 @@ class IMovement(ABC):
         pass
 
 
-class MovementData(NamedTuple):
-    url_env: str
+class IFENAdvance(ABC):
+    @abstractmethod
+    async def advanced(self, fens: list[str], sans: list[str]) -> list[str]:
+        pass
+
+
+class FENAdvance(str, IFENAdvance):
+    async def advanced(self, fens: list[str], sans: list[str]) -> list[str]:
+        return await RequestedNextFEN.from_url_with_FENs_SANs(self, fens, sans)
+
+
+class LocalFENAdvance(IFENAdvance):
+    async def advanced(self, fens: list[str], sans: list[str]) -> list[str]:
+        unique: Deduplicated = Deduplicated.from_keys(zip(fens, sans))
+
+        return unique.fanned_out(
+            Mappable.mapped_with_others(
+                [unique.picked(fens), unique.picked(sans)],
+                lambda fen, san: MicroBoard.from_FEN(fen).pushed(san).to_FEN(),
+            )
+        )
+
+
+class AdvancingMovementData(NamedTuple):
     url_ai: str
+    advance: IFENAdvance
+    deterministic: bool = False
+    move_ids: bool = False
 
 
-class Movement(MovementData, IMovement):
+class AdvancingMovement(AdvancingMovementData, IMovement):
     async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
         if len(fens) == 0:
             return [], []
 
-        next_sans = await RequestedNextSAN.from_url_with_FENs_legal_moves(self.url_ai, fens, legal_moves)
-        next_fens = await RequestedNextFEN.from_url_with_FENs_SANs(self.url_env, fens, next_sans)
+        next_sans = await RequestedNextSAN.from_url_with_FENs_legal_moves(
+            self.url_ai, fens, legal_moves, self.deterministic, self.move_ids
+        )
+        next_fens = positions.canonical_all(await self.advance.advanced(fens, next_sans))
 
         return next_fens, next_sans
 
 
+class MovementData(NamedTuple):
+    url_env: str
+    url_ai: str
+
+
+class Movement(MovementData, IMovement):
+    async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
+        return await AdvancingMovement(self.url_ai, FENAdvance(self.url_env)).movement(fens, legal_moves)
+
+
+class LocalMovementData(NamedTuple):
+    url_ai: str
+
+
+class LocalMovement(LocalMovementData, IMovement):
+    async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
+        return await AdvancingMovement(self.url_ai, LocalFENAdvance()).movement(fens, legal_moves)
+
+
 class FEN:
     @classmethod
     def starting(cls) -> str:
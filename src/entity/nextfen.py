@@ -4,10 +4,16 @@
 
 from __future__ import annotations
 
-from src.infra.postclient import PostClient
+from src.entity.enumerable import Deduplicated
+from src.infra.batchclient import BatchPostClient
 
 
 class RequestedNextFEN(list[str]):
     @classmethod
     async def from_url_with_FENs_SANs(cls, url: str, fens: list[str], sans: list[str]) -> RequestedNextFEN:
-        return (await PostClient(url + "/model/next-fen").post({"fens": fens, "sans": sans}))["next_fens"]
+        unique: Deduplicated = Deduplicated.from_keys(zip(fens, sans))
+        response = await BatchPostClient(url + "/model/next-fen").post(
+            {"fens": unique.picked(fens), "sans": unique.picked(sans)}
+        )
+
+        return unique.fanned_out(response["next_fens"])
@@ -4,12 +4,28 @@
 
 from __future__ import annotations
 
-from src.infra.postclient import PostClient
+from src.entity.enumerable import Deduplicated
+from src.entity.moveid import MOVE_IDS, MoveIdEncoding
+from src.infra.batchclient import BatchPostClient
 
 
 class RequestedNextSAN(list[str]):
     @classmethod
     async def from_url_with_FENs_legal_moves(
-        cls, url: str, fens: list[str], legal_moves: list[list[str]]
+        cls,
+        url: str,
+        fens: list[str],
+        legal_moves: list[list[str]],
+        deterministic: bool = False,
+        move_ids: bool = False,
     ) -> RequestedNextSAN:
-        return (await PostClient(url + "/ai/next-san").post({"fens": fens, "legal_moves": legal_moves}))["next_sans"]
+        unique: Deduplicated = Deduplicated.from_keys_if(fens, deterministic)
+        picked_legal_moves: list[list[str]] = unique.picked(legal_moves)
+        response = await BatchPostClient(url + "/ai/next-san" + MoveIdEncoding.query(move_ids)).post(
+            {
+                "fens": unique.picked(fens),
+                "legal_moves": MOVE_IDS.encoded_all(picked_legal_moves) if move_ids else picked_legal_moves,
+            }
+        )
+
+        return unique.fanned_out(MOVE_IDS.decoded(response["next_sans"]) if move_ids else response["next_sans"])
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple
+
+
+class PositionTable(NamedTuple):
+    values: list[str]
+    ids: dict[str, int]
+    whites: bytearray
+
+    @classmethod
+    def empty(cls) -> PositionTable:
+        return PositionTable([], {}, bytearray())
+
+    def length(self) -> int:
+        return len(self.values)
+
+    def interned(self, fen: str) -> int:
+        if fen not in self.ids:
+            self.ids[fen] = len(self.values)
+            self.values.append(fen)
+            self.whites.append(fen.split(" ")[1] == "w")
+
+        return self.ids[fen]
+
+    def interned_all(self, fens: Iterable[str]) -> array:
+        return array("l", map(self.interned, fens))
+
+    def looked_up(self, ids: Iterable[int]) -> list[str]:
+        return list(map(self.values.__getitem__, ids))
+
+    def canonical_all(self, fens: Iterable[str]) -> list[str]:
+        return self.looked_up(map(self.interned, fens))
+
+    def is_colored(self, fen: str, color: str) -> bool:
+        return self.whites[self.interned(fen)] == (color == "w")
+
+    def colored(self, ids: Iterable[int], color: str) -> Iterable[bool]:
+        white: bool = color == "w"
+
+        return map(white.__eq__, map(self.whites.__getitem__, ids))
+
+
+@dataclass
+class Positions:
+    capacity: int = 1 << 16
+    table: PositionTable = field(default_factory=PositionTable.empty)
+
+    def current(self) -> PositionTable:
+        if self.table.length() >= self.capacity:
+            self.table = PositionTable.empty()
+
+        return self.table
+
+    def canonical_all(self, fens: Iterable[str]) -> list[str]:
+        return self.current().canonical_all(fens)
+
+    def is_colored(self, fen: str, color: str) -> bool:
+        return self.current().is_colored(fen, color)
+
+
+positions: Positions = Positions()
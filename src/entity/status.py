@@ -4,10 +4,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum, auto
+from typing import NamedTuple
 
-from src.entity.enumerable import Mappable
+from src.entity.enumerable import Deduplicated, Mappable
 from src.entity.fenstatus import RequestedFENStatus
+from src.entity.microboard import MicroBoard, MicroBoardStatus
 
 
 class IStatus(ABC):
@@ -16,32 +17,31 @@ class IStatus(ABC):
         pass
 
 
-class MicroBoardStatus(Enum):
-    NONE = auto()
-    CHECKMATE = auto()
-    STALEMATE = auto()
-    INSUFFICIENT_MATERIAL = auto()
-    FIFTY_MOVES = auto()
+class StatusData(NamedTuple):
+    url_env: str
+    move_ids: bool = False
 
-    def to_result(self) -> float:
-        if self == MicroBoardStatus.NONE:
-            return 0
-        if self == MicroBoardStatus.CHECKMATE:
-            return 1
 
-        return 0.5
-
-
-class Status(str, IStatus):
+class Status(StatusData, IStatus):
     async def status(self, fens: list[str]) -> tuple[list[float], list[list[str]]]:
         if len(fens) == 0:
             return [], []
 
-        statuses, legal_moves = await RequestedFENStatus.from_url_with_FENs(self, fens)
+        statuses, legal_moves = await RequestedFENStatus.from_url_with_FENs(self.url_env, fens, self.move_ids)
 
         return Mappable(statuses).mapped(lambda x: MicroBoardStatus(x).to_result()), legal_moves
 
 
+class LocalStatus(IStatus):
+    async def status(self, fens: list[str]) -> tuple[list[float], list[list[str]]]:
+        unique: Deduplicated = Deduplicated.from_keys(fens)
+        examined: Mappable = Mappable(
+            unique.fanned_out(Mappable(unique.picked(fens)).mapped(lambda x: MicroBoard.from_FEN(x).examined()))
+        )
+
+        return examined.mapped(lambda x: x[0].to_result()), examined.mapped(lambda x: x[1])
+
+
 class FakeStatus(IStatus):
     async def status(self, fens: list[str]) -> tuple[list[float], list[list[str]]]:
         return [0] * len(fens), [
@@ -5,11 +5,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, NamedTuple
+from asyncio import Task, create_task, gather
+from contextvars import Token
+from itertools import chain, compress, count, islice
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional, TypeVar
 
+from src.entity.columnar import InternTable, RaggedArray
 from src.entity.enumerable import Enumerable, Indexable, Mappable
 from src.entity.movement import FEN, IMovement
+from src.entity.position import PositionTable, positions
+from src.entity.score import Score
 from src.entity.status import IStatus
+from src.infra.resilience import resilience, step_deadline
 
 
 class CorrectionMappable(Indexable):
@@ -18,7 +25,7 @@ class CorrectionMappable(Indexable):
         return CorrectionMappable(Enumerable(results).to_conditional_indice(lambda x: len(x) > 1 and x[-1] != 0))
 
     def last_color_indexed(self, fens: list[list[str]], color: str) -> Iterable[int]:
-        return self.conditional_indexed(lambda i: fens[i][-1].split(" ")[1] == color)
+        return self.conditional_indexed(lambda i: positions.is_colored(fens[i][-1], color))
 
     def corrected_fens(self, fens: list[list[str]]) -> list[list[str]]:
         return Mappable(fens).replaced_with_disjoint(
@@ -59,7 +66,7 @@ class Trace(NamedTuple):
         return Trace(*map(lambda x: Mappable(x).wrapped(), [fens, sans, results]))
 
     def to_color_indice(self, color: str) -> Iterable[int]:
-        return Enumerable(self.fens).to_conditional_indice(lambda x: x[0].split(" ")[1] == color)
+        return Enumerable(self.fens).to_conditional_indice(lambda x: positions.is_colored(x[0], color))
 
     def to_not_empty_indice(self) -> Iterable[int]:
         return Enumerable(self.fens).to_conditional_indice(lambda x: len(x) != 0)
@@ -135,6 +142,11 @@ class NoneStepTrace(NamedTuple):
 
         return NoneStepTrace(Trace.from_FENs(Indexable(Mappable.concatenated(trace.fens)).indexed(indice)), indice)
 
+    def extended(self, indice: list[int], fens: list[str]) -> NoneStepTrace:
+        return NoneStepTrace(
+            MappableTrace._make(self.trace).concatenated(Trace.from_FENs(fens)), list(self.indice) + indice
+        )
+
     def only_FEN_leaved(self) -> NoneStepTrace:
         return NoneStepTrace(
             Trace(
@@ -191,6 +203,87 @@ class SplitableTrace(Trace):
         )
 
 
+class ColumnarTrace(NamedTuple):
+    fens: RaggedArray
+    sans: RaggedArray
+    results: RaggedArray
+    fen_table: PositionTable
+    san_table: InternTable
+
+    @classmethod
+    def from_trace(cls, trace: Trace) -> ColumnarTrace:
+        fen_table: PositionTable = positions.current()
+        san_table: InternTable = InternTable.empty()
+
+        return ColumnarTrace(
+            RaggedArray.from_nested("l", trace.fens, fen_table.interned_all),
+            RaggedArray.from_nested("l", trace.sans, san_table.interned_all),
+            RaggedArray.from_nested("f", trace.results),
+            fen_table,
+            san_table,
+        )
+
+    def to_trace(self) -> Trace:
+        return Trace(
+            self.fens.to_nested(self.fen_table.looked_up),
+            self.sans.to_nested(self.san_table.looked_up),
+            self.results.to_nested(),
+        )
+
+    def mapped(self, mapper: Callable[[RaggedArray], RaggedArray]) -> ColumnarTrace:
+        return ColumnarTrace(mapper(self.fens), mapper(self.sans), mapper(self.results), self.fen_table, self.san_table)
+
+    def indexed(self, indice: Iterable[int]) -> ColumnarTrace:
+        return self.mapped(lambda x: x.gathered(indice))
+
+    def inner_even_indexed(self) -> ColumnarTrace:
+        return self.mapped(lambda x: x.strided(0))
+
+    def inner_odd_indexed(self) -> ColumnarTrace:
+        return self.mapped(lambda x: x.strided(1))
+
+    def to_color_indice(self, color: str) -> list[int]:
+        return list(compress(range(self.fens.length()), self.fen_table.colored(self.fens.firsts(), color)))
+
+    def colored(self, color: str) -> ColumnarTrace:
+        return self.indexed(self.to_color_indice(color))
+
+    def not_empty_indexed(self) -> ColumnarTrace:
+        return self.indexed(self.fens.to_not_empty_indice())
+
+    def SAN_normalized(self) -> ColumnarTrace:
+        return ColumnarTrace(
+            self.fens,
+            self.sans.truncated(
+                map(lambda x, y: max(y - 1, 0) if x != y + 1 else y, self.fens.lengths(), self.sans.lengths())
+            ),
+            self.results,
+            self.fen_table,
+            self.san_table,
+        )
+
+    def corrected(self) -> ColumnarTrace:
+        return self.not_empty_indexed().SAN_normalized()
+
+    def concatenated(self, other: ColumnarTrace) -> ColumnarTrace:
+        return ColumnarTrace(
+            self.fens.concatenated(other.fens),
+            self.sans.concatenated(other.sans),
+            self.results.concatenated(other.results),
+            self.fen_table,
+            self.san_table,
+        )
+
+    def splited_with_color_turn(self) -> ColoredTrace:
+        white: ColumnarTrace = self.colored("w")
+        black: ColumnarTrace = self.colored("b")
+
+        return ColoredTrace(
+            white.inner_even_indexed().corrected().concatenated(black.inner_odd_indexed().corrected()).to_trace(),
+            black.inner_even_indexed().corrected().concatenated(white.inner_odd_indexed().corrected()).to_trace(),
+        )
+
+
 class OneStepTrace(NamedTuple):
     next_trace: Trace
     indice: Iterable[int]
@@ -222,7 +315,9 @@ class MovableTrace(Trace):
         fens = Mappable.concatenated(self.fens)
         results, legal_moves = await status.status(fens)
         secondary_indice: list[int] = Enumerable(results).to_conditional_indice(lambda x: x == 0)
-        next_fens, next_sans = await movement.movement(Indexable(fens).indexed(secondary_indice), legal_moves)
+        next_fens, next_sans = await movement.movement(
+            Indexable(fens).indexed(secondary_indice), Indexable(legal_moves).indexed(secondary_indice)
+        )
 
         return Trace.from_unwrapped(next_fens, next_sans, results), secondary_indice
 
@@ -239,6 +334,26 @@ class MovableTrace(Trace):
         )
 
 
+class AppendableTrace(Trace):
+    @classmethod
+    def from_trace(cls, trace: Trace) -> AppendableTrace:
+        return AppendableTrace(*map(lambda x: Mappable(x).mapped(list), trace))
+
+    def appended(self, step: OneStepTrace) -> AppendableTrace:
+        for inner, (indice, disjoint) in zip(self, step.to_disjoint()):
+            for i, value in zip(indice, disjoint):
+                inner[i].extend(value)
+
+        return self
+
+    def frozen(self) -> MovableTrace:
+        return MovableTrace._make(self)
+
+    @classmethod
+    def empty(cls, length: int) -> AppendableTrace:
+        return AppendableTrace(*([[] for _ in range(length)] for _ in range(3)))
+
+
 class MovableNoneStepTrace(NoneStepTrace):
     async def moved(self, status: IStatus, movement: IMovement) -> MovableNoneStepTrace:
         if self.trace.empty():
@@ -255,15 +370,26 @@ class MovableNoneStepTrace(NoneStepTrace):
         return MovableNoneStepTrace(await MovableTrace._make(self.trace).to_last_update(status), self.indice)
 
 
+async def paired(white: Awaitable[NoneStepTrace], black: Awaitable[NoneStepTrace]) -> list[NoneStepTrace]:
+    tasks: list[Task] = [create_task(white), create_task(black)]
+
+    try:
+        return await gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 class OneStepProduct(NamedTuple):
-    trace: MovableTrace
+    trace: AppendableTrace
     white: NoneStepTrace
     black: NoneStepTrace
 
     @classmethod
-    def from_trace(cls, trace: MovableTrace) -> OneStepProduct:
+    def from_trace(cls, trace: Trace) -> OneStepProduct:
         return OneStepProduct(
-            trace,
+            AppendableTrace.from_trace(trace),
             NoneStepTrace.from_trace_with_color(trace, "w"),
             NoneStepTrace.from_trace_with_color(trace, "b"),
         )
@@ -274,9 +400,8 @@ class OneStepProduct(NamedTuple):
 
     def moved(self, next_white: NoneStepTrace, next_black: NoneStepTrace) -> OneStepProduct:
         return OneStepProduct(
-            self.trace.moved(
-                OneStepTrace.from_none_step_with_prev_indice(next_white, self.white.indice),
-                OneStepTrace.from_none_step_with_prev_indice(next_black, self.black.indice),
+            self.trace.appended(OneStepTrace.from_none_step_with_prev_indice(next_white, self.white.indice)).appended(
+                OneStepTrace.from_none_step_with_prev_indice(next_black, self.black.indice)
             ),
             next_black.only_FEN_leaved(),
             next_white.only_FEN_leaved(),
@@ -286,19 +411,58 @@ class OneStepProduct(NamedTuple):
         self, status: IStatus, movement_white: IMovement, movement_black: IMovement
     ) -> OneStepProduct:
         return self.moved(
-            await MovableNoneStepTrace._make(self.white).moved(status, movement_white),
-            await MovableNoneStepTrace._make(self.black).moved(status, movement_black),
+            *await paired(
+                MovableNoneStepTrace._make(self.white).moved(status, movement_white),
+                MovableNoneStepTrace._make(self.black).moved(status, movement_black),
+            )
         )
 
     async def none_step_produced(self, status: IStatus) -> OneStepProduct:
         return self.moved(
-            await MovableNoneStepTrace._make(self.white).last_status_updated(status),
-            await MovableNoneStepTrace._make(self.black).last_status_updated(status),
+            *await paired(
+                MovableNoneStepTrace._make(self.white).last_status_updated(status),
+                MovableNoneStepTrace._make(self.black).last_status_updated(status),
+            )
         )
 
     def empty(self) -> bool:
         return self.white.indice == [] and self.black.indice == []
 
+    def drained(self) -> tuple[Trace, OneStepProduct]:
+        return Trace._make(self.trace), OneStepProduct(
+            AppendableTrace.empty(len(self.trace.fens)), self.white, self.black
+        )
+
+    def to_finished_slots(self, games: list[Optional[int]]) -> list[int]:
+        playing: set[int] = set(self.white.indice).union(self.black.indice)
+
+        return [slot for slot, game in enumerate(games) if game is not None and slot not in playing]
+
+    def cleared(self, slots: list[int]) -> OneStepProduct:
+        for slot in slots:
+            self.trace.fens[slot], self.trace.sans[slot], self.trace.results[slot] = [], [], []
+
+        return self
+
+    def trimmed(self) -> OneStepProduct:
+        for slot in chain(self.white.indice, self.black.indice):
+            self.trace.fens[slot], self.trace.sans[slot] = self.trace.fens[slot][-1:], []
+
+        return self
+
+    def refilled(self, slots: list[int], fens: list[str]) -> OneStepProduct:
+        for slot, fen in zip(slots, fens):
+            self.trace.fens[slot], self.trace.sans[slot], self.trace.results[slot] = [fen], [], []
+
+        whites: list[int] = [i for i, fen in enumerate(fens) if positions.is_colored(fen, "w")]
+        blacks: list[int] = [i for i, fen in enumerate(fens) if positions.is_colored(fen, "b")]
+
+        return OneStepProduct(
+            self.trace,
+            self.white.extended(Indexable(slots).indexed(whites), Indexable(fens).indexed(whites)),
+            self.black.extended(Indexable(slots).indexed(blacks), Indexable(fens).indexed(blacks)),
+        )
+
     def splited(self) -> ColoredTrace:
         return SplitableTrace._make(CorrectableTrace._make(self.trace).end_corrected()).splited_with_color_turn()
 
@@ -310,19 +474,30 @@ class ITraceProducable(ABC):
     ) -> OneStepProduct:
         pass
 
+    @abstractmethod
+    def to_steps(self) -> Iterable[int]:
+        pass
+
 
 class FiniteTraceProducable(int, ITraceProducable):
     async def n_step_produced(
         self, product: OneStepProduct, status: IStatus, movement_white: IMovement, movement_black: IMovement
     ) -> OneStepProduct:
-        for _ in range(self):
+        for step in range(self):
             if product.empty():
                 break
 
-            product = await product.one_step_produced(status, movement_white, movement_black)
+            token: Token = resilience.split(self - step)
+            try:
+                product = await product.one_step_produced(status, movement_white, movement_black)
+            finally:
+                step_deadline.reset(token)
 
         return product
 
+    def to_steps(self) -> Iterable[int]:
+        return range(self)
+
 
 class InfiniteTraceProducable(ITraceProducable):
     async def n_step_produced(
@@ -333,6 +508,9 @@ class InfiniteTraceProducable(ITraceProducable):
 
         return product
 
+    def to_steps(self) -> Iterable[int]:
+        return count()
+
 
 class ProducableTrace(NamedTuple):
     status: IStatus
@@ -348,7 +526,130 @@ class ProducableTrace(NamedTuple):
         if not product.empty():
             product = await product.none_step_produced(self.status)
 
-        return product.trace
+        return product.trace.frozen()
+
+    async def stepped(self, fens: list[str]) -> AsyncIterator[Trace]:
+        product: OneStepProduct = OneStepProduct.from_FENs(fens)
+
+        for _ in self.producable.to_steps():
+            if product.empty():
+                return
+
+            trace, product = (
+                await product.one_step_produced(self.status, self.movement_white, self.movement_black)
+            ).drained()
+            yield trace
+
+        if not product.empty():
+            yield (await product.none_step_produced(self.status)).drained()[0]
 
     async def produced_with_spliting(self, fens: list[str]) -> ColoredTrace:
-        return OneStepProduct.from_trace(await self.produced(fens)).splited()
+        return ColumnarTrace.from_trace(
+            CorrectableTrace._make(await self.produced(fens)).end_corrected()
+        ).splited_with_color_turn()
+
+
+class ITraceCollector(ABC):
+    @abstractmethod
+    def collected(self, game: int, fens: list[str], sans: list[str], results: list[float]) -> None:
+        pass
+
+    def keeps_history(self) -> bool:
+        return True
+
+
+Collector = TypeVar("Collector", bound=ITraceCollector)
+
+
+class TraceCollectorData(NamedTuple):
+    trace: AppendableTrace
+
+
+class TraceCollector(TraceCollectorData, ITraceCollector):
+    @classmethod
+    def from_length(cls, length: int) -> TraceCollector:
+        return TraceCollector(AppendableTrace([[]] * length, [[]] * length, [[]] * length))
+
+    def collected(self, game: int, fens: list[str], sans: list[str], results: list[float]) -> None:
+        self.trace.fens[game], self.trace.sans[game], self.trace.results[game] = fens, sans, results
+
+    def frozen(self) -> MovableTrace:
+        return self.trace.frozen()
+
+
+class ScoreCollector(dict[Score, int], ITraceCollector):
+    def collected(self, game: int, fens: list[str], sans: list[str], results: list[float]) -> None:
+        score: Score = Score.from_results(results)
+        self[score] = self.get(score, 0) + 1
+
+    def keeps_history(self) -> bool:
+        return False
+
+
+class FinishedGame(NamedTuple):
+    game: int
+    fens: list[str]
+    sans: list[str]
+    results: list[float]
+
+
+class FinishedGames(list[FinishedGame], ITraceCollector):
+    def collected(self, game: int, fens: list[str], sans: list[str], results: list[float]) -> None:
+        self.append(FinishedGame(game, fens, sans, results))
+
+
+class WindowedSlots(NamedTuple):
+    games: list[Optional[int]]
+    pending: Iterator[tuple[int, str]]
+
+    @classmethod
+    def from_FENs(cls, fens: Iterable[str], window: int) -> tuple[WindowedSlots, list[str]]:
+        pending: Iterator[tuple[int, str]] = enumerate(fens)
+        started: list[tuple[int, str]] = list(islice(pending, window if window > 0 else None))
+
+        return WindowedSlots([x[0] for x in started], pending), [x[1] for x in started]
+
+    def harvested(self, product: OneStepProduct, collector: ITraceCollector) -> OneStepProduct:
+        finished: list[int] = product.to_finished_slots(self.games)
+
+        for slot in finished:
+            collector.collected(
+                self.games[slot], product.trace.fens[slot], product.trace.sans[slot], product.trace.results[slot]
+            )
+
+        refills: list[tuple[int, str]] = list(islice(self.pending, len(finished)))
+
+        for slot, (game, _) in zip(finished, refills):
+            self.games[slot] = game
+        for slot in finished[len(refills) :]:
+            self.games[slot] = None
+
+        return product.cleared(finished).refilled(finished[: len(refills)], [x[1] for x in refills])
+
+
+class WindowedProducableTrace(NamedTuple):
+    status: IStatus
+    movement_white: IMovement
+    movement_black: IMovement
+    window: int
+
+    async def finished(self, fens: Iterable[str], history: bool = True) -> AsyncIterator[FinishedGame]:
+        slots, started = WindowedSlots.from_FENs(fens, self.window)
+        product: OneStepProduct = OneStepProduct.from_FENs(started)
+
+        while not product.empty():
+            games: FinishedGames = FinishedGames()
+            product = await product.one_step_produced(self.status, self.movement_white, self.movement_black)
+            product = slots.harvested(product if history else product.trimmed(), games)
+
+            for game in games:
+                yield game
+
+    async def collected(self, fens: Iterable[str], collector: Collector) -> Collector:
+        async for game in self.finished(fens, collector.keeps_history()):
+            collector.collected(*game)
+
+        return collector
+
+    async def produced(self, fens: list[str]) -> MovableTrace:
+        return (await self.collected(fens, TraceCollector.from_length(len(fens)))).frozen()
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import Union
+from typing import AsyncIterator, Literal, NamedTuple, Optional, Union
 
 from pydantic import AnyHttpUrl, BaseModel
 from pydantic.fields import Field
@@ -12,8 +12,9 @@ from submodules.fastapi_haljson.src.halmodel import HALBase
 
 
 class PlayerInternal(BaseModel):
-    url_env: AnyHttpUrl
+    url_env: Union[Literal["local"], AnyHttpUrl]
     routes: dict[str, str]
+    measurement_window: int = 0
 
 
 class PlayerAPIInfo(BaseModel):
@@ -27,6 +28,16 @@ class PlayerAIInfo(BaseModel):
         description="URL of AI server to get next SANs",
         example="http://localhost:6011/ai",
     )
+    deterministic: bool = Field(
+        False,
+        description="Whether the AI always returns the same SAN for the same FEN",
+        example=False,
+    )
+    move_ids: bool = Field(
+        False,
+        description="Whether the AI exchanges legal moves as ids of the global move table instead of strings",
+        example=False,
+    )
 
 
 class PlayerTrajectoryRequest(BaseModel):
@@ -130,6 +141,21 @@ class PlayerGameResponse(HALBase):
     )
 
 
+class PlayerGameStreamRequest(PlayerGameRequest):
+    playtime: int = Field(
+        1,
+        description="Number of games to play",
+        example=2,
+        ge=1,
+    )
+    window: int = Field(
+        0,
+        description="Maximum number of games played at once; 0 plays all at once",
+        example=0,
+        ge=0,
+    )
+
+
 class PlayerMeasurementRequest(BaseModel):
     white: PlayerAIInfo = Field(
         ...,
@@ -145,6 +171,12 @@ class PlayerMeasurementRequest(BaseModel):
         example=4,
         ge=1,
     )
+    window: Optional[int] = Field(
+        None,
+        description="Maximum number of games played at once; defaults to the server setting",
+        example=2,
+        ge=1,
+    )
 
 
 class PlayerAIMeasurement(BaseModel):
@@ -181,6 +213,46 @@ class PlayerMeasurementResponse(HALBase):
     )
 
 
+class PlayerMeasurementJobResponse(BaseModel):
+    id: str = Field(
+        ...,
+        description="Job ID to poll or cancel the measurement",
+        example="0f8fad5bd9cb469fa16570867728950e",
+    )
+    state: Literal["queued", "running", "done", "failed", "cancelled"] = Field(
+        ...,
+        description="State of the measurement",
+        example="running",
+    )
+    playtime: int = Field(
+        ...,
+        description="Number of plays requested",
+        example=4,
+    )
+    finished: int = Field(
+        ...,
+        description="Number of plays finished so far",
+        example=2,
+    )
+    white: PlayerAIMeasurement = Field(
+        ...,
+        description="Measurement of white-side AI so far",
+    )
+    black: PlayerAIMeasurement = Field(
+        ...,
+        description="Measurement of black-side AI so far",
+    )
+    throughput: float = Field(
+        ...,
+        description="Finished plays per second since the measurement started running",
+        example=0.5,
+    )
+    message: Optional[str] = Field(
+        None,
+        description="Error message of a failed measurement",
+    )
+
+
 class PlayerErrorResponse(HALBase):
     message: str = Field(
         ...,
@@ -198,6 +270,7 @@ class PlayerErrorResponse(HALBase):
         tuple[list[str], PlayerAIInfo, PlayerAIInfo, int],
         tuple[PlayerAIInfo, PlayerAIInfo],
         tuple[PlayerAIInfo, PlayerAIInfo, int],
+        tuple[PlayerAIInfo, PlayerAIInfo, int, Optional[int]],
     ] = Field(
         ...,
         description="Values of request",
@@ -214,3 +287,54 @@ class PlayerRequestErrorResponse(PlayerErrorResponse):
 
 class PlayerHTTPStatusErrorResponse(PlayerErrorResponse):
     pass
+
+
+class PlayerTrajectoryStep(BaseModel):
+    fens: list[list[str]] = Field(
+        ...,
+        description="FENs reached by each trajectory in this step",
+    )
+    sans: list[list[str]] = Field(
+        ...,
+        description="SANs played by each trajectory in this step",
+    )
+    results: list[list[float]] = Field(
+        ...,
+        description="Results of each trajectory in this step",
+    )
+
+
+class PlayerStreamedGame(BaseModel):
+    game: int = Field(
+        ...,
+        description="Index of the finished game",
+        example=0,
+    )
+    fens: list[str] = Field(
+        ...,
+        description="List of FENs in episode",
+    )
+    sans: list[str] = Field(
+        ...,
+        description="List of SANs in episode",
+    )
+    result: str = Field(
+        ...,
+        description="Result of episode",
+        example="1/2-1/2",
+    )
+
+
+class PlayerStreamError(BaseModel):
+    message: str = Field(
+        ...,
+        description="Error message",
+    )
+    error: str = Field(
+        ...,
+        description="Error type",
+    )
+
+
+class PlayerStreamResponse(NamedTuple):
+    items: AsyncIterator[Union[PlayerTrajectoryStep, PlayerStreamedGame, PlayerStreamError]]
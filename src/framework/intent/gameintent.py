@@ -8,8 +8,7 @@ from typing import Any, Callable, NamedTuple, Union
 
 from src.converter.requestconverter import GameRequestToModel
 from src.converter.responseconverter import GameResponseToDTO, HTTPStatusErrorResponseToDTO, RequestErrorResponseToDTO
-from src.core.event import EventAGen, PopEvent
-from src.core.intent import Intent, IntentData
+from src.core.intent import DirectIntent, IntentData
 from src.framework.dto.playerdto import (
     PlayerGameRequest,
     PlayerGameResponse,
@@ -50,10 +49,9 @@ class GameResponsableToDTO(NamedTuple):
         return self.converters[type(model).__name__](model).convert()
 
 
-class GameIntent(IntentData, Intent[PlayerGameRequest, ResponseType, GameRequestModel, GameResponsableModel]):
-    async def executed(self, request: PlayerGameRequest) -> EventAGen:
-        yield PopEvent(
-            GameResponsableToDTO.from_request_dto(request).convert(
-                (yield await self.usecase.request(GameRequestToModel.from_dto(request).convert()))
-            )
-        )
+class GameIntent(IntentData, DirectIntent[PlayerGameRequest, ResponseType, GameRequestModel, GameResponsableModel]):
+    def requested(self, request: PlayerGameRequest) -> GameRequestModel:
+        return GameRequestToModel.from_dto(request).convert()
+
+    def responded(self, request: PlayerGameRequest, response: GameResponsableModel) -> ResponseType:
+        return GameResponsableToDTO.from_request_dto(request).convert(response)
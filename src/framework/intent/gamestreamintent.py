@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple, Union
+
+from src.converter.requestconverter import GameStreamRequestToModel
+from src.converter.responseconverter import (
+    HTTPStatusErrorResponseToDTO,
+    RequestErrorResponseToDTO,
+    StreamResponseToDTO,
+)
+from src.core.intent import DirectIntent, IntentData
+from src.framework.dto.playerdto import (
+    PlayerHTTPStatusErrorResponse,
+    PlayerRequestErrorResponse,
+    PlayerStreamResponse,
+    PlayerGameStreamRequest,
+)
+from src.model.requestmodel import GameStreamRequestModel
+from src.model.responsemodel import StreamResponsableModel
+
+ResponseType = Union[PlayerStreamResponse, PlayerRequestErrorResponse, PlayerHTTPStatusErrorResponse]
+
+
+class GameStreamResponsableToDTO(NamedTuple):
+    converters: dict[
+        str,
+        Union[
+            Callable[[Any], StreamResponseToDTO],
+            Callable[[Any], RequestErrorResponseToDTO],
+            Callable[[Any], HTTPStatusErrorResponseToDTO],
+        ],
+    ]
+
+    @classmethod
+    def from_request_dto(cls, request_dto: PlayerGameStreamRequest) -> GameStreamResponsableToDTO:
+        return GameStreamResponsableToDTO(
+            {
+                "StreamResponseModel": (lambda model: StreamResponseToDTO.from_model(model)),
+                "RequestErrorResponseModel": (
+                    lambda model: RequestErrorResponseToDTO.from_model_with_request_dto(model, request_dto)
+                ),
+                "HTTPStatusErrorResponseModel": (
+                    lambda model: HTTPStatusErrorResponseToDTO.from_model_with_request_dto(model, request_dto)
+                ),
+            }
+        )
+
+    def convert(self, model: StreamResponsableModel) -> ResponseType:
+        return self.converters[type(model).__name__](model).convert()
+
+
+class GameStreamIntent(
+    IntentData,
+    DirectIntent[PlayerGameStreamRequest, ResponseType, GameStreamRequestModel, StreamResponsableModel],
+):
+    def requested(self, request: PlayerGameStreamRequest) -> GameStreamRequestModel:
+        return GameStreamRequestToModel.from_dto(request).convert()
+
+    def responded(self, request: PlayerGameStreamRequest, response: StreamResponsableModel) -> ResponseType:
+        return GameStreamResponsableToDTO.from_request_dto(request).convert(response)
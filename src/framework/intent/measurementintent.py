@@ -12,8 +12,7 @@ from src.converter.responseconverter import (
     MeasurementResponseToDTO,
     RequestErrorResponseToDTO,
 )
-from src.core.event import EventAGen, PopEvent
-from src.core.intent import Intent, IntentData
+from src.core.intent import DirectIntent, IntentData
 from src.framework.dto.playerdto import (
     PlayerHTTPStatusErrorResponse,
     PlayerMeasurementRequest,
@@ -55,11 +54,11 @@ class MeasurementResponsableToDTO(NamedTuple):
 
 
 class MeasurementIntent(
-    IntentData, Intent[PlayerMeasurementRequest, ResponseType, MeasurementRequestModel, MeasurementResponsableModel]
+    IntentData,
+    DirectIntent[PlayerMeasurementRequest, ResponseType, MeasurementRequestModel, MeasurementResponsableModel],
 ):
-    async def executed(self, request: PlayerMeasurementRequest) -> EventAGen:
-        yield PopEvent(
-            MeasurementResponsableToDTO.from_request_dto(request).convert(
-                (yield await self.usecase.request(MeasurementRequestToModel.from_dto(request).convert()))
-            )
-        )
+    def requested(self, request: PlayerMeasurementRequest) -> MeasurementRequestModel:
+        return MeasurementRequestToModel.from_dto(request).convert()
+
+    def responded(self, request: PlayerMeasurementRequest, response: MeasurementResponsableModel) -> ResponseType:
+        return MeasurementResponsableToDTO.from_request_dto(request).convert(response)
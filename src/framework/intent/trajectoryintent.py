@@ -12,8 +12,7 @@ from src.converter.responseconverter import (
     RequestErrorResponseToDTO,
     TrajectoryResponseToDTO,
 )
-from src.core.event import EventAGen, PopEvent
-from src.core.intent import Intent, IntentData
+from src.core.intent import DirectIntent, IntentData
 from src.framework.dto.playerdto import (
     PlayerHTTPStatusErrorResponse,
     PlayerRequestErrorResponse,
@@ -56,11 +55,10 @@ class TrajectoryResponsableToDTO(NamedTuple):
 
 class TrajectoryIntent(
     IntentData,
-    Intent[PlayerTrajectoryRequest, ResponseType, TrajectoryRequestModel, TrajectoryResponsableModel],
+    DirectIntent[PlayerTrajectoryRequest, ResponseType, TrajectoryRequestModel, TrajectoryResponsableModel],
 ):
-    async def executed(self, request: PlayerTrajectoryRequest) -> EventAGen:
-        yield PopEvent(
-            TrajectoryResponsableToDTO.from_request_dto(request).convert(
-                (yield await self.usecase.request(TrajectoryRequestToModel.from_dto(request).convert()))
-            )
-        )
+    def requested(self, request: PlayerTrajectoryRequest) -> TrajectoryRequestModel:
+        return TrajectoryRequestToModel.from_dto(request).convert()
+
+    def responded(self, request: PlayerTrajectoryRequest, response: TrajectoryResponsableModel) -> ResponseType:
+        return TrajectoryResponsableToDTO.from_request_dto(request).convert(response)
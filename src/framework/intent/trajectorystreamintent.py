@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple, Union
+
+from src.converter.requestconverter import TrajectoryRequestToModel
+from src.converter.responseconverter import (
+    HTTPStatusErrorResponseToDTO,
+    RequestErrorResponseToDTO,
+    StreamResponseToDTO,
+)
+from src.core.intent import DirectIntent, IntentData
+from src.framework.dto.playerdto import (
+    PlayerHTTPStatusErrorResponse,
+    PlayerRequestErrorResponse,
+    PlayerStreamResponse,
+    PlayerTrajectoryRequest,
+)
+from src.model.requestmodel import TrajectoryRequestModel
+from src.model.responsemodel import StreamResponsableModel
+
+ResponseType = Union[PlayerStreamResponse, PlayerRequestErrorResponse, PlayerHTTPStatusErrorResponse]
+
+
+class TrajectoryStreamResponsableToDTO(NamedTuple):
+    converters: dict[
+        str,
+        Union[
+            Callable[[Any], StreamResponseToDTO],
+            Callable[[Any], RequestErrorResponseToDTO],
+            Callable[[Any], HTTPStatusErrorResponseToDTO],
+        ],
+    ]
+
+    @classmethod
+    def from_request_dto(cls, request_dto: PlayerTrajectoryRequest) -> TrajectoryStreamResponsableToDTO:
+        return TrajectoryStreamResponsableToDTO(
+            {
+                "StreamResponseModel": (lambda model: StreamResponseToDTO.from_model(model)),
+                "RequestErrorResponseModel": (
+                    lambda model: RequestErrorResponseToDTO.from_model_with_request_dto(model, request_dto)
+                ),
+                "HTTPStatusErrorResponseModel": (
+                    lambda model: HTTPStatusErrorResponseToDTO.from_model_with_request_dto(model, request_dto)
+                ),
+            }
+        )
+
+    def convert(self, model: StreamResponsableModel) -> ResponseType:
+        return self.converters[type(model).__name__](model).convert()
+
+
+class TrajectoryStreamIntent(
+    IntentData,
+    DirectIntent[PlayerTrajectoryRequest, ResponseType, TrajectoryRequestModel, StreamResponsableModel],
+):
+    def requested(self, request: PlayerTrajectoryRequest) -> TrajectoryRequestModel:
+        return TrajectoryRequestToModel.from_dto(request).convert()
+
+    def responded(self, request: PlayerTrajectoryRequest, response: StreamResponsableModel) -> ResponseType:
+        return TrajectoryStreamResponsableToDTO.from_request_dto(request).convert(response)
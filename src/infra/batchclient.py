@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import Future, Semaphore, Task, TimerHandle, gather, get_running_loop
+from dataclasses import dataclass, field
+from itertools import accumulate, chain
+from typing import Any, NamedTuple, Optional
+
+from src.infra.hostlimit import Priority, request_priority
+from src.infra.postclient import PostClient
+from src.infra.resilience import request_deadline, resilience, step_deadline
+
+
+class CoalescingConfig(NamedTuple):
+    window: float = 0.0
+    max_batch: int = 0
+
+
+class ChunkingConfig(NamedTuple):
+    max_chunk: int = 0
+    concurrency: int = 4
+
+
+class BatchPayload(list[dict[str, Any]]):
+    @classmethod
+    def size_of(cls, payload: dict[str, Any]) -> int:
+        return next((len(x) for x in payload.values() if isinstance(x, list)), 0)
+
+    @classmethod
+    def chunked(cls, payload: dict[str, Any], max_chunk: int) -> BatchPayload:
+        total: int = BatchPayload.size_of(payload)
+
+        return BatchPayload(
+            {
+                key: value[start : start + max_chunk] if isinstance(value, list) and len(value) == total else value
+                for key, value in payload.items()
+            }
+            for start in range(0, total, max_chunk)
+        )
+
+    def sizes(self) -> list[int]:
+        return [BatchPayload.size_of(x) for x in self]
+
+    def merged(self) -> dict[str, Any]:
+        return {
+            key: list(chain.from_iterable(x[key] for x in self)) if isinstance(value, list) else value
+            for key, value in self[0].items()
+        }
+
+    def splited(self, response: dict[str, Any]) -> list[dict[str, Any]]:
+        total: int = sum(self.sizes())
+        bounds: list[int] = [0] + list(accumulate(self.sizes()))
+
+        return [
+            {
+                key: value[bounds[i] : bounds[i + 1]] if isinstance(value, list) and len(value) == total else value
+                for key, value in response.items()
+            }
+            for i in range(len(self))
+        ]
+
+
+class PendingBatch(NamedTuple):
+    payload: BatchPayload
+    futures: list[Future]
+    deadlines: list[Optional[float]]
+    timer: TimerHandle
+
+    def deadline(self) -> Optional[float]:
+        return None if None in self.deadlines else max(self.deadlines)
+
+
+@dataclass
+class Coalescer:
+    config: CoalescingConfig = CoalescingConfig()
+    pending: dict[tuple[str, Priority], PendingBatch] = field(default_factory=dict)
+    sending: set[Task] = field(default_factory=set)
+
+    def configure(self, config: CoalescingConfig) -> None:
+        self.config = config
+
+    def enabled(self) -> bool:
+        return self.config.window > 0
+
+    async def posted(self, url: str, data: dict[str, Any]) -> dict[str, Any]:
+        future: Future = get_running_loop().create_future()
+        key: tuple[str, Priority] = (url, request_priority.get())
+
+        if key not in self.pending:
+            self.pending[key] = PendingBatch(
+                BatchPayload(), [], [], get_running_loop().call_later(self.config.window, self.flush, key)
+            )
+
+        batch: PendingBatch = self.pending[key]
+        batch.payload.append(data)
+        batch.futures.append(future)
+        batch.deadlines.append(resilience.deadline())
+
+        if 0 < self.config.max_batch <= sum(batch.payload.sizes()):
+            self.flush(key)
+
+        return await future
+
+    def flush(self, key: tuple[str, Priority]) -> None:
+        batch: PendingBatch = self.pending.pop(key)
+        batch.timer.cancel()
+
+        task: Task = get_running_loop().create_task(self.sent(key, batch))
+        self.sending.add(task)
+        task.add_done_callback(self.sending.discard)
+
+    async def sent(self, key: tuple[str, Priority], batch: PendingBatch) -> None:
+        url, priority = key
+        request_priority.set(priority)
+        request_deadline.set(batch.deadline())
+        step_deadline.set(None)
+
+        try:
+            responses: list[dict[str, Any]] = batch.payload.splited(
+                await ChunkedPostClient(url).post(batch.payload.merged())
+            )
+        except Exception as ex:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for future, response in zip(batch.futures, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+coalescer: Coalescer = Coalescer()
+
+
+@dataclass
+class Chunker:
+    config: ChunkingConfig = ChunkingConfig()
+
+    def configure(self, config: ChunkingConfig) -> None:
+        self.config = config
+
+    def is_chunked(self, data: dict[str, Any]) -> bool:
+        return 0 < self.config.max_chunk < BatchPayload.size_of(data)
+
+    async def posted(self, url: str, data: dict[str, Any]) -> dict[str, Any]:
+        chunks: BatchPayload = BatchPayload.chunked(data, self.config.max_chunk)
+        semaphore: Semaphore = Semaphore(max(self.config.concurrency, 1))
+
+        async def sent(chunk: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await PostClient(url).post(chunk)
+
+        return BatchPayload(await gather(*map(sent, chunks))).merged()
+
+
+chunker: Chunker = Chunker()
+
+
+class ChunkedPostClient(str):
+    async def post(self, data: dict[str, Any]) -> dict[str, Any]:
+        if chunker.is_chunked(data):
+            return await chunker.posted(self, data)
+
+        return await PostClient(self).post(data)
+
+
+class BatchPostClient(str):
+    async def post(self, data: dict[str, Any]) -> dict[str, Any]:
+        if coalescer.enabled():
+            return await coalescer.posted(self, data)
+
+        return await ChunkedPostClient(self).post(data)
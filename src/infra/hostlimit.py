@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from math import floor
+from typing import Awaitable, Callable, NamedTuple, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+
+class Priority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+request_priority: ContextVar[Priority] = ContextVar("request_priority", default=Priority.BULK)
+
+
+class PriorityConfig(NamedTuple):
+    interactive_weight: int = 3
+    bulk_weight: int = 1
+    bulk_share: float = 0.5
+
+    def weight(self, priority: Priority) -> int:
+        return max(self.interactive_weight if priority is Priority.INTERACTIVE else self.bulk_weight, 1)
+
+
+@dataclass
+class HostQueue:
+    limit: int
+    config: PriorityConfig = PriorityConfig()
+    inflight: dict[Priority, int] = field(default_factory=lambda: {x: 0 for x in Priority})
+    waiters: dict[Priority, deque[Future]] = field(default_factory=lambda: {x: deque() for x in Priority})
+    passes: dict[Priority, float] = field(default_factory=lambda: {x: 0.0 for x in Priority})
+
+    def is_waited(self) -> bool:
+        return any(len(x) > 0 for x in self.waiters.values())
+
+    def is_allowed(self, priority: Priority) -> bool:
+        if sum(self.inflight.values()) >= self.limit:
+            return False
+        if priority is Priority.BULK and len(self.waiters[Priority.INTERACTIVE]) > 0:
+            return self.inflight[Priority.BULK] < max(floor(self.limit * self.config.bulk_share), 1)
+
+        return True
+
+    def waited(self, priority: Priority) -> Future:
+        self.passes[priority] = max(
+            self.passes[priority],
+            min((self.passes[x] for x in Priority if len(self.waiters[x]) > 0), default=self.passes[priority]),
+        )
+        future: Future = get_running_loop().create_future()
+        self.waiters[priority].append(future)
+
+        return future
+
+    def granted(self) -> None:
+        while True:
+            allowed: list[Priority] = [x for x in Priority if len(self.waiters[x]) > 0 and self.is_allowed(x)]
+
+            if len(allowed) == 0:
+                return
+
+            priority: Priority = min(allowed, key=self.passes.__getitem__)
+            self.passes[priority] += 1 / self.config.weight(priority)
+            self.inflight[priority] += 1
+            self.waiters[priority].popleft().set_result(None)
+
+    async def acquired(self, priority: Priority) -> None:
+        if not self.is_waited() and self.is_allowed(priority):
+            self.inflight[priority] += 1
+            return
+
+        future: Future = self.waited(priority)
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                self.released(priority)
+            else:
+                self.waiters[priority].remove(future)
+                self.granted()
+            raise
+
+    def released(self, priority: Priority) -> None:
+        self.inflight[priority] -= 1
+        self.granted()
+
+
+@dataclass
+class HostLimiter:
+    limit: int = 0
+    config: PriorityConfig = PriorityConfig()
+    queues: dict[str, HostQueue] = field(default_factory=dict)
+
+    def configure(self, limit: int, config: PriorityConfig = PriorityConfig()) -> None:
+        self.limit, self.config, self.queues = limit, config, {}
+
+    def queue(self, url: str) -> HostQueue:
+        origin: str = urlsplit(url).netloc
+
+        if origin not in self.queues:
+            self.queues[origin] = HostQueue(self.limit, self.config)
+
+        return self.queues[origin]
+
+    async def limited(self, url: str, call: Callable[[], Awaitable[T]]) -> T:
+        if self.limit <= 0:
+            return await call()
+
+        queue: HostQueue = self.queue(url)
+        priority: Priority = request_priority.get()
+
+        await queue.acquired(priority)
+        try:
+            return await call()
+        finally:
+            queue.released(priority)
+
+
+host_limiter: HostLimiter = HostLimiter()
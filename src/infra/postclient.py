@@ -2,16 +2,88 @@
 
 # SPDX-License-Identifier: MIT
 
-from typing import Any
+from __future__ import annotations
 
-from httpx import AsyncClient, Response
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+from httpx import AsyncClient, Limits, Response
+from src.infra.hostlimit import host_limiter
+from src.infra.replica import replicas
+from src.infra.resilience import resilience
+from src.infra.wireformat import WireFormat, wire_negotiation
+
+
+class ClientLimits(NamedTuple):
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    timeout: float = 1.0
+
+    def to_limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class ClientPool:
+    limits: ClientLimits = ClientLimits()
+    clients: dict[str, AsyncClient] = field(default_factory=dict)
+    opened: bool = False
+
+    def open(self, limits: ClientLimits = ClientLimits()) -> None:
+        self.limits = limits
+        self.opened = True
+
+    async def close(self) -> None:
+        self.opened = False
+        clients, self.clients = self.clients, {}
+
+        for client in clients.values():
+            await client.aclose()
+
+    def client(self, url: str) -> AsyncClient:
+        origin: str = urlsplit(url).netloc
+
+        if origin not in self.clients:
+            self.clients[origin] = AsyncClient(limits=self.limits.to_limits())
+
+        return self.clients[origin]
+
+
+client_pool: ClientPool = ClientPool()
 
 
 class PostClient(str):
     async def post(self, data: dict[str, Any]) -> dict[str, Any]:
-        async with AsyncClient() as client:
-            response: Response = await client.post(url=self, json=data, timeout=1.0)
+        request_format: WireFormat = wire_negotiation.request_format(self)
+        content: bytes = request_format.dumps(data)
+        headers: dict[str, str] = wire_negotiation.headers(request_format)
+
+        response: Response = await resilience.posted(
+            self, lambda: replicas.sent(self, lambda url: PostClient(url).sent(content, headers))
+        )
+
+        return wire_negotiation.decoded(self, response)
+
+    async def sent(self, content: bytes, headers: dict[str, str]) -> Response:
+        return await host_limiter.limited(self, lambda: self.requested(content, headers))
+
+    async def requested(self, content: bytes, headers: dict[str, str]) -> Response:
+        timeout: float = resilience.timeout(self, client_pool.limits.timeout)
+
+        if client_pool.opened:
+            response: Response = await client_pool.client(self).post(
+                url=self, content=content, headers=headers, timeout=timeout
+            )
+        else:
+            async with AsyncClient() as client:
+                response = await client.post(url=self, content=content, headers=headers, timeout=timeout)
 
         response.raise_for_status()
 
-        return response.json()
+        return response
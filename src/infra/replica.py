@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from dataclasses import dataclass, field
+from random import sample
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from httpx import HTTPStatusError, Response, TransportError
+
+
+class EjectionConfig(NamedTuple):
+    failures: int = 3
+    duration: float = 5.0
+
+
+@dataclass
+class Replica:
+    url: str
+    outstanding: int = 0
+    failures: int = 0
+    ejected_until: float = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+    def succeeded(self) -> None:
+        self.failures = 0
+
+    def failed(self, now: float, config: EjectionConfig) -> None:
+        self.failures += 1
+
+        if self.failures >= config.failures:
+            self.failures, self.ejected_until = 0, now + config.duration
+
+
+class ReplicaSet(NamedTuple):
+    base: str
+    replicas: list[Replica]
+
+    def picked(self, now: float) -> Replica:
+        healthy: list[Replica] = [x for x in self.replicas if x.is_healthy(now)] or self.replicas
+
+        if len(healthy) == 1:
+            return healthy[0]
+
+        return min(sample(healthy, 2), key=lambda x: x.outstanding)
+
+
+@dataclass
+class Replicas:
+    config: EjectionConfig = EjectionConfig()
+    sets: dict[str, ReplicaSet] = field(default_factory=dict)
+
+    def configure(self, config: EjectionConfig) -> None:
+        self.config, self.sets = config, {}
+
+    def registered(self, base: str, urls: list[str]) -> None:
+        known: dict[str, Replica] = {x.url: x for x in self.sets[base].replicas} if base in self.sets else {}
+        self.sets[base] = ReplicaSet(base, [known.get(url, Replica(url)) for url in dict.fromkeys(urls)])
+
+    def resolved(self, url: str) -> Optional[ReplicaSet]:
+        return next((x for base, x in self.sets.items() if url == base or url.startswith(base + "/")), None)
+
+    def is_failure(self, ex: Exception) -> bool:
+        if isinstance(ex, HTTPStatusError):
+            return ex.response.status_code >= 500
+
+        return isinstance(ex, TransportError)
+
+    async def sent(self, url: str, send: Callable[[str], Awaitable[Response]]) -> Response:
+        replica_set: Optional[ReplicaSet] = self.resolved(url)
+
+        if replica_set is None:
+            return await send(url)
+
+        replica: Replica = replica_set.picked(get_running_loop().time())
+        replica.outstanding += 1
+        try:
+            response: Response = await send(replica.url + url[len(replica_set.base) :])
+        except Exception as ex:
+            if self.is_failure(ex):
+                replica.failed(get_running_loop().time(), self.config)
+            raise
+        finally:
+            replica.outstanding -= 1
+
+        replica.succeeded()
+
+        return response
+
+
+replicas: Replicas = Replicas()
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED, Task, get_running_loop, sleep, wait
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from itertools import count
+from random import uniform
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from httpx import HTTPStatusError, ReadTimeout, Request, Response, TransportError
+
+request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+step_deadline: ContextVar[Optional[float]] = ContextVar("step_deadline", default=None)
+
+
+class ResilienceConfig(NamedTuple):
+    retries: int = 0
+    backoff: float = 0.05
+    max_backoff: float = 1.0
+    hedge_quantile: float = 0.0
+    hedge_min_samples: int = 20
+    request_deadline: float = 0.0
+
+
+@dataclass
+class LatencyWindow:
+    samples: deque = field(default_factory=lambda: deque(maxlen=256))
+
+    def recorded(self, latency: float) -> None:
+        self.samples.append(latency)
+
+    def quantile(self, q: float, min_samples: int) -> Optional[float]:
+        if len(self.samples) < max(min_samples, 1):
+            return None
+
+        ordered: list[float] = sorted(self.samples)
+
+        return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+@dataclass
+class Resilience:
+    config: ResilienceConfig = ResilienceConfig()
+    latencies: dict[str, LatencyWindow] = field(default_factory=dict)
+
+    def configure(self, config: ResilienceConfig) -> None:
+        self.config, self.latencies = config, {}
+
+    def starting_deadline(self) -> Optional[float]:
+        if self.config.request_deadline <= 0:
+            return None
+
+        return get_running_loop().time() + self.config.request_deadline
+
+    def started(self) -> Token:
+        return request_deadline.set(self.starting_deadline())
+
+    def split(self, remaining_steps: int) -> Token:
+        deadline: Optional[float] = request_deadline.get()
+
+        if deadline is None or remaining_steps <= 0:
+            return step_deadline.set(None)
+
+        now: float = get_running_loop().time()
+
+        return step_deadline.set(now + max(deadline - now, 0.0) / remaining_steps)
+
+    def deadline(self) -> Optional[float]:
+        deadlines: list[float] = [x for x in (request_deadline.get(), step_deadline.get()) if x is not None]
+
+        return min(deadlines) if len(deadlines) > 0 else None
+
+    def remaining(self) -> Optional[float]:
+        deadline: Optional[float] = self.deadline()
+
+        return None if deadline is None else deadline - get_running_loop().time()
+
+    def timeout(self, url: str, default: float) -> float:
+        remaining: Optional[float] = self.remaining()
+
+        if remaining is None:
+            return default
+        if remaining <= 0:
+            raise ReadTimeout("Deadline exceeded", request=Request("POST", url))
+
+        return min(default, remaining)
+
+    def is_retryable(self, ex: Exception) -> bool:
+        remaining: Optional[float] = self.remaining()
+
+        if remaining is not None and remaining <= 0:
+            return False
+        if isinstance(ex, HTTPStatusError):
+            return ex.response.status_code == 429 or ex.response.status_code >= 500
+
+        return isinstance(ex, TransportError)
+
+    def backoff(self, attempt: int) -> float:
+        delay: float = uniform(0.0, min(self.config.max_backoff, self.config.backoff * (2**attempt)))
+        remaining: Optional[float] = self.remaining()
+
+        return delay if remaining is None else min(delay, max(remaining, 0.0))
+
+    def hedge_delay(self, url: str) -> Optional[float]:
+        if self.config.hedge_quantile <= 0 or url not in self.latencies:
+            return None
+
+        return self.latencies[url].quantile(self.config.hedge_quantile, self.config.hedge_min_samples)
+
+    async def timed(self, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        started: float = get_running_loop().time()
+        response: Response = await send()
+        self.latencies.setdefault(url, LatencyWindow()).recorded(get_running_loop().time() - started)
+
+        return response
+
+    async def hedged(self, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        delay: Optional[float] = self.hedge_delay(url)
+
+        if delay is None:
+            return await self.timed(url, send)
+
+        pending: set[Task] = {get_running_loop().create_task(self.timed(url, send))}
+
+        try:
+            done, pending = await wait(pending, timeout=delay)
+            if len(done) == 0:
+                pending.add(get_running_loop().create_task(self.timed(url, send)))
+            else:
+                pending = done
+
+            while True:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                succeeded: list[Task] = [x for x in done if x.exception() is None]
+
+                if len(succeeded) > 0:
+                    return succeeded[0].result()
+                if len(pending) == 0:
+                    raise next(iter(done)).exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def posted(self, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        for attempt in count():
+            try:
+                return await self.hedged(url, send)
+            except (HTTPStatusError, TransportError) as ex:
+                if attempt >= self.config.retries or not self.is_retryable(ex):
+                    raise
+
+            await sleep(self.backoff(attempt))
+
+
+resilience: Resilience = Resilience()
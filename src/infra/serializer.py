@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Union, get_args, get_origin, get_type_hints
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PRIMITIVE_TYPES: tuple[type, ...] = (str, int, float, bool, type(None))
+
+
+class JSONSerializer(NamedTuple):
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+    @classmethod
+    def stdlib(cls) -> JSONSerializer:
+        return JSONSerializer("json", lambda x: json.dumps(x, separators=(",", ":")).encode(), json.loads)
+
+    @classmethod
+    def fast(cls) -> JSONSerializer:
+        if orjson is None:
+            return JSONSerializer.stdlib()
+
+        return JSONSerializer("orjson", orjson.dumps, orjson.loads)
+
+    @classmethod
+    def from_name(cls, name: str) -> JSONSerializer:
+        return JSONSerializer.stdlib() if name == "json" else JSONSerializer.fast()
+
+
+@dataclass
+class SerializerSelection:
+    serializer: JSONSerializer = JSONSerializer.fast()
+
+    def use(self, serializer: JSONSerializer) -> None:
+        self.serializer = serializer
+
+    def dumps(self, data: Any) -> bytes:
+        return self.serializer.dumps(data)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.serializer.loads(data)
+
+
+serializer: SerializerSelection = SerializerSelection()
+
+
+def is_primitive_type(annotation: Any) -> bool:
+    if annotation in PRIMITIVE_TYPES:
+        return True
+
+    return get_origin(annotation) in (list, dict, tuple, Union) and all(map(is_primitive_type, get_args(annotation)))
+
+
+@lru_cache(maxsize=None)
+def is_primitive_model(model_type: type[BaseModel]) -> bool:
+    hints: dict[str, Any] = get_type_hints(model_type)
+
+    return all(is_primitive_type(hints[name]) for name in model_type.__fields__)
+
+
+def to_jsonable(data: Any) -> Any:
+    if isinstance(data, BaseModel) and is_primitive_model(type(data)):
+        return data.dict()
+
+    return jsonable_encoder(data)
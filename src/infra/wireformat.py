@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from httpx import Response
+from src.infra.serializer import serializer
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class WireFormat(NamedTuple):
+    content_type: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+    @classmethod
+    def json(cls) -> WireFormat:
+        return WireFormat("application/json", lambda x: serializer.dumps(x), lambda x: serializer.loads(x))
+
+    @classmethod
+    def msgpack(cls) -> Optional[WireFormat]:
+        if msgpack is None:
+            return None
+
+        return WireFormat(
+            "application/msgpack",
+            lambda x: msgpack.packb(x, use_bin_type=True),
+            lambda x: msgpack.unpackb(x, raw=False),
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional[WireFormat]:
+        return WireFormat.msgpack() if name == "msgpack" else None
+
+
+@dataclass
+class WireNegotiation:
+    preferred: Optional[WireFormat] = None
+    supported: set[str] = field(default_factory=set)
+
+    def configure(self, name: str) -> None:
+        self.preferred, self.supported = WireFormat.from_name(name), set()
+
+    def request_format(self, url: str) -> WireFormat:
+        if self.preferred is not None and urlsplit(url).netloc in self.supported:
+            return self.preferred
+
+        return WireFormat.json()
+
+    def headers(self, request_format: WireFormat) -> dict[str, str]:
+        if self.preferred is None:
+            return {"content-type": request_format.content_type}
+
+        return {
+            "content-type": request_format.content_type,
+            "accept": f"{self.preferred.content_type}, application/json;q=0.9",
+        }
+
+    def decoded(self, url: str, response: Response) -> Any:
+        if self.preferred is not None and response.headers.get("content-type", "").startswith(
+            self.preferred.content_type
+        ):
+            self.supported.add(urlsplit(url).netloc)
+
+            return self.preferred.loads(response.content)
+
+        return WireFormat.json().loads(response.content)
+
+
+wire_negotiation: WireNegotiation = WireNegotiation()
@@ -15,12 +15,32 @@ class TrajectoryRequestModel(NamedTuple):
     ai_white: URLString
     ai_black: URLString
     step: int
+    deterministic_white: bool = False
+    deterministic_black: bool = False
+    move_ids_white: bool = False
+    move_ids_black: bool = False
 
 
 class GameRequestModel(NamedTuple):
     env: URLString
     ai_white: URLString
     ai_black: URLString
+    deterministic_white: bool = False
+    deterministic_black: bool = False
+    move_ids_white: bool = False
+    move_ids_black: bool = False
+
+
+class GameStreamRequestModel(NamedTuple):
+    env: URLString
+    ai_white: URLString
+    ai_black: URLString
+    playtime: int
+    deterministic_white: bool = False
+    deterministic_black: bool = False
+    move_ids_white: bool = False
+    move_ids_black: bool = False
+    window: int = 0
 
 
 class MeasurementRequestModel(NamedTuple):
@@ -28,6 +48,11 @@ class MeasurementRequestModel(NamedTuple):
     ai_white: URLString
     ai_black: URLString
     playtime: int
+    deterministic_white: bool = False
+    deterministic_black: bool = False
+    move_ids_white: bool = False
+    move_ids_black: bool = False
+    window: int = 0
 
 
 class NextFENRequestModel(NamedTuple):
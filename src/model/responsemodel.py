@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import NamedTuple, Union
+from typing import AsyncIterator, NamedTuple, Union
 
 
 class TrajectoryResponseModel(NamedTuple):
@@ -19,6 +19,17 @@ class GameResponseModel(NamedTuple):
     result: str
 
 
+class StreamedGameResponseModel(NamedTuple):
+    game: int
+    fens: list[str]
+    sans: list[str]
+    result: str
+
+
+class StreamResponseModel(NamedTuple):
+    responsables: AsyncIterator[NamedTuple]
+
+
 class MeasurementInfo(NamedTuple):
     score: float
     win: int
@@ -64,3 +75,4 @@ class HTTPStatusErrorResponseModel(ErrorResponseModel):
 TrajectoryResponsableModel = Union[TrajectoryResponseModel, RequestErrorResponseModel, HTTPStatusErrorResponseModel]
 GameResponsableModel = Union[GameResponseModel, RequestErrorResponseModel, HTTPStatusErrorResponseModel]
 MeasurementResponsableModel = Union[MeasurementResponseModel, RequestErrorResponseModel, HTTPStatusErrorResponseModel]
+StreamResponsableModel = Union[StreamResponseModel, RequestErrorResponseModel, HTTPStatusErrorResponseModel]
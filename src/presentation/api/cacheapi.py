@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from fastapi import APIRouter, status
+from src.entity.cache import environment_caches
+
+router: APIRouter = APIRouter(prefix="/cache")
+
+
+@router.get(
+    "/environment",
+    name="environment_cache",
+    description="Hit, miss and eviction counters of environment caches by env URL",
+    status_code=status.HTTP_200_OK,
+)
+async def environment_cache() -> dict[str, dict[str, dict[str, int]]]:
+    return environment_caches.counters()
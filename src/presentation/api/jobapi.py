@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status
+from src.application.measurementjob import MeasurementJob, MeasurementJobQueueFull, measurement_jobs
+from src.framework.dto.playerdto import PlayerMeasurementJobResponse, PlayerMeasurementRequest
+
+router: APIRouter = APIRouter(prefix="/job")
+
+
+def found(job: Optional[MeasurementJob], job_id: str) -> MeasurementJob:
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No measurement job {job_id!r}")
+
+    return job
+
+
+@router.post(
+    "/measurement",
+    name="measurement_job",
+    description="Start a measurement in the background",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=PlayerMeasurementJobResponse,
+)
+async def measurement_job(request: PlayerMeasurementRequest) -> PlayerMeasurementJobResponse:
+    try:
+        return measurement_jobs.submitted(request).to_response()
+    except MeasurementJobQueueFull as ex:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(ex))
+
+
+@router.get(
+    "/measurement/{job_id}",
+    name="measurement_job_progress",
+    description="Progress of a measurement started in the background",
+    status_code=status.HTTP_200_OK,
+    response_model=PlayerMeasurementJobResponse,
+)
+async def measurement_job_progress(job_id: str) -> PlayerMeasurementJobResponse:
+    return found(measurement_jobs.looked_up(job_id), job_id).to_response()
+
+
+@router.delete(
+    "/measurement/{job_id}",
+    name="measurement_job_cancel",
+    description="Cancel a measurement started in the background, or forget a finished one",
+    status_code=status.HTTP_200_OK,
+    response_model=PlayerMeasurementJobResponse,
+)
+async def measurement_job_cancel(job_id: str) -> PlayerMeasurementJobResponse:
+    return found(measurement_jobs.cancelled(job_id), job_id).to_response()
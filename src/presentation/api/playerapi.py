@@ -2,7 +2,9 @@
 
 # SPDX-License-Identifier: MIT
 
-from fastapi import APIRouter, status
+from typing import Optional
+
+from fastapi import APIRouter, Header, status
 from src.application.player import Player
 from src.framework.dto.playerdto import (
     PlayerErrorResponse,
@@ -13,6 +15,8 @@ from src.framework.dto.playerdto import (
     PlayerTrajectoryRequest,
     PlayerTrajectoryResponse,
 )
+from src.infra.hostlimit import Priority
+from src.presentation.api.requestscope import admitted
 from submodules.fastapi_haljson.src.halresponse import HALJSONResponse
 
 router: APIRouter = APIRouter(prefix="/player")
@@ -34,6 +38,9 @@ responses: dict[int, dict] = {
         "description": "Received a response with a failed status",
         "content": {"application/hal+json": {"schema": {"$ref": "#/components/schemas/PlayerErrorResponse"}}},
     },
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Too many requests are running or waiting; retry after the seconds in Retry-After",
+    },
 }
 
 
@@ -54,8 +61,10 @@ player = Player.from_type_map()
         **responses,
     },
 )
-async def trajectory(request: PlayerTrajectoryRequest) -> HALJSONResponse:
-    return await player.trajectory(request)
+async def trajectory(
+    request: PlayerTrajectoryRequest, x_priority: Optional[Priority] = Header(None)
+) -> HALJSONResponse:
+    return await admitted("trajectory", lambda: player.trajectory(request), x_priority)
 
 
 @router.post(
@@ -72,8 +81,8 @@ async def trajectory(request: PlayerTrajectoryRequest) -> HALJSONResponse:
         **responses,
     },
 )
-async def game(request: PlayerGameRequest) -> HALJSONResponse:
-    return await player.game(request)
+async def game(request: PlayerGameRequest, x_priority: Optional[Priority] = Header(None)) -> HALJSONResponse:
+    return await admitted("game", lambda: player.game(request), x_priority)
 
 
 @router.post(
@@ -90,5 +99,7 @@ async def game(request: PlayerGameRequest) -> HALJSONResponse:
         **responses,
     },
 )
-async def measurement(request: PlayerMeasurementRequest) -> HALJSONResponse:
-    return await player.measurement(request)
+async def measurement(
+    request: PlayerMeasurementRequest, x_priority: Optional[Priority] = Header(None)
+) -> HALJSONResponse:
+    return await admitted("measurement", lambda: player.measurement(request), x_priority)
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from contextvars import Token
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from src.application.admission import AdmissionRejected, admissions
+from src.infra.hostlimit import Priority, request_priority
+from src.infra.resilience import request_deadline, resilience
+from starlette.background import BackgroundTask
+
+T = TypeVar("T")
+
+priorities: dict[str, Priority] = {
+    "trajectory": Priority.INTERACTIVE,
+    "game": Priority.INTERACTIVE,
+    "measurement": Priority.BULK,
+    "trajectory_stream": Priority.INTERACTIVE,
+    "game_stream": Priority.BULK,
+}
+
+
+def rejected(ex: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(ex),
+        headers={"Retry-After": str(ex.retry_after)},
+    )
+
+
+async def scoped(call: Callable[[], Awaitable[T]], priority: Priority, deadline: Optional[float]) -> T:
+    priority_token: Token = request_priority.set(priority)
+    deadline_token: Token = request_deadline.set(deadline)
+    try:
+        return await call()
+    finally:
+        request_deadline.reset(deadline_token)
+        request_priority.reset(priority_token)
+
+
+async def admitted(name: str, call: Callable[[], Awaitable[T]], priority: Optional[Priority]) -> T:
+    deadline: Optional[float] = resilience.starting_deadline()
+
+    try:
+        return await admissions.admission(name).admitted(lambda: scoped(call, priority or priorities[name], deadline))
+    except AdmissionRejected as ex:
+        raise rejected(ex)
+
+
+async def streamed(
+    name: str, call: Callable[[], Awaitable[Response]], priority: Priority, deadline: Optional[float]
+) -> AsyncIterator[Any]:
+    async with admissions.admission(name).slot():
+        response: Response = await scoped(call, priority, deadline)
+        chunks: Optional[AsyncIterator[Any]] = (
+            response.body_iterator.__aiter__() if isinstance(response, StreamingResponse) else None
+        )
+        yield response
+
+        if chunks is not None:
+            while True:
+                try:
+                    chunk: Any = await scoped(chunks.__anext__, priority, deadline)
+                except StopAsyncIteration:
+                    return
+                yield chunk
+
+
+async def closed(stream: AsyncGenerator) -> None:
+    await stream.aclose()
+
+
+async def admitted_stream(name: str, call: Callable[[], Awaitable[Response]], priority: Optional[Priority]) -> Response:
+    stream: AsyncGenerator = streamed(name, call, priority or priorities[name], resilience.starting_deadline())
+
+    try:
+        response: Response = await stream.__anext__()
+    except AdmissionRejected as ex:
+        raise rejected(ex)
+
+    if not isinstance(response, StreamingResponse):
+        await stream.aclose()
+        return response
+
+    response.body_iterator, response.background = stream, BackgroundTask(closed, stream)
+
+    return response
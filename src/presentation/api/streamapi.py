@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from src.framework.dto.playerdto import (
+    PlayerErrorResponse,
+    PlayerGameRequest,
+    PlayerGameStreamRequest,
+    PlayerStreamError,
+    PlayerTrajectoryRequest,
+)
+from src.infra.hostlimit import Priority
+from src.infra.serializer import serializer
+from src.presentation.api.playerapi import player
+from src.presentation.api.requestscope import admitted_stream
+
+router: APIRouter = APIRouter(prefix="/stream")
+
+
+class StreamFormat(str):
+    @classmethod
+    def from_accept(cls, accept: str) -> StreamFormat:
+        return StreamFormat("text/event-stream" if "text/event-stream" in accept else "application/x-ndjson")
+
+    def is_SSE(self) -> bool:
+        return self == "text/event-stream"
+
+    async def encoded(self, items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+        async for item in items:
+            body: str = serializer.dumps(item.dict()).decode()
+
+            if not self.is_SSE():
+                yield body + "\n"
+            elif isinstance(item, PlayerStreamError):
+                yield f"event: error\ndata: {body}\n\n"
+            else:
+                yield f"data: {body}\n\n"
+
+    def to_response(self, items: AsyncIterator[BaseModel]) -> StreamingResponse:
+        return StreamingResponse(self.encoded(items), media_type=self)
+
+
+responses: dict[int, dict] = {
+    status.HTTP_404_NOT_FOUND: {
+        "model": PlayerErrorResponse,
+        "description": "An error occured while requesting the first step or game",
+        "content": {"application/hal+json": {"schema": {"$ref": "#/components/schemas/PlayerErrorResponse"}}},
+    },
+    status.HTTP_422_UNPROCESSABLE_ENTITY: {
+        "model": PlayerErrorResponse,
+        "description": "Received a response with a failed status before the first step or game",
+        "content": {"application/hal+json": {"schema": {"$ref": "#/components/schemas/PlayerErrorResponse"}}},
+    },
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Too many requests are running or waiting; retry after the seconds in Retry-After",
+    },
+}
+
+
+@router.post(
+    "/trajectory",
+    name="trajectory_stream",
+    description=(
+        "Steps of trajectories starting with the requested FENs, streamed as NDJSON lines or SSE events. "
+        "Each step holds the raw plies of every trajectory in request order, "
+        "without the end correction and white/black split of /player/trajectory. "
+        "An upstream error after the first step ends the stream with an error line or event"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses=responses,
+)
+async def trajectory_stream(
+    request: PlayerTrajectoryRequest, accept: str = Header(""), x_priority: Optional[Priority] = Header(None)
+) -> Response:
+    return await admitted_stream(
+        "trajectory_stream",
+        lambda: player.trajectory_stream(request, StreamFormat.from_accept(accept).to_response),
+        x_priority,
+    )
+
+
+@router.post(
+    "/game",
+    name="game_stream",
+    description=(
+        "Games from starting FEN to end, each streamed as an NDJSON line or SSE event when it ends. "
+        "An upstream error after the first game ends the stream with an error line or event"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses=responses,
+)
+async def game_stream(
+    request: PlayerGameRequest,
+    playtime: int = Query(1, description="Number of games to play", ge=1),
+    window: int = Query(0, description="Maximum number of games played at once; 0 plays all at once", ge=0),
+    accept: str = Header(""),
+    x_priority: Optional[Priority] = Header(None),
+) -> Response:
+    return await admitted_stream(
+        "game_stream",
+        lambda: player.game_stream(
+            PlayerGameStreamRequest(white=request.white, black=request.black, playtime=playtime, window=window),
+            StreamFormat.from_accept(accept).to_response,
+        ),
+        x_priority,
+    )
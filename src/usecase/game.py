@@ -4,19 +4,23 @@
 
 from __future__ import annotations
 
+from itertools import repeat
+from typing import AsyncIterator
+
 from httpx import HTTPStatusError, RequestError
 from src.core.usecase import Usecase
-from src.entity.movement import FEN, Movement
+from src.entity.environment import Environment
+from src.entity.movement import FEN
 from src.entity.score import Score
-from src.entity.status import Status
-from src.entity.trace import InfiniteTraceProducable, ProducableTrace, Trace
-from src.model.requestmodel import GameRequestModel
+from src.entity.trace import InfiniteTraceProducable, ProducableTrace, Trace, WindowedProducableTrace
+from src.model.requestmodel import GameRequestModel, GameStreamRequestModel
 from src.model.responsemodel import (
     GameResponsableModel,
     GameResponseModel,
-    HTTPStatusErrorResponseModel,
-    RequestErrorResponseModel,
+    StreamedGameResponseModel,
+    StreamResponsableModel,
 )
+from src.usecase.upstream import streamed, upstream_error
 
 
 class ResultTrace(Trace):
@@ -32,23 +36,35 @@ class Game(GameUsecase):
         try:
             return ResultTrace._make(
                 await ProducableTrace(
-                    Status(request.env),
-                    Movement(request.env, request.ai_white),
-                    Movement(request.env, request.ai_black),
+                    Environment(request.env).to_status(),
+                    Environment(request.env).to_movement(
+                        request.ai_white, request.deterministic_white, request.move_ids_white
+                    ),
+                    Environment(request.env).to_movement(
+                        request.ai_black, request.deterministic_black, request.move_ids_black
+                    ),
                     InfiniteTraceProducable(),
                 ).produced([FEN.starting()])
             ).to_response()
-        except RequestError as ex:
-            return RequestErrorResponseModel(
-                f"An error occurred while requesting {ex.request.url!r}: {ex.args[0]!r}",
-                "request.RequestError",
-            )
-        except HTTPStatusError as ex:
-            return HTTPStatusErrorResponseModel(
-                f"Error response {ex.response.status_code} "
-                + f"while requesting {ex.request.url!r}: {ex.response.json()!r}",
-                "request.HTTPStatusError",
-            )
+        except (RequestError, HTTPStatusError) as ex:
+            return upstream_error(ex)
+
+
+GameStreamUsecase = Usecase[GameStreamRequestModel, StreamResponsableModel]
+
+
+class GameStream(GameStreamUsecase):
+    async def request_to_responsable(self, request: GameStreamRequestModel) -> StreamResponsableModel:
+        return await streamed(self.games(request))
+
+    async def games(self, request: GameStreamRequestModel) -> AsyncIterator[StreamedGameResponseModel]:
+        async for game in WindowedProducableTrace(
+            Environment(request.env).to_status(),
+            Environment(request.env).to_movement(request.ai_white, request.deterministic_white, request.move_ids_white),
+            Environment(request.env).to_movement(request.ai_black, request.deterministic_black, request.move_ids_black),
+            request.window,
+        ).finished(repeat(FEN.starting(), request.playtime)):
+            yield StreamedGameResponseModel(game.game, game.fens, game.sans, Score.from_results(game.results))
 
 
 class FakeGame(GameUsecase):
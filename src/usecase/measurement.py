@@ -4,34 +4,24 @@
 
 from __future__ import annotations
 
+from itertools import repeat
+
 from httpx import HTTPStatusError, RequestError
 from src.core.usecase import Usecase
-from src.entity.enumerable import Mappable
-from src.entity.movement import FEN, Movement
+from src.entity.environment import Environment
+from src.entity.movement import FEN
 from src.entity.score import Score
-from src.entity.status import Status
-from src.entity.trace import InfiniteTraceProducable, ProducableTrace, Trace
+from src.entity.trace import ScoreCollector, WindowedProducableTrace
 from src.model.requestmodel import MeasurementRequestModel
-from src.model.responsemodel import (
-    HTTPStatusErrorResponseModel,
-    MeasurementInfo,
-    MeasurementResponsableModel,
-    MeasurementResponseModel,
-    RequestErrorResponseModel,
-)
+from src.model.responsemodel import MeasurementInfo, MeasurementResponsableModel, MeasurementResponseModel
+from src.usecase.upstream import upstream_error
 
 
 class Statistics(dict[Score, int]):
     @classmethod
-    def from_traces(cls, trace: Trace) -> Statistics:
-        results: list[Score] = Mappable(trace.results).mapped(lambda x: Score.from_results(x))
-
+    def from_scores(cls, scores: dict[Score, int]) -> Statistics:
         return Statistics(
-            {
-                Score.white_win(): results.count(Score.white_win()),
-                Score.black_win(): results.count(Score.black_win()),
-                Score.draw(): results.count(Score.draw()),
-            }
+            {score: scores.get(score, 0) for score in [Score.white_win(), Score.black_win(), Score.draw()]}
         )
 
     def white(self) -> MeasurementInfo:
@@ -59,26 +49,24 @@ MeasurementUsecase = Usecase[MeasurementRequestModel, MeasurementResponsableMode
 
 class Measurement(MeasurementUsecase):
     async def request_to_responsable(self, request: MeasurementRequestModel) -> MeasurementResponsableModel:
+        return await self.measured(request, ScoreCollector())
+
+    async def measured(self, request: MeasurementRequestModel, scores: ScoreCollector) -> MeasurementResponsableModel:
         try:
-            return Statistics.from_traces(
-                await ProducableTrace(
-                    Status(request.env),
-                    Movement(request.env, request.ai_white),
-                    Movement(request.env, request.ai_black),
-                    InfiniteTraceProducable(),
-                ).produced([FEN.starting()] * request.playtime)
+            return Statistics.from_scores(
+                await WindowedProducableTrace(
+                    Environment(request.env).to_status(),
+                    Environment(request.env).to_movement(
+                        request.ai_white, request.deterministic_white, request.move_ids_white
+                    ),
+                    Environment(request.env).to_movement(
+                        request.ai_black, request.deterministic_black, request.move_ids_black
+                    ),
+                    request.window,
+                ).collected(repeat(FEN.starting(), request.playtime), scores)
             ).to_response()
-        except RequestError as ex:
-            return RequestErrorResponseModel(
-                f"An error occurred while requesting {ex.request.url!r}: {ex.args[0]!r}",
-                "request.RequestError",
-            )
-        except HTTPStatusError as ex:
-            return HTTPStatusErrorResponseModel(
-                f"Error response {ex.response.status_code} "
-                + f"while requesting {ex.request.url!r}: {ex.response.json()!r}",
-                "request.HTTPStatusError",
-            )
+        except (RequestError, HTTPStatusError) as ex:
+            return upstream_error(ex)
 
 
 class FakeMeasurement(MeasurementUsecase):
@@ -2,18 +2,16 @@
 
 # SPDX-License-Identifier: MIT
 
+from typing import AsyncIterator
+
 from httpx import HTTPStatusError, RequestError
 from src.core.usecase import Usecase
-from src.entity.movement import FEN, SAN, Movement
-from src.entity.status import Status
+from src.entity.environment import Environment
+from src.entity.movement import FEN, SAN
 from src.entity.trace import ColoredTrace, FiniteTraceProducable, ProducableTrace, Trace
 from src.model.requestmodel import TrajectoryRequestModel
-from src.model.responsemodel import (
-    HTTPStatusErrorResponseModel,
-    RequestErrorResponseModel,
-    TrajectoryResponsableModel,
-    TrajectoryResponseModel,
-)
+from src.model.responsemodel import StreamResponsableModel, TrajectoryResponsableModel, TrajectoryResponseModel
+from src.usecase.upstream import streamed, upstream_error
 
 TrajectoryUsecase = Usecase[TrajectoryRequestModel, TrajectoryResponsableModel]
 
@@ -24,24 +22,36 @@ class Trajectory(TrajectoryUsecase):
             return TrajectoryResponseModel._make(
                 (
                     await ProducableTrace(
-                        Status(request.env),
-                        Movement(request.env, request.ai_white),
-                        Movement(request.env, request.ai_black),
+                        Environment(request.env).to_status(),
+                        Environment(request.env).to_movement(
+                            request.ai_white, request.deterministic_white, request.move_ids_white
+                        ),
+                        Environment(request.env).to_movement(
+                            request.ai_black, request.deterministic_black, request.move_ids_black
+                        ),
                         FiniteTraceProducable(request.step),
                     ).produced_with_spliting(request.fens)
                 ).concatenated()
             )
-        except RequestError as ex:
-            return RequestErrorResponseModel(
-                f"An error occurred while requesting {ex.request.url!r}: {ex.args[0]!r}",
-                "request.RequestError",
-            )
-        except HTTPStatusError as ex:
-            return HTTPStatusErrorResponseModel(
-                f"Error response {ex.response.status_code} "
-                + f"while requesting {ex.request.url!r}: {ex.response.json()!r}",
-                "request.HTTPStatusError",
-            )
+        except (RequestError, HTTPStatusError) as ex:
+            return upstream_error(ex)
+
+
+TrajectoryStreamUsecase = Usecase[TrajectoryRequestModel, StreamResponsableModel]
+
+
+class TrajectoryStream(TrajectoryStreamUsecase):
+    async def request_to_responsable(self, request: TrajectoryRequestModel) -> StreamResponsableModel:
+        return await streamed(self.steps(request))
+
+    async def steps(self, request: TrajectoryRequestModel) -> AsyncIterator[TrajectoryResponseModel]:
+        async for trace in ProducableTrace(
+            Environment(request.env).to_status(),
+            Environment(request.env).to_movement(request.ai_white, request.deterministic_white, request.move_ids_white),
+            Environment(request.env).to_movement(request.ai_black, request.deterministic_black, request.move_ids_black),
+            FiniteTraceProducable(request.step),
+        ).stepped(request.fens):
+            yield TrajectoryResponseModel._make(trace)
 
 
 class FakeTrajectory(TrajectoryUsecase):
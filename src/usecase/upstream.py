@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from typing import AsyncIterator, NamedTuple, Union
+
+from httpx import HTTPStatusError, RequestError
+from src.model.responsemodel import (
+    HTTPStatusErrorResponseModel,
+    RequestErrorResponseModel,
+    StreamResponsableModel,
+    StreamResponseModel,
+)
+
+UpstreamError = Union[RequestError, HTTPStatusError]
+UpstreamErrorResponseModel = Union[RequestErrorResponseModel, HTTPStatusErrorResponseModel]
+
+
+def upstream_error(ex: UpstreamError) -> UpstreamErrorResponseModel:
+    if isinstance(ex, HTTPStatusError):
+        return HTTPStatusErrorResponseModel.from_message(
+            f"Error response {ex.response.status_code} "
+            + f"while requesting {ex.request.url!r}: {ex.response.json()!r}"
+        )
+
+    return RequestErrorResponseModel.from_message(
+        f"An error occurred while requesting {ex.request.url!r}: {ex.args[0]!r}"
+    )
+
+
+async def continued(first: NamedTuple, rest: AsyncIterator[NamedTuple]) -> AsyncIterator[NamedTuple]:
+    yield first
+
+    try:
+        async for responsable in rest:
+            yield responsable
+    except (RequestError, HTTPStatusError) as ex:
+        yield upstream_error(ex)
+
+
+async def streamed(responsables: AsyncIterator[NamedTuple]) -> StreamResponsableModel:
+    try:
+        first: NamedTuple = await responsables.__anext__()
+    except StopAsyncIteration:
+        return StreamResponseModel(responsables)
+    except (RequestError, HTTPStatusError) as ex:
+        return upstream_error(ex)
+
+    return StreamResponseModel(continued(first, responsables))
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from asyncio import Event, create_task, sleep
+
+import pytest
+from src.application.admission import AdmissionConfig, AdmissionRejected, Admissions
+
+
+@pytest.mark.asyncio
+async def test_admission_rejected() -> None:
+    admissions = Admissions()
+    admissions.configure(AdmissionConfig(concurrency=1, queue=1))
+    admission = admissions.admission("measurement")
+    released = Event()
+
+    async def call() -> str:
+        await released.wait()
+        return "done"
+
+    running = [create_task(admission.admitted(call)), create_task(admission.admitted(call))]
+    await sleep(0)
+
+    with pytest.raises(AdmissionRejected) as ex:
+        await admission.admitted(call)
+    assert ex.value.retry_after >= 1
+    assert await admissions.admission("game").admitted(lambda: sleep(0, "game")) == "game"
+
+    released.set()
+    assert [await x for x in running] == ["done", "done"]
+    assert admission.admitted_count == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_slot() -> None:
+    admissions = Admissions()
+    admissions.configure(AdmissionConfig(concurrency=1, queue=0))
+    admission = admissions.admission("game_stream")
+
+    async with admission.slot():
+        with pytest.raises(AdmissionRejected):
+            async with admission.slot():
+                pass
+        assert admission.admitted_count == 1
+
+    assert admission.admitted_count == 0
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Request, Response
+from src.application.measurementjob import MeasurementJobQueueFull, MeasurementJobs
+from src.config import Container
+from src.framework.dto.playerdto import PlayerAIInfo, PlayerMeasurementRequest
+
+
+def checkmated(request: Request) -> Response:
+    fens = json.loads(request.content)["fens"]
+
+    return Response(status.HTTP_200_OK, json={"statuses": [2] * len(fens), "legal_moves": [[]] * len(fens)})
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_measurement_job(container: Container) -> None:
+    respx.post("http://test/model/fen-status").mock(side_effect=checkmated)
+
+    jobs = MeasurementJobs(limit=1)
+    job = jobs.submitted(
+        PlayerMeasurementRequest(
+            white=PlayerAIInfo(url="http://test"), black=PlayerAIInfo(url="http://test"), playtime=3
+        )
+    )
+    await job.task
+
+    response = jobs.looked_up(job.id).to_response()
+
+    assert (response.state, response.finished, response.white.win, response.black.lose) == ("done", 3, 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_measurement_job_cancelled(container: Container) -> None:
+    jobs = MeasurementJobs(limit=1)
+    job = jobs.submitted(
+        PlayerMeasurementRequest(
+            white=PlayerAIInfo(url="http://test"), black=PlayerAIInfo(url="http://test"), playtime=3
+        )
+    )
+
+    assert jobs.cancelled(job.id).to_response().state == "cancelled"
+    assert jobs.looked_up(job.id) is None
+
+
+@pytest.mark.asyncio
+async def test_measurement_job_queue_full() -> None:
+    jobs = MeasurementJobs(limit=1, max_queued=1)
+    request = PlayerMeasurementRequest(
+        white=PlayerAIInfo(url="http://test"), black=PlayerAIInfo(url="http://test"), playtime=3
+    )
+    jobs.submitted(request)
+
+    with pytest.raises(MeasurementJobQueueFull):
+        jobs.submitted(request)
+
+    jobs.cancelled_all()
+
+
+@pytest.mark.asyncio
+async def test_measurement_job_expired() -> None:
+    jobs = MeasurementJobs(limit=1, retention=0.0)
+    job = jobs.submitted(
+        PlayerMeasurementRequest(
+            white=PlayerAIInfo(url="http://test"), black=PlayerAIInfo(url="http://test"), playtime=3
+        )
+    )
+    job.task.cancel()
+    job.stopped_with("cancelled")
+    job.ended -= 1.0
+
+    assert jobs.looked_up(job.id) is None
@@ -2,10 +2,12 @@
 
 # SPDX-License-Identifier: MIT
 
+from asyncio import gather, sleep
+
 import pytest
 from dependency_injector import providers
 from src.application.player import GamePlayer, MeasurementPlayer, TrajectoryPlayer
-from src.config import Container
+from src.config import Container, requested_api_info
 from src.converter.responseconverter import GameResponseToDTO, MeasurementResponseToDTO, TrajectoryResponseToDTO
 from src.entity.movement import FEN, SAN
 from src.framework.dto.playerdto import (
@@ -19,6 +21,7 @@ from src.model.responsemodel import MeasurementInfo
 from src.usecase.game import FakeGame
 from src.usecase.measurement import FakeMeasurement
 from src.usecase.trajectory import FakeTrajectory
+from submodules.fastapi_haljson.src.halmodel import HALBase
 
 
 @pytest.mark.asyncio
@@ -64,3 +67,28 @@ async def test_measurement_intent(container: Container) -> None:
         )
         == MeasurementResponseToDTO(MeasurementInfo(1.5, 1, 1, 1), MeasurementInfo(1.5, 1, 1, 1)).convert()
     )
+
+
+@pytest.mark.asyncio
+async def test_requested_api_info(container: Container) -> None:
+    container.api_info.reset_override()
+
+    async def requested(name: str) -> str:
+        requested_api_info.set(PlayerAPIInfo(name=name, method="post"))
+        await sleep(0)
+
+        return container.api_info().name
+
+    assert await gather(requested("trajectory"), requested("game"), requested("measurement")) == [
+        "trajectory",
+        "game",
+        "measurement",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_hal_links(container: Container) -> None:
+    link_set = container.hal_links().link_set("game", "post")
+
+    assert link_set is container.hal_links().link_set("game", "post")
+    assert link_set.links == HALBase.from_routes_with_requested(container.internal_model().routes, "game", "post").links
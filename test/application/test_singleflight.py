@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from asyncio import gather, sleep
+
+import pytest
+from src.application.singleflight import SingleFlight
+from src.entity.movement import FEN
+from src.framework.dto.playerdto import PlayerAIInfo, PlayerTrajectoryRequest
+
+
+def request_of(deterministic: bool) -> PlayerTrajectoryRequest:
+    return PlayerTrajectoryRequest(
+        fens=[FEN.starting()],
+        white=PlayerAIInfo(url="http://fake-ai", deterministic=deterministic),
+        black=PlayerAIInfo(url="http://fake-ai", deterministic=deterministic),
+        step=1,
+    )
+
+
+@pytest.mark.parametrize("deterministic, calls", [(True, 1), (False, 3)])
+@pytest.mark.asyncio
+async def test_single_flight(deterministic: bool, calls: int) -> None:
+    single_flight = SingleFlight()
+    single_flight.configure(True)
+    called: list[int] = []
+
+    async def dispatch() -> int:
+        called.append(len(called))
+        await sleep(0.01)
+        return len(called)
+
+    assert await gather(
+        *[single_flight.dispatched("trajectory", request_of(deterministic), dispatch) for _ in range(3)]
+    ) == ([1] * 3 if deterministic else [3] * 3)
+    assert len(called) == calls
+    assert single_flight.flights == {}
+
+
+def test_key_of() -> None:
+    assert SingleFlight.key_of("trajectory", request_of(True)) == SingleFlight.key_of("trajectory", request_of(True))
+    assert SingleFlight.key_of("trajectory", request_of(True)) != SingleFlight.key_of("game", request_of(True))
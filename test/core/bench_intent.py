@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from src.core.intent import Intent
+from test.core.test_intent import DoubleIntent, DoubleUsecase, NestedIntent, evented_dispatch, intent_of
+
+
+async def per_dispatch(dispatch: Callable[[int], Awaitable[int]], repeat: int) -> float:
+    started: float = perf_counter()
+
+    for i in range(repeat):
+        await dispatch(i)
+
+    return (perf_counter() - started) / repeat
+
+
+async def main(repeat: int = 100000) -> None:
+    for intent_type in [DoubleIntent, NestedIntent]:
+        intent: Intent = intent_of(intent_type, DoubleUsecase({}))
+        evented: float = await per_dispatch(lambda x: evented_dispatch(intent, x), repeat)
+        direct: float = await per_dispatch(intent.dispatch, repeat)
+
+        print(
+            f"{intent_type.__name__}: evented {evented * 1e6:.2f}us, direct {direct * 1e6:.2f}us "
+            + f"({evented / direct:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from typing import Any, Awaitable, Callable, cast
+
+import pytest
+from src.core.event import Event, EventAGen, PopEvent, PushEvent
+from src.core.intent import DirectIntent, Intent, IntentData
+from src.core.usecase import Usecase
+
+
+class DoubleUsecase(Usecase[int, int]):
+    async def request_to_responsable(self, request: int) -> int:
+        if request < 0:
+            raise ValueError(request)
+
+        return request * 2
+
+
+class DoubleIntent(IntentData, DirectIntent[int, int, int, int]):
+    def requested(self, request: int) -> int:
+        return request
+
+    def responded(self, request: int, response: int) -> int:
+        return response + 1
+
+
+class NestedIntent(IntentData, Intent[int, int, int, int]):
+    async def executed(self, request: Any) -> EventAGen:
+        first = yield await self.usecase.request(request)
+        yield PopEvent((yield await self.usecase.request(first)))
+
+
+def intent_of(intent_type: type, usecase: Usecase) -> Intent:
+    intent = intent_type(usecase)
+    usecase.boundaries["framework"] = intent
+
+    return intent
+
+
+EventOperator = Callable[[EventAGen], Awaitable]
+
+
+async def executed(event: Event, callstack: list[EventAGen]) -> EventOperator:
+    if isinstance(event, PushEvent):
+        callstack.append(event.agen)
+
+        return lambda agen: agen.__anext__()
+
+    await callstack.pop(-1).aclose()
+
+    return lambda agen: agen.asend(cast(PopEvent, event).value)
+
+
+async def evented_dispatch(intent: Intent, request: Any) -> Any:
+    callstack: list[EventAGen] = list[EventAGen]([intent.executed(request)])
+    op: EventOperator = lambda agen: agen.__anext__()
+    event: Event = PopEvent(None)
+
+    while len(callstack) > 0:
+        event = await op(callstack[-1])
+        op = await executed(event, callstack)
+
+    return cast(PopEvent, event).value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("intent_type, request_value, response", [(DoubleIntent, 3, 7), (NestedIntent, 3, 12)])
+async def test_dispatch(intent_type: type, request_value: int, response: int) -> None:
+    intent = intent_of(intent_type, DoubleUsecase({}))
+
+    assert await intent.dispatch(request_value) == await evented_dispatch(intent, request_value) == response
+
+
+@pytest.mark.asyncio
+async def test_dispatch_raised() -> None:
+    with pytest.raises(ValueError):
+        await intent_of(DoubleIntent, DoubleUsecase({})).dispatch(-1)
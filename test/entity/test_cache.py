@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import pytest
+from src.entity.cache import CachedFENAdvance, CachedStatus, LRUCache
+from src.entity.movement import FEN, SAN, LocalFENAdvance
+from src.entity.status import LocalStatus
+
+
+def test_lru_cache() -> None:
+    cache = LRUCache(2)
+    cache.stored("a", 1)
+    cache.stored("b", 2)
+
+    assert cache.looked_up("a") == 1
+
+    cache.stored("c", 3)
+
+    assert cache.looked_up("b") is None
+    assert cache.counters() == {"size": 2, "hits": 1, "misses": 1, "evictions": 1}
+
+
+@pytest.mark.asyncio
+async def test_cached_status() -> None:
+    cache = LRUCache(16)
+    status = CachedStatus(LocalStatus(), cache)
+
+    assert await status.status([FEN.starting()] * 3) == await LocalStatus().status([FEN.starting()] * 3)
+    assert await status.status([FEN.first(), FEN.starting()]) == await LocalStatus().status(
+        [FEN.first(), FEN.starting()]
+    )
+    assert cache.counters() == {"size": 2, "hits": 1, "misses": 4, "evictions": 0}
+
+
+@pytest.mark.asyncio
+async def test_cached_advance() -> None:
+    cache = LRUCache(1)
+    advance = CachedFENAdvance(LocalFENAdvance(), cache)
+
+    assert await advance.advanced([FEN.starting(), FEN.starting()], [SAN.first(), "h4g5"]) == [
+        FEN.first(),
+        "4knbr/4p3/8/6KP/4RBN1/8/8/8 b k - 1 1",
+    ]
+    assert await advance.advanced([FEN.starting()], ["h4g5"]) == ["4knbr/4p3/8/6KP/4RBN1/8/8/8 b k - 1 1"]
+    assert cache.counters() == {"size": 1, "hits": 1, "misses": 2, "evictions": 1}
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Response
+from src.entity.enumerable import Deduplicated
+from src.entity.fenstatus import RequestedFENStatus
+from src.entity.movement import FEN
+from src.entity.nextsan import RequestedNextSAN
+
+
+def test_deduplicated() -> None:
+    unique = Deduplicated.from_keys(["a", "b", "a", "c", "b"])
+
+    assert unique.picked(["a", "b", "a", "c", "b"]) == ["a", "b", "c"]
+    assert unique.fanned_out([1, 2, 3]) == [1, 2, 1, 3, 2]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requested_fen_status_deduplicated() -> None:
+    route = respx.post("http://fake-env/model/fen-status").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"statuses": [1, 2], "legal_moves": [["h5h6"], []]})]
+    )
+
+    assert await RequestedFENStatus.from_url_with_FENs(
+        "http://fake-env", [FEN.starting(), FEN.first(), FEN.starting()]
+    ) == RequestedFENStatus([1, 2, 1], [["h5h6"], [], ["h5h6"]])
+    assert json.loads(route.calls[0].request.content) == {"fens": [FEN.starting(), FEN.first()]}
+
+
+@pytest.mark.parametrize(
+    "deterministic, posted, next_sans",
+    [
+        (True, [FEN.starting()], ["h5h6"]),
+        (False, [FEN.starting(), FEN.starting()], ["h5h6", "h5h6"]),
+    ],
+)
+@pytest.mark.asyncio
+@respx.mock
+async def test_requested_next_san_deduplicated(deterministic: bool, posted: list[str], next_sans: list[str]) -> None:
+    route = respx.post("http://fake-ai/ai/next-san").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"next_sans": next_sans})]
+    )
+
+    assert await RequestedNextSAN.from_url_with_FENs_legal_moves(
+        "http://fake-ai", [FEN.starting()] * 2, [["h5h6"]] * 2, deterministic
+    ) == ["h5h6", "h5h6"]
+    assert json.loads(route.calls[0].request.content)["fens"] == posted
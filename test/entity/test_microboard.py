@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import pytest
+from src.entity.microboard import MicroBoard
+from src.entity.movement import FEN, SAN, LocalMovement
+from src.entity.status import FakeStatus, LocalStatus
+
+
+@pytest.mark.parametrize(
+    "fen, status, legal_moves",
+    [
+        (
+            FEN.starting(),
+            1,
+            ["e4e5", "e4e6", "e4e7", "f4e5", "f4g5", "f4h6", "g4e5", "g4f6", "g4h6", "h4g5", "h5h6"],
+        ),
+        ("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1", 2, []),
+        ("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", 3, []),
+        ("4k3/8/8/8/4K3/8/8/8 w - - 0 1", 4, ["e4e5", "e4f4", "e4f5"]),
+        ("4k3/4p3/8/8/4K3/8/8/8 w - - 100 60", 5, ["e4e5", "e4f4", "e4f5"]),
+    ],
+)
+def test_fen_status(fen: str, status: int, legal_moves: list[str]) -> None:
+    assert (lambda x: (x[0].value, x[1]))(MicroBoard.from_FEN(fen).examined()) == (status, legal_moves)
+
+
+@pytest.mark.parametrize(
+    "fen, san, next_fen",
+    [
+        (FEN.starting(), SAN.first(), FEN.first()),
+        (FEN.first(), "h8h6", "4knb1/4p3/7r/8/4RBNK/8/8/8 w K - 0 2"),
+        ("4k3/8/8/8/4R2K/8/8/8 w Kk - 0 1", "h4f4", "4k3/8/8/8/5KR1/8/8/8 b k - 1 1"),
+        ("4k3/7P/8/8/7K/8/8/8 w - - 3 9", "h7h8q", "4k2Q/8/8/8/7K/8/8/8 b - - 0 9"),
+    ],
+)
+def test_next_fen(fen: str, san: str, next_fen: str) -> None:
+    assert MicroBoard.from_FEN(fen).pushed(san).to_FEN() == next_fen
+
+
+def test_illegal_move() -> None:
+    with pytest.raises(ValueError):
+        MicroBoard.from_FEN(FEN.starting()).pushed("h5h7")
+
+
+@pytest.mark.asyncio
+async def test_local_status() -> None:
+    assert await LocalStatus().status([FEN.starting()] * 2) == await FakeStatus().status([FEN.starting()] * 2)
+
+
+@pytest.mark.asyncio
+async def test_local_movement_without_FENs() -> None:
+    assert await LocalMovement("http://fake-ai").movement([], []) == ([], [])
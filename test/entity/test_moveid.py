@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Response
+from src.entity.fenstatus import RequestedFENStatus
+from src.entity.microboard import MicroBoard
+from src.entity.moveid import MOVE_IDS
+from src.entity.movement import FEN, SAN
+from src.entity.nextsan import RequestedNextSAN
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        FEN.starting(),
+        FEN.first(),
+        "4k3/8/8/8/4R2K/8/8/8 w Kk - 0 1",
+        "4k3/7P/8/8/7K/8/8/8 w - - 3 9",
+        "4k3/8/8/8/4K2p/8/8/8 b - - 3 9",
+    ],
+)
+def test_move_ids_round_trip(fen: str) -> None:
+    legal_moves: list[str] = MicroBoard.from_FEN(fen).examined()[1]
+
+    assert MOVE_IDS.decoded(MOVE_IDS.encoded(legal_moves)) == legal_moves
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requested_fen_status_with_move_ids() -> None:
+    route = respx.post("http://fake-env/model/fen-status?move_encoding=id").mock(
+        side_effect=[
+            Response(status.HTTP_200_OK, json={"statuses": [1], "legal_moves": MOVE_IDS.encoded_all([["h5h6"]])})
+        ]
+    )
+
+    assert await RequestedFENStatus.from_url_with_FENs("http://fake-env", [FEN.starting()], True) == (
+        RequestedFENStatus([1], [["h5h6"]])
+    )
+    assert route.called
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requested_next_san_with_move_ids() -> None:
+    route = respx.post("http://fake-ai/ai/next-san?move_encoding=id").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"next_sans": MOVE_IDS.encoded([SAN.first()])})]
+    )
+
+    assert await RequestedNextSAN.from_url_with_FENs_legal_moves(
+        "http://fake-ai", [FEN.starting()], [[SAN.first()]], move_ids=True
+    ) == [SAN.first()]
+    assert json.loads(route.calls[0].request.content)["legal_moves"] == MOVE_IDS.encoded_all([[SAN.first()]])
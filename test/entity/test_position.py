@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from src.entity.movement import FEN
+from src.entity.position import PositionTable, Positions
+
+
+def test_position_table() -> None:
+    table = PositionTable.empty()
+    ids = table.interned_all([FEN.starting(), FEN.first(), FEN.starting()])
+
+    assert list(ids) == [0, 1, 0]
+    assert list(table.colored(ids, "w")) == [True, False, True]
+    assert table.is_colored(FEN.black_end(), "b")
+    assert table.canonical_all(["".join(FEN.starting())])[0] is table.values[0]
+
+
+def test_positions_rotated() -> None:
+    positions = Positions(2)
+    table = positions.current()
+    table.interned_all([FEN.starting(), FEN.first()])
+
+    assert positions.current() is not table
+    assert table.looked_up([1]) == [FEN.first()]
@@ -2,23 +2,33 @@
 
 # SPDX-License-Identifier: MIT
 
+from asyncio import CancelledError, Event, sleep
 from typing import NamedTuple
 
 import pytest
 from src.entity.enumerable import Mappable
+from src.entity.microboard import MicroBoard
 from src.entity.movement import FEN, SAN, FakeBlackMovement, FakeWhiteMovement, IMovement
-from src.entity.status import FakeCheckmateStatus, FakeStalemateStatus, FakeStatus, IStatus
+from src.entity.status import FakeCheckmateStatus, FakeStalemateStatus, FakeStatus, IStatus, LocalStatus
 from src.entity.trace import (
+    AppendableTrace,
     ColoredTrace,
+    ColumnarTrace,
     CorrectableTrace,
+    FinishedGames,
     FiniteTraceProducable,
     InfiniteTraceProducable,
     ITraceProducable,
+    MappableTrace,
     MovableTrace,
+    OneStepProduct,
     OneStepTrace,
     ProducableTrace,
+    ScoreCollector,
     SplitableTrace,
     Trace,
+    WindowedProducableTrace,
+    WindowedSlots,
 )
 
 
@@ -127,6 +137,46 @@ def test_split_with_color_turn(target: SplitableTrace, colored: ColoredTrace) ->
     assert target.splited_with_color_turn() == colored
 
 
+@pytest.mark.parametrize(
+    "target, colored",
+    [
+        (
+            SplitableTrace([[FEN.starting(), FEN.first(), FEN.starting()]], [[SAN.first(), SAN.first()]], [[0, 0]]),
+            ColoredTrace(
+                Trace([[FEN.starting(), FEN.starting()]], [[SAN.first()]], [[0]]),
+                Trace([[FEN.first()]], [[]], [[0]]),
+            ),
+        ),
+        (
+            SplitableTrace([[FEN.starting(), FEN.first()]], [[SAN.first()]], [[0]]),
+            ColoredTrace(
+                Trace([[FEN.starting()]], [[]], [[0]]),
+                Trace([[FEN.first()]], [[]], [[]]),
+            ),
+        ),
+        (
+            SplitableTrace([[FEN.starting()]], [[]], [[]]),
+            ColoredTrace(
+                Trace([[FEN.starting()]], [[]], [[]]),
+                Trace([], [], []),
+            ),
+        ),
+    ],
+)
+def test_columnar_split_with_color_turn(target: SplitableTrace, colored: ColoredTrace) -> None:
+    assert ColumnarTrace.from_trace(target).splited_with_color_turn() == colored
+
+
+def test_columnar_round_trip() -> None:
+    trace = Trace(
+        [[FEN.starting(), FEN.first(), FEN.starting()], [FEN.first()], []],
+        [[SAN.first(), SAN.first()], [], []],
+        [[0, 0, 0.5], [1], []],
+    )
+
+    assert ColumnarTrace.from_trace(trace).to_trace() == trace
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "fen, movement, next_fen",
@@ -161,6 +211,21 @@ def test_moved() -> None:
     )
 
 
+def test_appended() -> None:
+    trace = MovableTrace.from_FENs([FEN.starting(), FEN.starting(), FEN.first(), FEN.first()])
+    appendable = AppendableTrace.from_trace(trace)
+
+    assert appendable.appended(
+        OneStepTrace(Trace([[FEN.first()]], [[SAN.first()]], [[0], [0.5]]), [0, 1], [0])
+    ).appended(
+        OneStepTrace(Trace([[FEN.starting()]], [[SAN.first()]], [[0], [0.5]]), [2, 3], [2])
+    ).frozen() == trace.moved(
+        OneStepTrace(Trace([[FEN.first()]], [[SAN.first()]], [[0], [0.5]]), [0, 1], [0]),
+        OneStepTrace(Trace([[FEN.starting()]], [[SAN.first()]], [[0], [0.5]]), [2, 3], [2]),
+    )
+    assert trace == MovableTrace.from_FENs([FEN.starting(), FEN.starting(), FEN.first(), FEN.first()])
+
+
 class GeneratableParam(NamedTuple):
     rest_prefix: int
     common_white: Trace
@@ -254,3 +319,99 @@ async def test_produced(fens: list[str], status: IStatus, colored: ColoredTrace,
         await ProducableTrace(status, FakeWhiteMovement(), FakeBlackMovement(), producable).produced_with_spliting(fens)
         == colored
     )
+
+
+class FirstLegalMovement(IMovement):
+    async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
+        return [MicroBoard.from_FEN(fen).pushed(moves[0]).to_FEN() for fen, moves in zip(fens, legal_moves)], [
+            moves[0] for moves in legal_moves
+        ]
+
+
+WINDOWED_FENS = [
+    "4k3/4p3/8/8/4K3/8/8/8 w - - 90 60",
+    "4k3/8/8/8/4K3/8/8/8 w - - 0 1",
+    "4k3/4p3/8/8/4K3/8/8/8 b - - 97 60",
+    "4k3/7P/8/8/7K/8/8/8 w - - 84 60",
+    "7k/6Q1/6K1/8/8/8/8/8 b - - 0 1",
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window", [0, 1, 2, 5])
+async def test_windowed_produced(window: int) -> None:
+    fens = WINDOWED_FENS
+
+    assert await WindowedProducableTrace(LocalStatus(), FirstLegalMovement(), FirstLegalMovement(), window).produced(
+        fens
+    ) == await ProducableTrace(
+        LocalStatus(), FirstLegalMovement(), FirstLegalMovement(), InfiniteTraceProducable()
+    ).produced(
+        fens
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window", [0, 2])
+async def test_score_collected(window: int) -> None:
+    assert await WindowedProducableTrace(LocalStatus(), FirstLegalMovement(), FirstLegalMovement(), window).collected(
+        iter(WINDOWED_FENS), ScoreCollector()
+    ) == {"1/2-1/2": 4, "1-0": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("history", [True, False])
+async def test_harvested_cleared(history: bool) -> None:
+    slots, started = WindowedSlots.from_FENs(WINDOWED_FENS, 0)
+    product = OneStepProduct.from_FENs(started)
+
+    while not product.empty():
+        product = await product.one_step_produced(LocalStatus(), FirstLegalMovement(), FirstLegalMovement())
+        product = slots.harvested(product if history else product.trimmed(), FinishedGames())
+
+        for slot, game in enumerate(slots.games):
+            assert game is not None or product.trace.fens[slot] == []
+            assert history or len(product.trace.fens[slot]) <= 1
+
+
+class FailedMovement(IMovement):
+    async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
+        raise ValueError(fens)
+
+
+class BlockedMovement(NamedTuple("BlockedMovement", [("cancelled", list[str])]), IMovement):
+    async def movement(self, fens: list[str], legal_moves: list[list[str]]) -> tuple[list[str], list[str]]:
+        try:
+            await Event().wait()
+        except CancelledError:
+            self.cancelled.extend(fens)
+            raise
+
+        return fens, []
+
+
+@pytest.mark.asyncio
+async def test_one_step_failed_cancels_sibling() -> None:
+    black = BlockedMovement([])
+
+    with pytest.raises(ValueError):
+        await OneStepProduct.from_FENs(WINDOWED_FENS).one_step_produced(LocalStatus(), FailedMovement(), black)
+    await sleep(0)
+
+    assert len(black.cancelled) > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("producable", [FiniteTraceProducable(0), FiniteTraceProducable(3), InfiniteTraceProducable()])
+async def test_stepped(producable: ITraceProducable) -> None:
+    stepped = Trace([[]] * len(WINDOWED_FENS), [[]] * len(WINDOWED_FENS), [[]] * len(WINDOWED_FENS))
+    async for trace in ProducableTrace(LocalStatus(), FirstLegalMovement(), FirstLegalMovement(), producable).stepped(
+        WINDOWED_FENS
+    ):
+        stepped = MappableTrace._make(stepped).inner_concatenated(trace)
+
+    assert tuple(stepped) == tuple(
+        await ProducableTrace(LocalStatus(), FirstLegalMovement(), FirstLegalMovement(), producable).produced(
+            WINDOWED_FENS
+        )
+    )
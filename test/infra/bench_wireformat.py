@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from time import perf_counter
+
+import respx
+from src.entity.movement import FEN
+from src.infra.postclient import PostClient, client_pool
+from src.infra.wireformat import WireFormat, wire_negotiation
+from test.infra.test_wireformat import both_formats
+
+URL: str = "http://fake-env/model/fen-status"
+
+
+async def measured(name: str, fens: list[str], repeat: int) -> tuple[str, int, float]:
+    wire_negotiation.configure(name)
+    client_pool.open()
+    try:
+        with respx.mock:
+            route = respx.post(URL).mock(side_effect=both_formats)
+            await PostClient(URL).post({"fens": fens})
+
+            started: float = perf_counter()
+            for _ in range(repeat):
+                await PostClient(URL).post({"fens": fens})
+            elapsed: float = perf_counter() - started
+
+            request, response = route.calls[-1]
+    finally:
+        await client_pool.close()
+        wire_negotiation.configure("json")
+
+    return response.headers["content-type"], len(request.content) + len(response.content), elapsed / repeat
+
+
+async def main(length: int = 10000, repeat: int = 20) -> None:
+    fens: list[str] = [FEN.starting()] * length
+
+    for name in ["json"] + ([] if WireFormat.msgpack() is None else ["msgpack"]):
+        content_type, size, elapsed = await measured(name, fens, repeat)
+        print(f"{content_type}: {size} bytes on the wire, {elapsed * 1e3:.2f}ms per fen-status call")
+
+    if WireFormat.msgpack() is None:
+        print("msgpack is not installed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
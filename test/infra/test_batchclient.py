@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+from asyncio import gather
+
+import pytest
+import respx
+from fastapi import status
+from httpx import HTTPStatusError, Request, Response
+from src.infra.batchclient import BatchPostClient, ChunkingConfig, CoalescingConfig, chunker, coalescer
+from src.infra.hostlimit import Priority, request_priority
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalesced() -> None:
+    route = respx.post("http://fake-env/model/next-fen").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"next_fens": ["a", "b", "c"]})]
+    )
+
+    coalescer.configure(CoalescingConfig(window=0.01))
+    try:
+        assert await gather(
+            BatchPostClient("http://fake-env/model/next-fen").post({"fens": ["x"], "sans": ["p"]}),
+            BatchPostClient("http://fake-env/model/next-fen").post({"fens": ["y", "z"], "sans": ["q", "r"]}),
+        ) == [{"next_fens": ["a"]}, {"next_fens": ["b", "c"]}]
+    finally:
+        coalescer.configure(CoalescingConfig())
+
+    assert route.call_count == 1
+    assert json.loads(route.calls[0].request.content) == {"fens": ["x", "y", "z"], "sans": ["p", "q", "r"]}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalesced_with_max_batch() -> None:
+    route = respx.post("http://fake-env/model/fen-status").mock(
+        side_effect=[
+            Response(status.HTTP_200_OK, json={"statuses": [1, 1], "legal_moves": [[], []]}),
+            Response(status.HTTP_422_UNPROCESSABLE_ENTITY, json={}),
+        ]
+    )
+
+    coalescer.configure(CoalescingConfig(window=10.0, max_batch=2))
+    try:
+        assert (
+            await gather(
+                BatchPostClient("http://fake-env/model/fen-status").post({"fens": ["x"]}),
+                BatchPostClient("http://fake-env/model/fen-status").post({"fens": ["y"]}),
+            )
+            == [{"statuses": [1], "legal_moves": [[]]}] * 2
+        )
+        with pytest.raises(HTTPStatusError):
+            await BatchPostClient("http://fake-env/model/fen-status").post({"fens": ["x", "y"]})
+    finally:
+        coalescer.configure(CoalescingConfig())
+
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalesced_by_priority() -> None:
+    priorities: list[Priority] = []
+
+    def answered(request: Request) -> Response:
+        priorities.append(request_priority.get())
+        return Response(status.HTTP_200_OK, json={"next_fens": json.loads(request.content)["fens"]})
+
+    route = respx.post("http://fake-env/model/next-fen").mock(side_effect=answered)
+
+    async def posted(fen: str, priority: Priority) -> dict:
+        request_priority.set(priority)
+        return await BatchPostClient("http://fake-env/model/next-fen").post({"fens": [fen]})
+
+    coalescer.configure(CoalescingConfig(window=0.01))
+    try:
+        assert await gather(
+            posted("x", Priority.BULK), posted("y", Priority.INTERACTIVE), posted("z", Priority.BULK)
+        ) == [{"next_fens": ["x"]}, {"next_fens": ["y"]}, {"next_fens": ["z"]}]
+    finally:
+        coalescer.configure(CoalescingConfig())
+
+    assert route.call_count == 2
+    assert sorted(zip(priorities, [json.loads(x.request.content)["fens"] for x in route.calls])) == [
+        (Priority.BULK, ["x", "z"]),
+        (Priority.INTERACTIVE, ["y"]),
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_chunked() -> None:
+    route = respx.post("http://fake-ai/ai/next-san").mock(
+        side_effect=[
+            Response(status.HTTP_200_OK, json={"next_sans": ["a", "b"]}),
+            Response(status.HTTP_200_OK, json={"next_sans": ["c"]}),
+        ]
+    )
+
+    chunker.configure(ChunkingConfig(max_chunk=2, concurrency=1))
+    try:
+        assert await BatchPostClient("http://fake-ai/ai/next-san").post(
+            {"fens": ["x", "y", "z"], "legal_moves": [["p"], ["q"], ["r"]]}
+        ) == {"next_sans": ["a", "b", "c"]}
+    finally:
+        chunker.configure(ChunkingConfig())
+
+    assert [json.loads(x.request.content) for x in route.calls] == [
+        {"fens": ["x", "y"], "legal_moves": [["p"], ["q"]]},
+        {"fens": ["z"], "legal_moves": [["r"]]},
+    ]
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from asyncio import Event, create_task, gather, sleep
+
+import pytest
+from src.infra.hostlimit import HostLimiter, HostQueue, Priority, PriorityConfig, request_priority
+
+
+@pytest.mark.asyncio
+async def test_limited_per_host() -> None:
+    limiter = HostLimiter()
+    limiter.configure(2)
+    inflight: dict[str, int] = {"fake-env": 0, "fake-ai": 0}
+    peaks: dict[str, int] = {"fake-env": 0, "fake-ai": 0}
+
+    async def call(host: str) -> None:
+        inflight[host] += 1
+        peaks[host] = max(peaks[host], inflight[host])
+        await sleep(0.01)
+        inflight[host] -= 1
+
+    await gather(
+        *[limiter.limited(f"http://{host}/path", lambda host=host: call(host)) for host in ["fake-env", "fake-ai"] * 5]
+    )
+
+    assert peaks == {"fake-env": 2, "fake-ai": 2}
+
+
+@pytest.mark.asyncio
+async def test_interactive_preferred() -> None:
+    queue = HostQueue(2, PriorityConfig(interactive_weight=3, bulk_weight=1, bulk_share=0.5))
+    order: list[Priority] = []
+
+    async def called(priority: Priority) -> None:
+        await queue.acquired(priority)
+        order.append(priority)
+        await sleep(0)
+        queue.released(priority)
+
+    await queue.acquired(Priority.BULK)
+    await queue.acquired(Priority.BULK)
+    waiting = [create_task(called(x)) for x in [Priority.BULK] * 4 + [Priority.INTERACTIVE] * 4]
+    await sleep(0)
+    queue.released(Priority.BULK)
+    queue.released(Priority.BULK)
+    await gather(*waiting)
+
+    assert order[:4].count(Priority.INTERACTIVE) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter() -> None:
+    limiter = HostLimiter()
+    limiter.configure(1)
+    released = Event()
+
+    running = create_task(limiter.limited("http://fake-ai/ai/next-san", released.wait))
+    await sleep(0)
+    token = request_priority.set(Priority.BULK)
+    try:
+        waiting = create_task(limiter.limited("http://fake-ai/ai/next-san", released.wait))
+    finally:
+        request_priority.reset(token)
+    await sleep(0)
+    waiting.cancel()
+    released.set()
+    await running
+
+    assert limiter.queue("http://fake-ai").inflight == {Priority.INTERACTIVE: 0, Priority.BULK: 0}
+    assert all(len(x) == 0 for x in limiter.queue("http://fake-ai").waiters.values())
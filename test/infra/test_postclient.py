@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Response
+from src.infra.postclient import ClientPool, PostClient, client_pool
+
+
+def test_client_per_host() -> None:
+    pool = ClientPool()
+    pool.open()
+
+    assert pool.client("http://fake-env/model/fen-status") is pool.client("http://fake-env/model/next-fen")
+    assert pool.client("http://fake-env/model/fen-status") is not pool.client("http://fake-ai/ai/next-san")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_with_pool() -> None:
+    respx.post("http://fake-env/model/next-fen").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"next_fens": ["a"]})] * 2
+    )
+
+    client_pool.open()
+    try:
+        assert await PostClient("http://fake-env/model/next-fen").post({"fens": [], "sans": []}) == {"next_fens": ["a"]}
+        assert await PostClient("http://fake-env/model/next-fen").post({"fens": [], "sans": []}) == {"next_fens": ["a"]}
+        assert len(client_pool.clients) == 1
+    finally:
+        await client_pool.close()
+
+    assert client_pool.clients == {}
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import pytest
+import respx
+from fastapi import status
+from httpx import ConnectError, Response
+from src.infra.postclient import PostClient
+from src.infra.replica import EjectionConfig, Replica, ReplicaSet, replicas
+
+
+def test_picked_least_outstanding() -> None:
+    replica_set = ReplicaSet("http://fake-ai", [Replica("http://fake-ai", 2), Replica("http://fake-ai-2", 1)])
+
+    assert replica_set.picked(0.0).url == "http://fake-ai-2"
+
+
+def test_picked_healthy() -> None:
+    replica_set = ReplicaSet("http://fake-ai", [Replica("http://fake-ai", 0, 0, 10.0), Replica("http://fake-ai-2", 5)])
+
+    assert replica_set.picked(0.0).url == "http://fake-ai-2"
+    assert replica_set.picked(10.0).url == "http://fake-ai"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_ejected() -> None:
+    failing = respx.post("http://fake-env-1/model/next-fen").mock(side_effect=ConnectError("refused"))
+    serving = respx.post("http://fake-env-2/model/next-fen").mock(
+        return_value=Response(status.HTTP_200_OK, json={"next_fens": ["a"]})
+    )
+
+    replicas.configure(EjectionConfig(failures=1, duration=60.0))
+    replicas.registered("http://fake-env-1", ["http://fake-env-1", "http://fake-env-2"])
+    try:
+        for _ in range(8):
+            try:
+                await PostClient("http://fake-env-1/model/next-fen").post({"fens": ["x"], "sans": ["p"]})
+            except ConnectError:
+                pass
+    finally:
+        replicas.configure(EjectionConfig())
+
+    assert failing.call_count == 1
+    assert serving.call_count == 7
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+from asyncio import sleep
+
+import pytest
+import respx
+from fastapi import status
+from httpx import ConnectError, HTTPStatusError, ReadTimeout, Request, Response
+from src.infra.postclient import PostClient
+from src.infra.resilience import LatencyWindow, ResilienceConfig, request_deadline, resilience
+
+
+def test_latency_quantile() -> None:
+    window = LatencyWindow()
+    for latency in range(1, 101):
+        window.recorded(latency / 100)
+
+    assert window.quantile(0.95, 20) == 0.96
+    assert LatencyWindow().quantile(0.95, 20) is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retried() -> None:
+    route = respx.post("http://fake-ai/ai/next-san").mock(
+        side_effect=[
+            ConnectError("refused"),
+            Response(status.HTTP_503_SERVICE_UNAVAILABLE, json={}),
+            Response(status.HTTP_200_OK, json={"next_sans": ["a"]}),
+        ]
+    )
+
+    resilience.configure(ResilienceConfig(retries=2, backoff=0.0))
+    try:
+        assert await PostClient("http://fake-ai/ai/next-san").post({"fens": ["x"]}) == {"next_sans": ["a"]}
+    finally:
+        resilience.configure(ResilienceConfig())
+
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_not_retried() -> None:
+    route = respx.post("http://fake-ai/ai/next-san").mock(
+        side_effect=[Response(status.HTTP_422_UNPROCESSABLE_ENTITY, json={})]
+    )
+
+    resilience.configure(ResilienceConfig(retries=2, backoff=0.0))
+    try:
+        with pytest.raises(HTTPStatusError):
+            await PostClient("http://fake-ai/ai/next-san").post({"fens": ["x"]})
+    finally:
+        resilience.configure(ResilienceConfig())
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged() -> None:
+    calls: list[float] = [1.0, 0.0]
+
+    async def send() -> Response:
+        await sleep(calls.pop(0))
+        return Response(status.HTTP_200_OK, request=Request("POST", "http://fake-ai/ai/next-san"))
+
+    resilience.configure(ResilienceConfig(hedge_quantile=0.95, hedge_min_samples=1))
+    resilience.latencies["http://fake-ai/ai/next-san"] = LatencyWindow()
+    resilience.latencies["http://fake-ai/ai/next-san"].recorded(0.01)
+    try:
+        assert (await resilience.posted("http://fake-ai/ai/next-san", send)).status_code == status.HTTP_200_OK
+    finally:
+        resilience.configure(ResilienceConfig())
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_exceeded() -> None:
+    resilience.configure(ResilienceConfig(request_deadline=0.01))
+    token = resilience.started()
+    try:
+        await sleep(0.02)
+        with pytest.raises(ReadTimeout):
+            resilience.timeout("http://fake-ai/ai/next-san", 1.0)
+    finally:
+        request_deadline.reset(token)
+        resilience.configure(ResilienceConfig())
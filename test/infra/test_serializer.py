@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Response
+from pydantic import BaseModel
+from src.infra.postclient import PostClient
+from src.infra.serializer import JSONSerializer, is_primitive_model, serializer, to_jsonable
+
+
+class PrimitiveModel(BaseModel):
+    fens: list[str]
+    results: list[list[float]]
+
+
+class NestedModel(BaseModel):
+    primitive: PrimitiveModel
+
+
+@pytest.mark.parametrize("target", [JSONSerializer.stdlib(), JSONSerializer.fast()])
+def test_round_trip(target: JSONSerializer) -> None:
+    data = {"fens": ["4knbr/4p3/8/7P/4RBNK/8/8/8 w Kk - 0 1"], "results": [[0, 0.5, 1]], "ok": True}
+
+    assert target.loads(target.dumps(data)) == json.loads(json.dumps(data)) == data
+
+
+def test_to_jsonable() -> None:
+    primitive = PrimitiveModel(fens=["a"], results=[[1.0]])
+
+    assert (is_primitive_model(PrimitiveModel), is_primitive_model(NestedModel)) == (True, False)
+    assert to_jsonable(primitive) == to_jsonable(NestedModel(primitive=primitive))["primitive"] == primitive.dict()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target", [JSONSerializer.stdlib(), JSONSerializer.fast()])
+@respx.mock
+async def test_post_with_serializer(target: JSONSerializer) -> None:
+    route = respx.post("http://fake-env/model/next-fen").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"next_fens": ["a"]})]
+    )
+
+    previous = serializer.serializer
+    serializer.use(target)
+    try:
+        assert await PostClient("http://fake-env/model/next-fen").post({"fens": ["x"], "sans": ["y"]}) == {
+            "next_fens": ["a"]
+        }
+    finally:
+        serializer.use(previous)
+
+    assert json.loads(route.calls[0].request.content) == {"fens": ["x"], "sans": ["y"]}
+    assert route.calls[0].request.headers["content-type"] == "application/json"
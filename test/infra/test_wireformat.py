@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+from typing import Any
+
+import pytest
+import respx
+from fastapi import status
+from httpx import Request, Response
+from src.infra.postclient import PostClient
+from src.infra.wireformat import WireFormat, wire_negotiation
+
+
+def fen_status(fens: list[str]) -> dict[str, Any]:
+    return {"statuses": [1] * len(fens), "legal_moves": [["e4e5", "h5h6"]] * len(fens)}
+
+
+def both_formats(request: Request) -> Response:
+    msgpack = WireFormat.msgpack()
+
+    if request.headers["content-type"] == "application/msgpack":
+        fens = msgpack.loads(request.content)["fens"]
+    else:
+        fens = json.loads(request.content)["fens"]
+
+    if msgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+        return Response(
+            status.HTTP_200_OK,
+            content=msgpack.dumps(fen_status(fens)),
+            headers={"content-type": "application/msgpack"},
+        )
+
+    return Response(status.HTTP_200_OK, json=fen_status(fens))
+
+
+def json_only(request: Request) -> Response:
+    return Response(status.HTTP_200_OK, json=fen_status(json.loads(request.content)["fens"]))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_negotiated() -> None:
+    pytest.importorskip("msgpack")
+    route = respx.post("http://fake-env/model/fen-status").mock(side_effect=both_formats)
+
+    wire_negotiation.configure("msgpack")
+    try:
+        for _ in range(2):
+            assert await PostClient("http://fake-env/model/fen-status").post({"fens": ["x", "y"]}) == fen_status(
+                ["x", "y"]
+            )
+    finally:
+        wire_negotiation.configure("json")
+
+    assert [call.request.headers["content-type"] for call in route.calls] == [
+        "application/json",
+        "application/msgpack",
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_negotiated_with_json_only() -> None:
+    route = respx.post("http://fake-env/model/fen-status").mock(side_effect=json_only)
+
+    wire_negotiation.configure("msgpack")
+    try:
+        for _ in range(2):
+            assert await PostClient("http://fake-env/model/fen-status").post({"fens": ["x"]}) == fen_status(["x"])
+    finally:
+        wire_negotiation.configure("json")
+
+    assert [call.request.headers["content-type"] for call in route.calls] == ["application/json"] * 2
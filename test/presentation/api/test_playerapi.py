@@ -7,6 +7,7 @@ import respx
 from fastapi import status
 from httpx import AsyncClient, Response
 from src.entity.movement import FEN, SAN
+from src.infra.replica import replicas
 from submodules.fastapi_haljson.src.halmodel import HALBase
 
 
@@ -94,6 +95,32 @@ async def test_trajectory(async_client: AsyncClient) -> None:
     }
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_trajectory_replicas_ignored(async_client: AsyncClient) -> None:
+    respx.post("http://fake-env/model/fen-status").mock(
+        return_value=Response(status.HTTP_200_OK, json={"statuses": [1], "legal_moves": [["e4e5"]]})
+    )
+    respx.post("http://fake-env/model/next-fen").mock(
+        return_value=Response(status.HTTP_200_OK, json={"next_fens": [FEN.first()]})
+    )
+    ai = respx.post("http://fake-ai/ai/next-san").mock(
+        return_value=Response(status.HTTP_200_OK, json={"next_sans": [SAN.first()]})
+    )
+    evil = respx.post("http://evil:1/ai/ai/next-san").mock(return_value=Response(status.HTTP_200_OK))
+
+    for white in [{"url": "http://fake-ai", "replicas": ["http://evil:1/ai"]}, {"url": "http://fake-ai"}]:
+        response = await async_client.post(
+            url="/player/trajectory",
+            json={"fens": [FEN.starting()], "white": white, "black": {"url": "http://fake-ai"}, "step": 1},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    assert ai.called and not evil.called
+    assert replicas.resolved("http://fake-ai/ai/next-san") is None
+
+
 @pytest.mark.asyncio
 async def test_trajectory_not_found(async_client: AsyncClient) -> None:
     response = await async_client.post(
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import gc
+from asyncio import sleep
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from src.application.admission import AdmissionConfig, admissions
+from src.infra.hostlimit import Priority, request_priority
+from src.presentation.api.requestscope import admitted_stream
+
+
+async def chunks():
+    yield request_priority.get()
+
+
+async def responded() -> StreamingResponse:
+    return StreamingResponse(chunks())
+
+
+@pytest.fixture
+def bounded() -> None:
+    admissions.configure(AdmissionConfig(concurrency=1, queue=0))
+    yield
+    admissions.configure(AdmissionConfig())
+
+
+@pytest.mark.asyncio
+async def test_admitted_stream(bounded: None) -> None:
+    response = await admitted_stream("trajectory_stream", responded, None)
+
+    with pytest.raises(HTTPException) as ex:
+        await admitted_stream("trajectory_stream", responded, None)
+    assert ex.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    assert [x async for x in response.body_iterator] == [Priority.INTERACTIVE]
+    assert request_priority.get() == Priority.BULK
+    assert admissions.admission("trajectory_stream").admitted_count == 0
+
+
+@pytest.mark.asyncio
+async def test_admitted_stream_released_without_body(bounded: None) -> None:
+    response = await admitted_stream("game_stream", responded, None)
+    await response.background()
+    assert admissions.admission("game_stream").admitted_count == 0
+
+    response = await admitted_stream("game_stream", responded, None)
+    del response
+    gc.collect()
+    for _ in range(3):
+        await sleep(0)
+    assert admissions.admission("game_stream").admitted_count == 0
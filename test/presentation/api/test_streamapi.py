@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: © 2021 Kyurenpoto <heal9179@gmail.com>
+
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+import respx
+from fastapi import status
+from httpx import AsyncClient, Response
+from src.entity.movement import FEN
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_trajectory_stream(async_client: AsyncClient) -> None:
+    respx.post("http://fake-env/model/fen-status").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"statuses": [2], "legal_moves": [[]]})]
+    )
+
+    response = await async_client.post(
+        url="/stream/trajectory",
+        json={
+            "fens": [FEN.starting()],
+            "white": {"url": "http://fake-ai"},
+            "black": {"url": "http://fake-ai"},
+            "step": 3,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"fens": [[FEN.starting()]], "sans": [[]], "results": [[1]]}
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_game_stream(async_client: AsyncClient) -> None:
+    respx.post("http://fake-env/model/fen-status").mock(
+        side_effect=[Response(status.HTTP_200_OK, json={"statuses": [2], "legal_moves": [[]]})]
+    )
+
+    response = await async_client.post(
+        url="/stream/game?playtime=2",
+        json={"white": {"url": "http://fake-ai"}, "black": {"url": "http://fake-ai"}},
+        headers={"accept": "text/event-stream"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [json.loads(event.removeprefix("data: ")) for event in response.text.split("\n\n")[:-1]] == [
+        {"game": i, "fens": [FEN.starting()], "sans": [], "result": "1-0"} for i in range(2)
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_game_stream_unprocessable_entity(async_client: AsyncClient) -> None:
+    respx.post("http://fake-env/model/fen-status").mock(
+        side_effect=[Response(status.HTTP_422_UNPROCESSABLE_ENTITY, json={})]
+    )
+
+    response = await async_client.post(
+        url="/stream/game",
+        json={"white": {"url": "http://fake-ai"}, "black": {"url": "http://fake-ai"}},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["error"] == "request.HTTPStatusError"